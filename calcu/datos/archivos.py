@@ -0,0 +1,139 @@
+"""
+Lectura de secuencias externas para las pruebas
+Formatos: .npy, .npz, binario crudo float64 / uint32 y CSV.
+Los binarios se abren con np.memmap y el CSV se lee por bloques,
+asi archivos de varios GB se prueban sin cargarlos completos en memoria.
+"""
+from typing import Iterator, Optional, Union
+import os
+import numpy as np
+
+TAM_BLOQUE = 1_000_000
+
+# extension -> formato; cualquier otra extension se trata como float64 crudo
+EXTENSIONES = {
+    ".npy": "npy",
+    ".npz": "npz",
+    ".csv": "csv",
+    ".txt": "csv",
+    ".u32": "uint32",
+    ".f64": "float64",
+    ".bin": "float64",
+    ".raw": "float64",
+}
+
+def detectar_formato(ruta: str) -> str:
+    ext = os.path.splitext(ruta)[1].lower()
+    return EXTENSIONES.get(ext, "float64")
+
+class SecuenciaEntera:
+    """Enteros sin signo mapeados a U(0,1) como x / 2**bits, bloque a bloque."""
+    def __init__(self, datos: np.ndarray):
+        if datos.dtype.kind != "u":
+            raise ValueError("Se esperaba un arreglo de enteros sin signo.")
+        self.datos = datos
+        self.escala = 1.0 / float(2 ** (8 * datos.dtype.itemsize))
+
+    def __len__(self) -> int:
+        return int(self.datos.shape[0])
+
+    def bloques(self, tam_bloque: int=TAM_BLOQUE) -> Iterator[np.ndarray]:
+        for ini in range(0, len(self), tam_bloque):
+            yield self.datos[ini:ini+tam_bloque] * self.escala
+
+    def __getitem__(self, idx):
+        return self.datos[idx] * self.escala
+
+    def primeros(self, k: int) -> np.ndarray:
+        return self.datos[:k] * self.escala
+
+class SecuenciaCSV:
+    """Columna numerica de un CSV; nunca se carga completa, se recorre por bloques."""
+    def __init__(self, ruta: str, columna: int=-1, delimitador: str=","):
+        self.ruta = ruta
+        self.columna = columna
+        self.delimitador = delimitador
+        self._n: Optional[int] = None
+
+    def _lineas(self, fh) -> Iterator[str]:
+        primera = True
+        for linea in fh:
+            linea = linea.strip()
+            if not linea:
+                continue
+            if primera:
+                primera = False
+                try:
+                    float(linea.split(self.delimitador)[self.columna])
+                except ValueError:
+                    # encabezado
+                    continue
+            yield linea
+
+    def _convertir(self, lineas: list) -> np.ndarray:
+        return np.loadtxt(lineas, delimiter=self.delimitador, usecols=self.columna, dtype=float, ndmin=1)
+
+    def __len__(self) -> int:
+        if self._n is None:
+            with open(self.ruta, "r", encoding="utf-8") as fh:
+                self._n = sum(1 for _ in self._lineas(fh))
+        return self._n
+
+    def bloques(self, tam_bloque: int=TAM_BLOQUE) -> Iterator[np.ndarray]:
+        with open(self.ruta, "r", encoding="utf-8") as fh:
+            lote = []
+            for linea in self._lineas(fh):
+                lote.append(linea)
+                if len(lote) >= tam_bloque:
+                    yield self._convertir(lote)
+                    lote = []
+            if lote:
+                yield self._convertir(lote)
+
+    def primeros(self, k: int) -> np.ndarray:
+        for b in self.bloques(k):
+            return b
+        return np.array([], dtype=float)
+
+Secuencia = Union[list, np.ndarray, SecuenciaEntera, SecuenciaCSV]
+
+def abrir_secuencia(ruta: str, formato: str=None, columna: int=-1) -> Secuencia:
+    """Abre un archivo de numeros u_i sin leerlo completo.
+    formato: 'npy', 'npz', 'float64', 'uint32' o 'csv' (por defecto segun la extension).
+    Del .npz (comprimido, no admite memmap) se carga en memoria el ultimo arreglo."""
+    if formato is None:
+        formato = detectar_formato(ruta)
+    if formato == "npy":
+        datos = np.load(ruta, mmap_mode="r")
+        if datos.ndim != 1:
+            datos = datos.reshape(-1)
+        if datos.dtype.kind == "u":
+            return SecuenciaEntera(datos)
+        return datos
+    if formato == "npz":
+        with np.load(ruta) as npz:
+            datos = npz[npz.files[-1]].reshape(-1)
+        if datos.dtype.kind == "u":
+            return SecuenciaEntera(datos)
+        return datos
+    if formato == "float64":
+        return np.memmap(ruta, dtype=np.float64, mode="r")
+    if formato == "uint32":
+        return SecuenciaEntera(np.memmap(ruta, dtype=np.uint32, mode="r"))
+    if formato == "csv":
+        return SecuenciaCSV(ruta, columna=columna)
+    raise ValueError(f"Formato no soportado: {formato}")
+
+def bloques(u: Secuencia, tam_bloque: int=TAM_BLOQUE) -> Iterator[np.ndarray]:
+    """Recorre cualquier secuencia (lista, arreglo, memmap o archivo) en bloques float."""
+    if hasattr(u, "bloques"):
+        yield from u.bloques(tam_bloque)
+        return
+    arr = np.asarray(u)
+    for ini in range(0, arr.shape[0], tam_bloque):
+        yield np.asarray(arr[ini:ini+tam_bloque], dtype=float)
+
+def primeros(u: Secuencia, k: int) -> np.ndarray:
+    if hasattr(u, "primeros"):
+        return u.primeros(k)
+    return np.asarray(u[:k], dtype=float)
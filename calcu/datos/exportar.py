@@ -0,0 +1,137 @@
+"""
+Exportación de secuencias y muestras por bloques
+Formatos: CSV, .npy, binario crudo float64 y .npz comprimido.
+Se escribe directo desde los arreglos NumPy (o memmaps / CSV abiertos con
+datos.archivos) bloque a bloque, con memoria constante. Los .npy y .f64
+resultantes se pueden volver a abrir con abrir_secuencia como memmap.
+Las columnas enteras ('%d') en memoria se cortan sin pasar por float64, así
+los valores mayores que 2**53 se escriben exactos.
+"""
+from typing import Callable, Optional, Sequence, Tuple
+import os
+import zipfile
+import numpy as np
+
+from datos.archivos import Secuencia, bloques
+
+# filas por bloque al escribir CSV (el texto del bloque se arma en memoria)
+TAM_BLOQUE_CSV = 200_000
+TAM_BLOQUE = 1_000_000
+
+# extension -> formato de exportación; cualquier otra se escribe como CSV
+FORMATOS = {
+    ".csv": "csv",
+    ".txt": "csv",
+    ".npy": "npy",
+    ".npz": "npz",
+    ".f64": "float64",
+    ".bin": "float64",
+    ".raw": "float64",
+}
+
+TIPOS_ARCHIVO = [("CSV","*.csv"), ("NumPy","*.npy"), ("NumPy comprimido","*.npz"),
+                 ("Binario float64","*.f64 *.bin *.raw")]
+
+def formato_exportacion(ruta: str) -> str:
+    ext = os.path.splitext(ruta)[1].lower()
+    return FORMATOS.get(ext, "csv")
+
+def _bloques_columna(columna: Secuencia, entero: bool, tam_bloque: int):
+    if entero and not hasattr(columna, "bloques"):
+        arr = np.asarray(columna)
+        for ini in range(0, arr.shape[0], tam_bloque):
+            yield np.asarray(arr[ini:ini + tam_bloque]).astype(np.int64, copy=False)
+    else:
+        yield from bloques(columna, tam_bloque)
+
+def _tomar_bloques(columnas: Sequence[Secuencia], tam_bloque: int, enteros: Sequence[bool]):
+    iteradores = [_bloques_columna(c, e, tam_bloque) for c, e in zip(columnas, enteros)]
+    for partes in zip(*iteradores):
+        yield partes
+
+def _escribir_csv(fh, columnas, nombres, formatos, indice, n, tam_bloque, progreso):
+    encabezado = ([indice] if indice else []) + list(nombres)
+    fh.write(",".join(encabezado) + "\n")
+    fila = ",".join((["%d"] if indice else []) + list(formatos)) + "\n"
+    ancho = len(encabezado)
+    hechos = 0
+    for partes in _tomar_bloques(columnas, tam_bloque, [f == "%d" for f in formatos]):
+        m = partes[0].shape[0]
+        # un solo `%` sobre la plantilla repetida: el formateo queda en C
+        plano = [None] * (m * ancho)
+        j = 0
+        if indice:
+            plano[0::ancho] = range(hechos + 1, hechos + m + 1)
+            j = 1
+        for k, parte in enumerate(partes):
+            if formatos[k] == "%d":
+                parte = parte.astype(np.int64)
+            plano[j+k::ancho] = parte.tolist()
+        fh.write((fila * m) % tuple(plano))
+        hechos += m
+        if progreso is not None:
+            progreso(hechos, n)
+
+def _escribir_binario(fh, columna, dtype, n, tam_bloque, progreso):
+    hechos = 0
+    for (parte,) in _tomar_bloques([columna], tam_bloque, [np.dtype(dtype).kind == "i"]):
+        fh.write(np.ascontiguousarray(parte, dtype=dtype).data)
+        hechos += parte.shape[0]
+        if progreso is not None:
+            progreso(hechos, n)
+
+def _encabezado_npy(fh, dtype, n):
+    np.lib.format.write_array_header_1_0(fh, {"descr": np.lib.format.dtype_to_descr(np.dtype(dtype)),
+                                              "fortran_order": False, "shape": (n,)})
+
+def exportar(ruta: str, columnas: Sequence[Tuple[str, Secuencia]], formato: Optional[str]=None,
+             formatos: Optional[Sequence[str]]=None, indice: Optional[str]="i",
+             tam_bloque: Optional[int]=None, progreso: Optional[Callable]=None) -> str:
+    """Escribe `columnas` [(nombre, secuencia)] en `ruta`; devuelve el formato usado.
+    - csv: todas las columnas más un índice 1..n (`formatos` printf por columna, '%d' para enteros).
+      Las columnas None se omiten (p. ej. x_i de una secuencia cargada de archivo).
+    - npy / float64: solo la última columna (la secuencia u_i o los valores), memmapeable.
+    - npz: cada columna como arreglo `nombre` dentro de un zip comprimido.
+    `progreso(hechos, total)` se llama por bloque; si lanza, el archivo parcial se borra."""
+    if formato is None:
+        formato = formato_exportacion(ruta)
+    if formatos is None:
+        formatos = ["%.10g"] * len(columnas)
+    elegidas = [(nombre, c, fmt) for (nombre, c), fmt in zip(columnas, formatos) if c is not None]
+    if not elegidas:
+        raise ValueError("No hay columnas para exportar.")
+    nombres = [nombre for nombre, _, _ in elegidas]
+    datos = [c for _, c, _ in elegidas]
+    formatos = [fmt for _, _, fmt in elegidas]
+    n = len(datos[-1])
+    if any(len(c) != n for c in datos):
+        raise ValueError("Las columnas tienen distinta longitud.")
+    try:
+        if formato == "csv":
+            with open(ruta, "w", newline="", encoding="utf-8") as fh:
+                _escribir_csv(fh, datos, nombres, formatos, indice, n, tam_bloque or TAM_BLOQUE_CSV, progreso)
+        elif formato == "npy":
+            with open(ruta, "wb") as fh:
+                _encabezado_npy(fh, np.float64, n)
+                _escribir_binario(fh, datos[-1], np.float64, n, tam_bloque or TAM_BLOQUE, progreso)
+        elif formato == "float64":
+            with open(ruta, "wb") as fh:
+                _escribir_binario(fh, datos[-1], np.float64, n, tam_bloque or TAM_BLOQUE, progreso)
+        elif formato == "npz":
+            total = n * len(datos)
+            # nivel 1: los u_i casi no comprimen y el nivel por defecto es varias veces más lento
+            with zipfile.ZipFile(ruta, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+                for k, (nombre, c) in enumerate(zip(nombres, datos)):
+                    dtype = np.int64 if formatos[k] == "%d" else np.float64
+                    with zf.open(nombre + ".npy", "w", force_zip64=True) as fh:
+                        _encabezado_npy(fh, dtype, n)
+                        _escribir_binario(fh, c, dtype, n, tam_bloque or TAM_BLOQUE,
+                                          None if progreso is None else
+                                          (lambda hechos, _, k=k: progreso(k * n + hechos, total)))
+        else:
+            raise ValueError(f"Formato no soportado: {formato}")
+    except BaseException:
+        if os.path.exists(ruta):
+            os.remove(ruta)
+        raise
+    return formato
@@ -5,38 +5,35 @@ Autor: Reescrito para Alan
 Fecha: 2025
 """
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, filedialog, messagebox
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+from simulacion.discretas import DISTRIBUCIONES, muestras_discretas, titulo_discreta
+from simulacion.alias import leer_tabla, tabla_a_texto
+from simulacion.histograma import AcumuladorDiscreto, acumular_por_bloques
+from pruebas.prueba_ajuste import probabilidad_intervalos, prueba_chi2_discreta
+from simulacion.reduccion_varianza import MODOS, muestrear_con_reduccion, nota_tamano
+from simulacion.bootstrap import bootstrap_conteos
+from interfaz.tareas import EjecutorTareas, BarraTareas
+from interfaz.histograma_vivo import HistogramaVivo, agrupar_tabla
+
+# por encima de este tamaño se genera y cuenta por bloques (memoria constante)
+MUESTRAS_EN_MEMORIA = 1_000_000
+
 # ---------------------------
 # Funciones de generación
 # ---------------------------
-def generar_distribucion(nombre, params, sample_size=1000):
-    """Genera datos y título según la distribución seleccionada."""
-    if nombre == "Uniforme":
-        a = int(params["a"].get())
-        b = int(params["b"].get())
-        data = np.random.randint(a, b + 1, sample_size)
-        titulo = f"UNIFORME DISCRETA (a={a}, b={b})"
-    elif nombre == "Bernoulli":
-        p = float(params["p"].get())
-        data = np.random.binomial(1, p, sample_size)
-        titulo = f"BERNOULLI (p={p})"
-    elif nombre == "Binomial":
-        n_trials = int(params["n"].get())
-        p = float(params["p"].get())
-        data = np.random.binomial(n_trials, p, sample_size)
-        titulo = f"BINOMIAL (n={n_trials}, p={p})"
-    elif nombre == "Poisson":
-        lam = float(params["lam"].get())
-        data = np.random.poisson(lam, sample_size)
-        titulo = f"POISSON (λ={lam})"
-    else:
-        data = np.array([])
-        titulo = ""
-    return data, titulo
+def generar_distribucion(nombre, params, sample_size=1000, semilla=None):
+    """Genera datos y título según la distribución seleccionada.
+    `params` son las variables Tk de la interfaz; el muestreo vive en
+    simulacion.discretas para poder reutilizarse fuera de la ventana."""
+    valores = {clave: var.get() for clave, var in params.items()}
+    if nombre not in DISTRIBUCIONES:
+        return np.array([]), ""
+    data = muestras_discretas(nombre, valores, sample_size, semilla=semilla)
+    return data, titulo_discreta(nombre, valores)
 
 # ---------------------------
 # UI dinámico de parámetros
@@ -82,34 +79,116 @@ def actualizar_parametros(event=None):
         params_vars["lam"] = tk.StringVar(value="3")
         crear_spin_param("λ", params_vars["lam"], 0, 0.0, 1000.0)
 
+    elif distrib == "Empírica":
+        # pares valor:probabilidad (o frecuencia), escritos o cargados de un CSV
+        params_vars["tabla"] = tk.StringVar(value="1:0.2; 2:0.5; 3:0.3")
+        crear_spin_param("valor:peso", params_vars["tabla"], 0, None, None)
+        ttk.Button(params_container, text="Cargar tabla...", command=cargar_tabla_empirica).grid(
+            row=1, column=0, columnspan=2, pady=(0,6))
+
+def cargar_tabla_empirica():
+    ruta = filedialog.askopenfilename(filetypes=[("CSV","*.csv *.txt"), ("Todos","*.*")])
+    if not ruta:
+        return
+    try:
+        params_vars["tabla"].set(tabla_a_texto(*leer_tabla(ruta)))
+    except Exception as e:
+        messagebox.showerror("Error al cargar", str(e))
+
 # ---------------------------
 # Graficar y mostrar estadísticas
 # ---------------------------
 def graficar():
+    # Las variables Tk se leen aquí; el cálculo corre en el ejecutor
     distrib = distrib_combo.get()
-    n_samples = sample_size_var.get()
-    data, titulo = generar_distribucion(distrib, params_vars, sample_size=n_samples)
-
-    if data.size == 0:
+    if distrib not in DISTRIBUCIONES:
+        return
+    if tareas.ocupado():
+        messagebox.showwarning("Atención", "Hay un trabajo en curso.")
+        return
+    try:
+        n_samples = sample_size_var.get()
+        valores_params = {clave: variable.get() for clave, variable in params_vars.items()}
+    except tk.TclError as e:
+        messagebox.showerror("Error", str(e))
+        return
+    tareas.ejecutar(calcular, distrib, valores_params, n_samples, modo_var.get(), descripcion="Generando",
+                    al_terminar=mostrar_resultado, al_error=lambda e: messagebox.showerror("Error", str(e)))
+
+def calcular(tarea, distrib, valores_params, n_samples, modo):
+    """Muestreo, tabla de frecuencias, χ² e IC bootstrap (fuera del hilo de Tk)."""
+    informe = None
+    if modo != "Simple":
+        if n_samples > MUESTRAS_EN_MEMORIA:
+            raise ValueError(f"Los modos de reducción de varianza trabajan en memoria "
+                             f"(máximo {MUESTRAS_EN_MEMORIA} valores).")
+        data, informe = muestrear_con_reduccion(distrib, valores_params, n_samples, modo, discreta=True)
+        n_samples = data.size
+        valores, conteo = np.unique(data, return_counts=True)
+        mean = np.mean(data)
+        var = np.var(data, ddof=0)
+    elif n_samples > MUESTRAS_EN_MEMORIA:
+        acum = acumular_por_bloques(muestras_discretas, (distrib, valores_params), n_samples,
+                                    AcumuladorDiscreto(), progreso=tarea.reportar, trabajadores=None)
+        valores, conteo = acum.tabla()
+        mean, var = acum.media, acum.varianza
+    else:
+        data = muestras_discretas(distrib, valores_params, n_samples)
+        valores, conteo = np.unique(data, return_counts=True)
+        mean = np.mean(data)
+        var = np.var(data, ddof=0)
+    tarea.reportar(0.9)
+    chi2 = prueba_chi2_discreta(valores, conteo, distrib, valores_params)
+    # IC bootstrap desde la tabla de frecuencias (sirve también en modo por bloques)
+    ic = bootstrap_conteos(valores, conteo)
+    return {"distrib": distrib, "params": valores_params, "n": n_samples, "valores": valores,
+            "conteo": conteo, "media": mean, "varianza": var, "titulo": titulo_discreta(distrib, valores_params),
+            "chi2": chi2, "ic": ic, "informe": informe}
+
+def mostrar_resultado(res):
+    n_samples, chi2, ic, informe = res["n"], res["chi2"], res["ic"], res["informe"]
+    if n_samples == 0:
         return
 
-    # limpiar figura
-    fig.clf()
-    ax = fig.add_subplot(111)
-
-    valores, conteo = np.unique(data, return_counts=True)
-    ax.bar(valores, conteo, width=0.6, edgecolor="black")
-    ax.set_title(titulo, fontsize=14, fontweight="bold")
-    ax.set_xlabel("Valores")
-    ax.set_ylabel("Frecuencia")
-    ax.grid(True, linestyle="--", alpha=0.5)
-
-    canvas.draw()
+    # una barra por entero entre el mínimo y el máximo observados (o por intervalo de
+    # enteros si el rango es muy grande); se arma desde la tabla, sin recorrer el rango
+    valores = res["valores"]
+    titulo = res["titulo"]
+    if valores.dtype.kind in "iu":
+        conteo, bordes = agrupar_tabla(valores, res["conteo"])
+        centros = (bordes[:-1] + bordes[1:]) / 2
+        ancho = int(bordes[1] - bordes[0])
+        if ancho > 1:
+            titulo += f" — barras de {ancho} valores"
+    else:
+        # valores no enteros (tabla empírica): una barra por valor, bordes en los puntos medios
+        conteo = res["conteo"]
+        extremos = np.diff(valores)[[0, -1]] / 2 if valores.size > 1 else np.array([0.5, 0.5])
+        bordes = np.concatenate([[valores[0] - extremos[0]], (valores[1:] + valores[:-1]) / 2,
+                                 [valores[-1] + extremos[1]]])
+        centros = valores
+    # frecuencias esperadas por barra según la distribución exacta
+    esperadas = probabilidad_intervalos(res["distrib"], res["params"], bordes) * n_samples
+    visibles = esperadas >= 0.5
+    hist.mostrar(conteo, bordes, titulo, curva=(centros[visibles], esperadas[visibles]),
+                 estilo_curva="o", ancho=0.6)
 
     # estadísticas
-    mean = np.mean(data)
-    var = np.var(data, ddof=0)
-    stats_text.set(f"Muestras: {n_samples}\nMedia: {mean:.4f}\nVarianza: {var:.4f}")
+    stats_text.set(f"Muestras: {n_samples}\nMedia: {res['media']:.4f}\nVarianza: {res['varianza']:.4f}\n"
+                   f"χ²: {chi2['x2']:.2f} (gl={chi2['gl']}, p={chi2['p_value']:.3f}) — "
+                   f"{'ajusta' if chi2['pasa'] else 'no ajusta'}\n"
+                   f"IC {ic['nivel']:.0%} media: [{ic['media']['ic_inf']:.4f}, {ic['media']['ic_sup']:.4f}]\n"
+                   f"IC {ic['nivel']:.0%} varianza: [{ic['varianza']['ic_inf']:.4f}, {ic['varianza']['ic_sup']:.4f}]")
+    if informe is not None:
+        stats_text.set(stats_text.get() + f"\nE[X] ≈ {informe['estimacion']:.4f} ± {informe['error_estandar']:.2g}"
+                       f" — reducción de varianza ×{informe['reduccion']:.3g}")
+        nota = nota_tamano(informe)
+        if nota:
+            stats_text.set(stats_text.get() + f"\n{nota}")
+
+def salir():
+    tareas.cerrar()
+    root.destroy()
 
 # ---------------------------
 # Construcción de la ventana
@@ -118,6 +197,8 @@ root = tk.Tk()
 root.title("Simulador — interfaz alternativa")
 root.geometry("1000x650")
 root.configure(bg="#f3f6f8")
+tareas = EjecutorTareas(root)
+root.protocol("WM_DELETE_WINDOW", salir)
 
 # Estilo ttk
 style = ttk.Style(root)
@@ -137,7 +218,7 @@ right_frame.pack(side="right", fill="both", expand=True, padx=(6,12), pady=12)
 ttk.Label(left_frame, text="Controles", font=("Segoe UI", 14, "bold")).grid(row=0, column=0, columnspan=2, pady=(0,8))
 
 ttk.Label(left_frame, text="Distribución:").grid(row=1, column=0, sticky="w")
-distrib_combo = ttk.Combobox(left_frame, values=["Uniforme", "Bernoulli", "Binomial", "Poisson"],
+distrib_combo = ttk.Combobox(left_frame, values=DISTRIBUCIONES,
                              state="readonly", width=17)
 distrib_combo.set("Uniforme")
 distrib_combo.grid(row=1, column=1, sticky="e", pady=6)
@@ -154,9 +235,15 @@ actualizar_parametros()
 # Sample size control
 ttk.Label(left_frame, text="Tamaño de muestra:").grid(row=10, column=0, sticky="w", pady=(10,0))
 sample_size_var = tk.IntVar(value=1000)
-sample_spin = ttk.Spinbox(left_frame, from_=100, to=20000, increment=100, textvariable=sample_size_var, width=12)
+sample_spin = ttk.Spinbox(left_frame, from_=100, to=1_000_000_000, increment=100, textvariable=sample_size_var, width=12)
 sample_spin.grid(row=10, column=1, sticky="e", pady=(10,0))
 
+# Modo de muestreo (reducción de varianza)
+ttk.Label(left_frame, text="Muestreo:").grid(row=9, column=0, sticky="w", pady=(10,0))
+modo_var = tk.StringVar(value=MODOS[0])
+ttk.Combobox(left_frame, textvariable=modo_var, values=MODOS, state="readonly", width=17).grid(
+    row=9, column=1, sticky="e", pady=(10,0))
+
 # Botón generar
 generate_btn = ttk.Button(left_frame, text="Generar y Graficar", command=graficar)
 generate_btn.grid(row=11, column=0, columnspan=2, pady=(14,6), ipadx=6, ipady=6)
@@ -183,14 +270,11 @@ stats_frame = ttk.Frame(right_frame, padding=(8,8,8,8), relief="ridge")
 stats_frame.pack(fill="x", pady=(6,0))
 stats_text = tk.StringVar(value="Muestras: -\nMedia: -\nVarianza: -")
 ttk.Label(stats_frame, textvariable=stats_text, font=("Segoe UI", 11)).pack(side="left")
+BarraTareas(right_frame, tareas).pack(fill="x", pady=(6,0))
 
-# Inicial plot vacío
-fig.clf()
-ax = fig.add_subplot(111)
-ax.text(0.5, 0.5, "Haz clic en 'Generar y Graficar' para ver la distribución",
-        ha="center", va="center", fontsize=12, color="#666666")
-ax.axis("off")
-canvas.draw()
+# Inicial plot vacío; luego las barras se actualizan en sitio
+hist = HistogramaVivo(fig.add_subplot(111), canvas)
+hist.mensaje("Haz clic en 'Generar y Graficar' para ver la distribución")
 
 # Atajos de teclado (Enter para generar)
 root.bind("<Return>", lambda e: graficar())
@@ -6,36 +6,52 @@ Fecha: 2025
 """
 import tkinter as tk
 from tkinter import ttk, messagebox
-import random
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import math
-import csv
-from io import StringIO
+
+from simulacion.histograma import AcumuladorContinuo, acumular_por_bloques, semilla_en_memoria
+from pruebas.prueba_ajuste import AcumuladorKS, distribucion_continua, prueba_ks_continua
+from simulacion.reduccion_varianza import MODOS, muestrear_con_reduccion, nota_tamano
+from simulacion.bootstrap import bootstrap
+from simulacion.ajuste import ajustar_archivo
+from interfaz.tabla_virtual import TablaVirtual
+from datos.exportar import exportar, TIPOS_ARCHIVO
+from interfaz.tareas import EjecutorTareas, BarraTareas
+from interfaz.histograma_vivo import HistogramaVivo, agrupar
+
+# por encima de este tamaño se genera y cuenta por bloques (memoria constante)
+MUESTRAS_EN_MEMORIA = 1_000_000
 
 # ---------- Generación de muestras ----------
-def generar_muestras(dist, params, cantidad):
-    """Genera la lista de valores según la distribución seleccionada.
-    Devuelve lista de floats (o vacía si hay error)."""
-    valores = []
+def generar_muestras(dist, params, cantidad, semilla=None):
+    """Genera los valores según la distribución seleccionada.
+    Vectorizado sobre np.random.Generator; `semilla` (int, SeedSequence o Generator)
+    hace la corrida reproducible. Devuelve un arreglo float redondeado a 2 decimales
+    (vacío si la distribución no se reconoce)."""
+    rng = np.random.default_rng(semilla)
     if dist == "Uniforme":
         a = float(params["p1"])
         b = float(params["p2"])
         if a >= b:
             raise ValueError("El mínimo debe ser menor que el máximo.")
-        valores = [round(random.uniform(a, b), 2) for _ in range(cantidad)]
+        valores = rng.uniform(a, b, cantidad)
 
     elif dist == "k-Erlang":
         k = float(params["p1"])
         theta = float(params["p2"])
+        if k <= 0 or theta <= 0:
+            raise ValueError("Forma y escala deben ser positivas.")
         # Mantengo la formula usada originalmente (gammavariate(k, theta/k))
-        valores = [round(random.gammavariate(k, theta / k), 2) for _ in range(cantidad)]
+        valores = rng.gamma(k, theta / k, cantidad)
 
     elif dist == "Exponencial":
         lambd = float(params["p1"])
-        # En el original se usó gammavariate(1, lambd)
-        valores = [round(random.gammavariate(1, lambd), 2) for _ in range(cantidad)]
+        if lambd <= 0:
+            raise ValueError("La escala debe ser positiva.")
+        # En el original se usó gammavariate(1, lambd): exponencial de escala lambd
+        valores = rng.exponential(lambd, cantidad)
 
     elif dist == "Gamma":
         media = float(params["p1"])
@@ -44,24 +60,29 @@ def generar_muestras(dist, params, cantidad):
             raise ValueError("Media y varianza deben ser positivas.")
         forma = (media ** 2) / varianza
         escala = varianza / media
-        valores = [round(random.gammavariate(forma, escala), 2) for _ in range(cantidad)]
+        valores = rng.gamma(forma, escala, cantidad)
 
     elif dist == "Normal":
         media = float(params["p1"])
         varianza = float(params["p2"])
         if varianza < 0:
             raise ValueError("Varianza debe ser no negativa.")
-        valores = [round(random.normalvariate(media, math.sqrt(varianza)), 2) for _ in range(cantidad)]
+        valores = rng.normal(media, math.sqrt(varianza), cantidad)
 
     elif dist == "Weibull":
         forma = float(params["p1"])
         escala = float(params["p2"])
         desplaz = float(params.get("p3") or 0)
-        # Mantengo la fórmula original (aunque no es la parametrización estándar)
-        valores = [round(desplaz + (escala ** 2) * ((-np.log(1 - random.random())) ** (1 / forma)), 2)
-                   for _ in range(cantidad)]
+        if forma <= 0:
+            raise ValueError("La forma debe ser positiva.")
+        # Mantengo la fórmula original (aunque no es la parametrización estándar):
+        # -log(1 - U) es una exponencial estándar
+        valores = desplaz + (escala ** 2) * rng.standard_exponential(cantidad) ** (1 / forma)
+
+    else:
+        return np.array([], dtype=float)
 
-    return valores
+    return np.round(valores, 2)
 
 # ---------- Interfaz / UI helpers ----------
 class DistribSimulator(tk.Tk):
@@ -83,6 +104,10 @@ class DistribSimulator(tk.Tk):
         self.right = ttk.Frame(self, padding=8)
         self.right.pack(side="right", fill="both", expand=True)
 
+        # Trabajos pesados (generación, ajuste, exportación) fuera del bucle de Tk
+        self.tareas = EjecutorTareas(self)
+        self.protocol("WM_DELETE_WINDOW", self._salir)
+
         self._build_controls()
         self._build_table_and_graph()
 
@@ -117,7 +142,7 @@ class DistribSimulator(tk.Tk):
         # Cantidad (Spinbox)
         ttk.Label(self.left, text="Cantidad de valores:").pack(anchor="w", pady=(6,0))
         self.cant_var = tk.IntVar(value=100)
-        self.spin_cant = ttk.Spinbox(self.left, from_=1, to=100000, increment=1, textvariable=self.cant_var, width=18)
+        self.spin_cant = ttk.Spinbox(self.left, from_=1, to=1_000_000_000, increment=1, textvariable=self.cant_var, width=18)
         self.spin_cant.pack(pady=6)
 
         # Bins del histograma
@@ -126,15 +151,27 @@ class DistribSimulator(tk.Tk):
         self.spin_bins = ttk.Spinbox(self.left, from_=3, to=100, increment=1, textvariable=self.bins_var, width=18)
         self.spin_bins.pack(pady=6)
 
+        # Semilla (vacía = aleatoria)
+        ttk.Label(self.left, text="Semilla (opcional):").pack(anchor="w")
+        self.seed_var = tk.StringVar(value="")
+        ttk.Entry(self.left, textvariable=self.seed_var, width=20).pack(pady=6)
+
+        # Modo de muestreo (reducción de varianza)
+        ttk.Label(self.left, text="Modo de muestreo:").pack(anchor="w")
+        self.modo_var = tk.StringVar(value=MODOS[0])
+        ttk.Combobox(self.left, textvariable=self.modo_var, values=MODOS, state="readonly", width=20).pack(pady=6)
+
         # Botones
         btn_frame = ttk.Frame(self.left)
         btn_frame.pack(pady=(10,6), fill="x")
         self.btn_gen = ttk.Button(btn_frame, text="Generar", command=self.generar)
         self.btn_gen.pack(fill="x", pady=4)
-        self.btn_export = ttk.Button(btn_frame, text="Exportar CSV (tabla)", command=self.export_csv)
+        self.btn_export = ttk.Button(btn_frame, text="Exportar valores...", command=self.export_csv)
         self.btn_export.pack(fill="x", pady=4)
         self.btn_clear = ttk.Button(btn_frame, text="Limpiar tabla y gráfico", command=self._limpiar_todo)
         self.btn_clear.pack(fill="x", pady=4)
+        self.btn_ajuste = ttk.Button(btn_frame, text="Ajuste desde archivo...", command=self.ajuste_archivo)
+        self.btn_ajuste.pack(fill="x", pady=4)
 
         # Nota rápida / validación
         ttk.Label(self.left, text="* Ingresa parámetros numéricos válidos", foreground="#666666", wraplength=200).pack(pady=(8,0))
@@ -181,20 +218,12 @@ class DistribSimulator(tk.Tk):
         bottom = ttk.Frame(self.right)
         bottom.pack(side="bottom", fill="both", expand=True)
 
-        # Tabla con scrollbar
-        self.tree_frame = ttk.Frame(top)
-        self.tree_frame.pack(fill="both", expand=True)
-        self.table_scroll_y = ttk.Scrollbar(self.tree_frame, orient="vertical")
-        self.table_scroll_x = ttk.Scrollbar(self.tree_frame, orient="horizontal")
-        self.table = ttk.Treeview(self.tree_frame, columns=("N","Valor"), show="headings",
-                                  yscrollcommand=self.table_scroll_y.set, xscrollcommand=self.table_scroll_x.set, height=10)
-        self.table.heading("N", text="N°"); self.table.heading("Valor", text="Valor")
-        self.table.column("N", width=80, anchor="center"); self.table.column("Valor", width=140, anchor="center")
-        self.table_scroll_y.config(command=self.table.yview)
-        self.table_scroll_x.config(command=self.table.xview)
-        self.table_scroll_y.pack(side="right", fill="y")
-        self.table_scroll_x.pack(side="bottom", fill="x")
+        # Tabla virtual: dibuja solo las filas visibles del arreglo de valores
+        self.table = TablaVirtual(top, [("N°", 80), ("Valor", 140)], filas=10)
         self.table.pack(fill="both", expand=True)
+        self.valores = np.array([])
+
+        BarraTareas(top, self.tareas).pack(fill="x", pady=(6,0))
 
         # Estadísticas rápidas
         stats_frame = ttk.Frame(top)
@@ -208,6 +237,7 @@ class DistribSimulator(tk.Tk):
         self.canvas = FigureCanvasTkAgg(self.fig, master=bottom)
         self.canvas_widget = self.canvas.get_tk_widget()
         self.canvas_widget.pack(fill="both", expand=True)
+        self.hist = HistogramaVivo(self.ax, self.canvas)
 
     # ---------- Acciones ----------
     def generar(self):
@@ -223,87 +253,209 @@ class DistribSimulator(tk.Tk):
         # Preparar parámetros según campos visibles
         dist = self.combo.get()
         params = {"p1": self.p1_var.get(), "p2": self.p2_var.get(), "p3": self.p3_var.get()}
-
-        # Intentar generar y atrapar errores de conversión
         try:
-            valores = generar_muestras(dist, params, cantidad)
-        except ValueError as e:
-            messagebox.showerror("Error", str(e))
-            return
-        except Exception:
-            messagebox.showerror("Error", "Parámetros inválidos. Revisa los valores ingresados.")
+            semilla = int(self.seed_var.get()) if self.seed_var.get().strip() else None
+        except ValueError:
+            messagebox.showerror("Error", "La semilla debe ser un entero.")
             return
 
-        # Llenar tabla
-        for row in self.table.get_children():
-            self.table.delete(row)
-        for i, v in enumerate(valores, start=1):
-            self.table.insert("", "end", values=(i, v))
+        modo = self.modo_var.get()
+        if cantidad > MUESTRAS_EN_MEMORIA and modo != "Simple":
+            messagebox.showerror("Error", f"Los modos de reducción de varianza trabajan en memoria "
+                                          f"(máximo {MUESTRAS_EN_MEMORIA} valores).")
+            return
+        if self.tareas.ocupado():
+            messagebox.showwarning("Atención", "Hay un trabajo en curso.")
+            return
+        bins = int(self.bins_var.get() or 10)
+        self.tareas.ejecutar(self._calcular, dist, params, cantidad, semilla, modo, bins,
+                             descripcion="Generando", al_terminar=self._mostrar_resultado,
+                             al_error=self._error_generar, al_parcial=self._mostrar_parcial)
 
-        # Actualizar estadísticas
-        arr = np.array(valores) if valores else np.array([])
-        if arr.size > 0:
-            media = float(np.mean(arr))
-            var = float(np.var(arr))
-            self.stat_label.config(text=f"N: {arr.size}    Media: {media:.4f}    Varianza: {var:.4f}")
+    @staticmethod
+    def _error_generar(e):
+        if isinstance(e, ValueError):
+            messagebox.showerror("Error", str(e))
         else:
-            self.stat_label.config(text="N: 0    Media: -    Varianza: -")
+            messagebox.showerror("Error", "Parámetros inválidos. Revisa los valores ingresados.")
 
+    def _calcular(self, tarea, dist, params, cantidad, semilla, modo, bins):
+        """Corre en un hilo del ejecutor: genera y resume, sin tocar widgets."""
+        if cantidad > MUESTRAS_EN_MEMORIA:
+            return self._calcular_por_bloques(tarea, dist, params, cantidad, semilla, bins)
+        informe = None
+        tarea.reportar(0, 3)
+        if modo == "Simple":
+            # misma semilla que el primer bloque del modo por bloques: mismos primeros valores
+            valores = generar_muestras(dist, params, cantidad, semilla=semilla_en_memoria(semilla))
+        else:
+            valores, informe = muestrear_con_reduccion(dist, params, cantidad, modo, semilla=semilla)
+            valores = np.round(valores, 2)
+        res = {"dist": dist, "params": params, "valores": valores, "conteo": None, "bordes": None}
+        if valores.size == 0:
+            res["texto"] = "N: 0    Media: -    Varianza: -"
+            return res
+        res["conteo"], res["bordes"] = agrupar(valores, bins=bins)
+        tarea.reportar(1, 3)
+        try:
+            ks = prueba_ks_continua(valores, dist, params)
+        except ValueError:
+            ks = None
+        tarea.reportar(2, 3)
+        ic = bootstrap(valores) if valores.size >= 2 else None
+        res["texto"] = (f"N: {valores.size}    Media: {float(np.mean(valores)):.4f}    Varianza: {float(np.var(valores)):.4f}"
+                        + self._texto_ks(ks) + self._texto_ic(ic) + self._texto_reduccion(informe))
+        return res
+
+    def _calcular_por_bloques(self, tarea, dist, params, cantidad, semilla, bins):
+        # Muestras grandes: histograma y momentos acumulados; la tabla solo muestra el inicio
+        acum = AcumuladorContinuo(bins)
+        try:
+            acum_ks = AcumuladorKS(dist, params)
+            destinos = (acum, acum_ks)
+        except ValueError:
+            acum_ks, destinos = None, (acum,)
+        def progreso(hechos, total):
+            tarea.reportar(hechos, total)
+            tarea.publicar((dist, params, acum.conteo.copy(), acum.bordes, acum.texto_fuera()))
+        # los bloques se generan en todos los núcleos; el histograma se acumula aquí en orden
+        acumular_por_bloques(generar_muestras, (dist, params), cantidad, destinos, semilla=semilla,
+                             progreso=progreso, trabajadores=None)
+        texto = (f"N: {acum.n}    Media: {acum.media:.4f}    Varianza: {acum.varianza:.4f}"
+                 + self._texto_ks(acum_ks.resultado() if acum_ks else None)
+                 + f"    (tabla: primeros {acum.muestra_inicial.size})")
+        return {"dist": dist, "params": params, "valores": acum.muestra_inicial, "texto": texto,
+                "conteo": acum.conteo, "bordes": acum.bordes, "nota": acum.texto_fuera()}
+
+    def _mostrar_resultado(self, res):
+        # Llenar tabla
+        self.valores = res["valores"]
+        self.table.set_datos([res["valores"]], ["{:.2f}"])
+        # Actualizar estadísticas
+        self.stat_label.config(text=res["texto"])
         # Mostrar gráfico
-        self._mostrar_grafico(valores, dist)
-
-    def _mostrar_grafico(self, valores, titulo):
-        # Limpiar figura
-        self.ax.clear()
-        if not valores:
-            self.ax.text(0.5, 0.5, "No hay datos. Genera valores para ver el histograma.",
-                         ha="center", va="center", fontsize=12, color="#666666")
-            self.ax.axis("off")
-            self.canvas.draw()
-            return
-
-        bins = int(self.bins_var.get() or 10)
-        n, bins_edges, patches = self.ax.hist(valores, bins=bins, edgecolor="black", rwidth=0.9)
-        # Etiquetas de frecuencia encima de las barras
-        for i in range(len(n)):
-            height = n[i]
-            if height >= 1:
-                x = bins_edges[i] + (bins_edges[i+1] - bins_edges[i]) / 2
-                self.ax.text(x, height + max(n)*0.01, str(int(height)), ha="center", va="bottom", fontsize=8)
-        self.ax.set_title(f"Distribución {titulo}", fontsize=13, fontweight="bold")
-        self.ax.set_xlabel("Valores"); self.ax.set_ylabel("Frecuencia")
-        self.ax.grid(axis='y', linestyle='--', alpha=0.6)
-        self.canvas.draw()
+        self._mostrar_grafico(res["valores"], res["dist"], conteo=res["conteo"], bordes=res["bordes"],
+                              params=res["params"], nota=res.get("nota", ""))
+
+    @staticmethod
+    def _texto_ic(ic):
+        if ic is None:
+            return ""
+        m, v, q = ic["media"], ic["varianza"], ic["q0.5"]
+        return (f"\nIC {ic['nivel']:.0%} (bootstrap)    Media: [{m['ic_inf']:.4f}, {m['ic_sup']:.4f}]"
+                f"    Varianza: [{v['ic_inf']:.4f}, {v['ic_sup']:.4f}]"
+                f"    Mediana: [{q['ic_inf']:.4f}, {q['ic_sup']:.4f}]")
+
+    @staticmethod
+    def _texto_reduccion(informe):
+        if informe is None:
+            return ""
+        nota = nota_tamano(informe)
+        return (f"\nE[X] ≈ {informe['estimacion']:.4f} ± {informe['error_estandar']:.2g}"
+                f"    Reducción de varianza ({informe['modo']}): ×{informe['reduccion']:.3g}"
+                + (f"    {nota}" if nota else ""))
+
+    @staticmethod
+    def _texto_ks(ks):
+        if ks is None:
+            return ""
+        return f"    KS: D={ks['d']:.4f} p={ks['p_value']:.3f} ({'ajusta' if ks['pasa'] else 'no ajusta'})"
+
+    def _mostrar_grafico(self, valores, titulo, conteo=None, bordes=None, params=None, nota=""):
+        if conteo is None:
+            if len(valores) == 0:
+                self.hist.mensaje("No hay datos. Genera valores para ver el histograma.")
+                return
+            conteo, bordes = agrupar(valores, bins=int(self.bins_var.get() or 10))
+        # se dibujan los conteos ya agrupados: el costo no depende de la cantidad de muestras;
+        # con los mismos bordes solo cambian las alturas de las barras (blitting)
+        curva = None
+        if params is not None:
+            # curva teórica escalada a frecuencias
+            teorica = distribucion_continua(titulo, params)
+            xs = np.linspace(bordes[0], bordes[-1], 400)
+            curva = (xs, teorica.pdf(xs) * np.sum(conteo) * (bordes[1] - bordes[0]))
+        # nota: valores fuera de los bordes (modo por bloques), se indican en el título
+        self.hist.mostrar(conteo, bordes, f"Distribución {titulo}" + (f"\n({nota})" if nota else ""), curva=curva)
+
+    def _mostrar_parcial(self, parcial):
+        # histograma en vivo mientras se acumulan los bloques
+        dist, params, conteo, bordes, nota = parcial
+        self._mostrar_grafico(None, dist, conteo=conteo, bordes=bordes, params=params, nota=nota)
 
     def export_csv(self):
-        # Genera CSV en memoria con la tabla actual y muestra diálogo para guardar si hay datos
-        rows = list(self.table.get_children())
-        if not rows:
-            messagebox.showinfo("Exportar CSV", "No hay datos para exportar.")
+        # Escribe los valores actuales por bloques en segundo plano (CSV, .npy, .npz o binario)
+        if len(self.valores) == 0:
+            messagebox.showinfo("Exportar", "No hay datos para exportar.")
             return
-        output = StringIO()
-        writer = csv.writer(output)
-        writer.writerow(["N°", "Valor"])
-        for item in rows:
-            writer.writerow(self.table.item(item, "values"))
-        contenido = output.getvalue()
-        output.close()
 
         # Diálogo simple de guardar (usamos filedialog)
         from tkinter import filedialog
-        filename = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files","*.csv")], title="Guardar CSV")
+        filename = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=TIPOS_ARCHIVO, title="Exportar valores")
         if filename:
-            with open(filename, "w", newline='', encoding="utf-8") as f:
-                f.write(contenido)
-            messagebox.showinfo("Exportar CSV", f"Archivo guardado en:\n{filename}")
+            valores = self.valores
+            self.tareas.ejecutar(lambda tarea: exportar(filename, [("Valor", valores)], formatos=["%.2f"],
+                                                        indice="N°", progreso=tarea.reportar),
+                                 descripcion="Exportando",
+                                 al_terminar=lambda _: messagebox.showinfo("Exportar", f"Archivo guardado en:\n{filename}"),
+                                 al_error=lambda e: messagebox.showerror("Exportar", str(e)))
+
+    def ajuste_archivo(self):
+        # Ajuste MLE de todas las distribuciones a un archivo (CSV o binario) leído por bloques
+        from tkinter import filedialog
+        ruta = filedialog.askopenfilename(title="Datos a ajustar",
+                                          filetypes=[("Datos","*.csv *.txt *.npy *.npz *.bin *.f64 *.raw *.u32"),
+                                                     ("Todos","*.*")])
+        if not ruta:
+            return
+        if self.tareas.ocupado():
+            messagebox.showwarning("Atención", "Hay un trabajo en curso.")
+            return
+        self.tareas.ejecutar(lambda tarea: ajustar_archivo(ruta, progreso=tarea.reportar),
+                             descripcion="Ajustando", al_terminar=self._mostrar_ajuste,
+                             al_error=lambda e: messagebox.showerror("Ajuste", str(e)))
+
+    def _mostrar_ajuste(self, resultados):
+        if not resultados:
+            messagebox.showinfo("Ajuste", "Ninguna distribución es aplicable a estos datos.")
+            return
+
+        win = tk.Toplevel(self)
+        # continuas y discretas se ordenan por separado: sus AIC no son comparables
+        win.title("Ajuste — ranking por AIC (continuas y discretas por separado)")
+        cols = ("Tipo", "#", "Distribución", "Parámetros", "AIC", "Prueba", "Estadístico", "p")
+        tabla = ttk.Treeview(win, columns=cols, show="headings", height=len(resultados))
+        for c in cols:
+            tabla.heading(c, text=c)
+        tabla.column("Parámetros", width=280)
+        for c in ("Tipo", "#", "Prueba"):
+            tabla.column(c, width=70 if c != "#" else 30)
+        for r in resultados:
+            params = ", ".join(f"{k}={float(v):.4g}" for k, v in r["params"].items())
+            tabla.insert("", "end", values=(r["tipo"], r["rango"], r["distribucion"], params, f"{r['aic']:.1f}",
+                                            r["prueba"], f"{r['estadistico']:.4f}", f"{r['p_value']:.3f}"))
+        tabla.pack(fill="both", expand=True, padx=8, pady=8)
+
+        continuas = [r for r in resultados if r["tipo"] == "continua"]
+        if continuas:
+            mejor = continuas[0]
+            def usar_mejor():
+                self.combo.set(mejor["distribucion"])
+                self._update_param_fields()
+                for clave, var in (("p1", self.p1_var), ("p2", self.p2_var), ("p3", self.p3_var)):
+                    if clave in mejor["params"]:
+                        var.set(f"{float(mejor['params'][clave]):.6g}")
+                win.destroy()
+            ttk.Button(win, text=f"Usar {mejor['distribucion']} en el simulador", command=usar_mejor).pack(pady=(0,8))
+
+    def _salir(self):
+        self.tareas.cerrar()
+        self.destroy()
 
     def _limpiar_todo(self):
-        for r in self.table.get_children():
-            self.table.delete(r)
-        self.ax.clear()
-        self.ax.text(0.5, 0.5, "Histograma vacío.", ha="center", va="center", color="#666")
-        self.ax.axis("off")
-        self.canvas.draw()
+        self.valores = np.array([])
+        self.table.limpiar()
+        self.hist.mensaje("Histograma vacío.")
         self.stat_label.config(text="N: -    Media: -    Varianza: -")
 
 if __name__ == "__main__":
@@ -12,7 +12,34 @@ from generadores.multiplicador_constante import multiplicador_constante
 
 from pruebas.prueba_medias import prueba_medias
 from pruebas.prueba_varianza import prueba_varianza
-from pruebas.prueba_uniformidad import prueba_uniformidad
+from pruebas.prueba_uniformidad import prueba_uniformidad, tabla_frecuencias
+
+from datos.archivos import abrir_secuencia, primeros
+from datos.exportar import exportar, TIPOS_ARCHIVO
+
+from simulacion.inversa import VariableDesdeU
+from simulacion.histograma import AcumuladorContinuo, AcumuladorDiscreto
+
+from interfaz.tabla_virtual import TablaVirtual
+from interfaz.tareas import EjecutorTareas, BarraTareas
+from interfaz.histograma_vivo import HistogramaVivo, agrupar_tabla
+
+# filas mostradas en la tabla cuando el archivo no admite acceso directo (CSV)
+LIMITE_TABLA_ARCHIVO = 1000
+
+# parámetros de la pestaña Variables: (tipo, distribución) -> [(clave, etiqueta)]
+PARAMS_VARIABLES = {
+    ("Continua", "Uniforme"): [("p1", "Mínimo (a)"), ("p2", "Máximo (b)")],
+    ("Continua", "k-Erlang"): [("p1", "Forma (k)"), ("p2", "Escala (θ)")],
+    ("Continua", "Exponencial"): [("p1", "Escala (λ)")],
+    ("Continua", "Gamma"): [("p1", "Media (μ)"), ("p2", "Varianza (σ²)")],
+    ("Continua", "Normal"): [("p1", "Media (μ)"), ("p2", "Varianza (σ²)")],
+    ("Continua", "Weibull"): [("p1", "Forma (β)"), ("p2", "Escala (η)"), ("p3", "Desplazamiento")],
+    ("Discreta", "Uniforme"): [("a", "a"), ("b", "b")],
+    ("Discreta", "Bernoulli"): [("p", "p")],
+    ("Discreta", "Binomial"): [("n", "n"), ("p", "p")],
+    ("Discreta", "Poisson"): [("lam", "λ")],
+}
 
 class CalculadoraRNG(tk.Tk):
     def __init__(self):
@@ -21,18 +48,28 @@ class CalculadoraRNG(tk.Tk):
         self.geometry("1100x700")
         self.xs = []
         self.us = []
+        # generadores en procesos (Python puro, retienen el GIL); pruebas y exportación en hilos
+        self.tareas = EjecutorTareas(self, procesos=1)
         self._build_ui()
+        self.protocol("WM_DELETE_WINDOW", self._salir)
+
+    def _salir(self):
+        self.tareas.cerrar()
+        self.destroy()
 
     def _build_ui(self):
         menubar = tk.Menu(self)
         archivo = tk.Menu(menubar, tearoff=0)
+        archivo.add_command(label="Cargar Números...", command=self.cargar_numeros)
         archivo.add_command(label="Exportar Números...", command=self.exportar_numeros)
         archivo.add_command(label="Exportar Resultados...", command=self.exportar_resultados)
         archivo.add_separator()
-        archivo.add_command(label="Salir", command=self.destroy)
+        archivo.add_command(label="Salir", command=self._salir)
         menubar.add_cascade(label="Archivo", menu=archivo)
         self.config(menu=menubar)
 
+        BarraTareas(self, self.tareas, padding=(8,4)).pack(side="bottom", fill="x")
+
         nb = ttk.Notebook(self)
         nb.pack(fill="both", expand=True)
 
@@ -73,11 +110,8 @@ class CalculadoraRNG(tk.Tk):
         ttk.Button(tab_gen, text="Generar", command=self.generar).grid(row=3, column=2, **pad)
         ttk.Button(tab_gen, text="Exportar", command=self.exportar_numeros).grid(row=3, column=3, **pad)
 
-        # Tabla
-        cols = ("i","x","u")
-        self.tree = ttk.Treeview(tab_gen, columns=cols, show="headings", height=12)
-        for c in cols:
-            self.tree.heading(c, text=c)
+        # Tabla (virtual: solo se dibujan las filas visibles)
+        self.tree = TablaVirtual(tab_gen, [("i", 100), ("x", 160), ("u", 160)], filas=12)
         self.tree.grid(row=4, column=0, columnspan=4, sticky="nsew", padx=8, pady=8)
         tab_gen.grid_rowconfigure(4, weight=1)
         tab_gen.grid_columnconfigure(3, weight=1)
@@ -87,6 +121,7 @@ class CalculadoraRNG(tk.Tk):
         self.ax = self.fig.add_subplot(111)
         self.canvas = FigureCanvasTkAgg(self.fig, master=tab_gen)
         self.canvas.get_tk_widget().grid(row=5, column=0, columnspan=4, sticky="nsew", padx=8, pady=8)
+        self.hist = HistogramaVivo(self.ax, self.canvas)
 
         # Pruebas tab
         self.chk_med = tk.BooleanVar(value=True)
@@ -105,6 +140,7 @@ class CalculadoraRNG(tk.Tk):
         ttk.Entry(tab_pruebas, textvariable=self.k_var, width=12).grid(row=1, column=3, **pad)
 
         ttk.Button(tab_pruebas, text="Probar", command=self.probar).grid(row=1, column=4, **pad)
+        ttk.Button(tab_pruebas, text="Cargar archivo...", command=self.cargar_numeros).grid(row=0, column=4, **pad)
 
         self.txt = tk.Text(tab_pruebas, height=15)
         self.txt.grid(row=2, column=0, columnspan=5, sticky="nsew", padx=8, pady=8)
@@ -116,96 +152,250 @@ class CalculadoraRNG(tk.Tk):
         self.ax2 = self.fig2.add_subplot(111)
         self.canvas2 = FigureCanvasTkAgg(self.fig2, master=tab_pruebas)
         self.canvas2.get_tk_widget().grid(row=3, column=0, columnspan=5, sticky="nsew", padx=8, pady=8)
+        self.hist2 = HistogramaVivo(self.ax2, self.canvas2)
+
+        # Variables tab: transformada inversa sobre los u_i generados
+        ttk.Label(tab_vars, text="Tipo:").grid(row=0, column=0, sticky="w", **pad)
+        self.var_tipo = tk.StringVar(value="Continua")
+        cb_tipo = ttk.Combobox(tab_vars, textvariable=self.var_tipo, state="readonly", values=["Continua","Discreta"], width=12)
+        cb_tipo.grid(row=0, column=1, **pad)
+        ttk.Label(tab_vars, text="Distribución:").grid(row=0, column=2, sticky="w", **pad)
+        self.var_dist = tk.StringVar(value="Uniforme")
+        self.cb_dist = ttk.Combobox(tab_vars, textvariable=self.var_dist, state="readonly", width=14)
+        self.cb_dist.grid(row=0, column=3, **pad)
+        cb_tipo.bind("<<ComboboxSelected>>", lambda e: self._actualizar_tipo_variable())
+        self.cb_dist.bind("<<ComboboxSelected>>", lambda e: self._actualizar_params_variable())
+
+        self.var_params = []
+        for i in range(3):
+            lbl = ttk.Label(tab_vars, text="")
+            val = tk.StringVar(value="1")
+            ent = ttk.Entry(tab_vars, textvariable=val, width=12)
+            lbl.grid(row=1, column=2*i, sticky="w", **pad)
+            ent.grid(row=1, column=2*i+1, **pad)
+            self.var_params.append((lbl, ent, val))
+        ttk.Button(tab_vars, text="Transformar u_i", command=self.transformar).grid(row=0, column=4, **pad)
+        ttk.Button(tab_vars, text="Exportar", command=self.exportar_variable).grid(row=0, column=5, sticky="w", **pad)
+
+        self.var_stats = ttk.Label(tab_vars, text="N: -    Media: -    Varianza: -")
+        self.var_stats.grid(row=2, column=0, columnspan=6, sticky="w", **pad)
+        self.fig3 = Figure(figsize=(6,3), dpi=100)
+        self.ax3 = self.fig3.add_subplot(111)
+        self.canvas3 = FigureCanvasTkAgg(self.fig3, master=tab_vars)
+        self.canvas3.get_tk_widget().grid(row=3, column=0, columnspan=6, sticky="nsew", padx=8, pady=8)
+        tab_vars.grid_rowconfigure(3, weight=1)
+        tab_vars.grid_columnconfigure(5, weight=1)
+        self._actualizar_tipo_variable()
+
+    def _actualizar_tipo_variable(self):
+        dists = [d for (t, d) in PARAMS_VARIABLES if t == self.var_tipo.get()]
+        self.cb_dist.config(values=dists)
+        if self.var_dist.get() not in dists:
+            self.var_dist.set(dists[0])
+        self._actualizar_params_variable()
+
+    def _actualizar_params_variable(self):
+        campos = PARAMS_VARIABLES[(self.var_tipo.get(), self.var_dist.get())]
+        for i, (lbl, ent, val) in enumerate(self.var_params):
+            if i < len(campos):
+                lbl.config(text=campos[i][1] + ":")
+                lbl.grid(); ent.grid()
+            else:
+                lbl.grid_remove(); ent.grid_remove()
+
+    def transformar(self):
+        if not hasattr(self, "us") or len(self.us) == 0:
+            messagebox.showwarning("Atención", "Primero genera números.")
+            return
+        if self.tareas.ocupado():
+            messagebox.showwarning("Atención", "Hay un trabajo en curso.")
+            return
+        try:
+            tipo, dist = self.var_tipo.get(), self.var_dist.get()
+            campos = PARAMS_VARIABLES[(tipo, dist)]
+            params = {clave: self.var_params[i][2].get() for i, (clave, _) in enumerate(campos)}
+            variable = VariableDesdeU(tipo, dist, params, self.us)
+            # valida los parámetros aquí, antes de recorrer la secuencia en segundo plano
+            variable.primeros(1)
+        except Exception as e:
+            messagebox.showerror("Error al transformar", str(e))
+            return
+        bins = max(5, min(100, int(len(self.us) ** 0.5)))
+        self.tareas.ejecutar(self._acumular_variable, variable, bins, descripcion="Transformando",
+                             al_terminar=lambda acumulador: self._mostrar_variable(variable, acumulador),
+                             al_error=lambda e: messagebox.showerror("Error al transformar", str(e)))
 
-        ttk.Label(tab_vars, text="Espacio para variables aleatorias.").pack(padx=12, pady=12)
+    @staticmethod
+    def _acumular_variable(tarea, variable, bins):
+        # corre en un hilo: la variable se transforma y acumula bloque a bloque (memmap / CSV sin cargar)
+        acumulador = AcumuladorDiscreto() if variable.discreta else AcumuladorContinuo(bins)
+        n, hechos = len(variable), 0
+        for b in variable.bloques():
+            acumulador.agregar(b)
+            hechos += b.size
+            tarea.reportar(hechos, n)
+        return acumulador
+
+    def _mostrar_variable(self, variable, acumulador):
+        self.variable = variable
+        titulo = f"{variable.dist} ({variable.tipo.lower()}) desde u_i"
+        if variable.discreta:
+            conteo, bordes = agrupar_tabla(*acumulador.tabla())
+        else:
+            conteo, bordes = acumulador.conteo, acumulador.bordes
+            if acumulador.fuera:
+                titulo += f"\n({acumulador.texto_fuera()})"
+        self.ax3.clear()
+        self.ax3.stairs(conteo, bordes, fill=True)
+        self.ax3.set_title(titulo)
+        self.canvas3.draw()
+        self.var_stats.config(text=f"N: {acumulador.n}    Media: {acumulador.media:.4f}    "
+                                   f"Varianza: {acumulador.varianza:.4f}")
+
+    def exportar_variable(self):
+        variable = getattr(self, "variable", None)
+        if variable is None:
+            messagebox.showwarning("Atención", "Primero transforma los u_i.")
+            return
+        if self.tareas.ocupado():
+            messagebox.showwarning("Atención", "Hay un trabajo en curso.")
+            return
+        f = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=TIPOS_ARCHIVO)
+        if not f: return
+        # se vuelve a transformar bloque a bloque mientras se escribe
+        formato = "%d" if variable.discreta else "%.10f"
+        self.tareas.ejecutar(lambda tarea: exportar(f, [("x", variable)], formatos=[formato],
+                                                    progreso=tarea.reportar),
+                             descripcion="Exportando",
+                             al_terminar=lambda _: messagebox.showinfo("Exportar", "Archivo guardado."),
+                             al_error=lambda e: messagebox.showerror("Exportar", str(e)))
 
     def generar(self):
+        if self.tareas.ocupado():
+            messagebox.showwarning("Atención", "Hay un trabajo en curso.")
+            return
         try:
             n = int(self.n_var.get())
             d = int(self.d_var.get())
             sem1 = int(self.sem1.get())
             alg = self.alg.get()
             if alg == "cuadrados_medios":
-                xs, us = cuadrados_medios(sem1, n, d)
+                funcion, args = cuadrados_medios, (sem1, n, d)
             elif alg == "productos_medios":
                 sem2 = int(self.sem2.get())
-                xs, us = productos_medios(sem1, sem2, n, d)
+                funcion, args = productos_medios, (sem1, sem2, n, d)
             elif alg == "multiplicador_constante":
                 c = int(self.c_var.get())
-                xs, us = multiplicador_constante(sem1, c, n, d)
+                funcion, args = multiplicador_constante, (sem1, c, n, d)
             else:
                 raise ValueError("Algoritmo no válido.")
-            self.xs, self.us = xs, us
-            self._refresh_table(xs, us)
-            self._plot_hist(us)
-            messagebox.showinfo("OK", f"Se generaron {len(us)} números.")
         except Exception as e:
             messagebox.showerror("Error al generar", str(e))
+            return
+        self.tareas.ejecutar(funcion, *args, descripcion="Generando", en_proceso=True,
+                             al_terminar=self._mostrar_generados,
+                             al_error=lambda e: messagebox.showerror("Error al generar", str(e)))
+
+    def _mostrar_generados(self, resultado):
+        xs, us = resultado
+        self.xs, self.us = np.asarray(xs), np.asarray(us)
+        self._refresh_table(self.xs, self.us)
+        self._plot_hist(self.us)
+        messagebox.showinfo("OK", f"Se generaron {len(us)} números.")
+
+    def cargar_numeros(self):
+        f = filedialog.askopenfilename(filetypes=[("Secuencias","*.npy *.npz *.csv *.txt *.bin *.f64 *.raw *.u32"),
+                                                  ("NumPy","*.npy *.npz"), ("CSV","*.csv *.txt"),
+                                                  ("Binario float64","*.bin *.f64 *.raw"), ("Binario uint32","*.u32"),
+                                                  ("Todos","*.*")])
+        if not f: return
+        try:
+            us = abrir_secuencia(f)
+            n = len(us)
+            if n == 0:
+                raise ValueError("El archivo no contiene valores.")
+            self.xs, self.us = None, us
+            # memmaps y enteros escalados admiten acceso directo; el CSV solo se previsualiza
+            vista = us if hasattr(us, "__getitem__") else primeros(us, LIMITE_TABLA_ARCHIVO)
+            self._refresh_table(None, vista)
+            self._plot_hist(us)
+            messagebox.showinfo("OK", f"Se cargaron {n} números (tabla: {len(vista)} filas).")
+        except Exception as e:
+            messagebox.showerror("Error al cargar", str(e))
 
     def _refresh_table(self, xs, us):
-        for it in self.tree.get_children():
-            self.tree.delete(it)
-        for i,(x,u) in enumerate(zip(xs,us), start=1):
-            self.tree.insert("", "end", values=(i,x,f"{u:.6f}"))
+        self.tree.set_datos([xs, us], ["{}", "{:.6f}"])
 
     def _plot_hist(self, us):
-        self.ax.clear()
-        if len(us)>0:
-            self.ax.hist(us, bins=max(5,int(len(us)**0.5)), range=(0,1))
-        self.ax.set_title("Histograma u_i")
-        self.canvas.draw()
+        n = len(us)
+        if n == 0:
+            self.hist.mensaje("Sin números.")
+            return
+        # a lo sumo 100 clases: sqrt(n) crece sin límite con archivos grandes
+        counts, edges = tabla_frecuencias(us, min(100, max(5,int(n**0.5))))
+        self.hist.mostrar(counts, edges, "Histograma u_i", xlabel="u_i")
 
     def probar(self):
-        if not hasattr(self, "us") or not self.us:
+        if not hasattr(self, "us") or len(self.us) == 0:
             messagebox.showwarning("Atención", "Primero genera números.")
             return
+        if self.tareas.ocupado():
+            messagebox.showwarning("Atención", "Hay un trabajo en curso.")
+            return
         try:
             alpha = float(self.alpha.get())
             k = int(self.k_var.get()) if self.k_var.get().strip()!="" else None
-            self.txt.delete("1.0", "end")
-            resultados = {}
-            if self.chk_med.get():
-                r = prueba_medias(self.us, alpha=alpha)
-                resultados['medias'] = r
-                self.txt.insert("end", "=== Prueba de Medias ===\n")
-                for k,v in r.items():
-                    self.txt.insert("end", f"{k}: {v}\n")
-            if self.chk_var.get():
-                r = prueba_varianza(self.us, alpha=alpha)
-                resultados['varianza'] = r
-                self.txt.insert("end", "\n=== Prueba de Varianza ===\n")
-                for k,v in r.items():
-                    self.txt.insert("end", f"{k}: {v}\n")
-            if self.chk_unif.get():
-                r = prueba_uniformidad(self.us, k=k, alpha=alpha)
-                resultados['uniformidad'] = r
-                self.txt.insert("end", "\n=== Prueba de Uniformidad ===\n")
-                for k,v in r.items():
-                    if k in ('frecuencias','intervalos'): continue
-                    self.txt.insert("end", f"{k}: {v}\n")
-                # plot frecuencias
-                self.ax2.clear()
-                freqs = r['frecuencias']
-                self.ax2.bar(range(1,len(freqs)+1), freqs)
-                self.ax2.set_title("Frecuencias observadas")
-                self.canvas2.draw()
-            self._resultados_cache = resultados
         except Exception as e:
             messagebox.showerror("Error en pruebas", str(e))
+            return
+        elegidas = [nombre for nombre, chk in (("medias", self.chk_med), ("varianza", self.chk_var),
+                                               ("uniformidad", self.chk_unif)) if chk.get()]
+        self.tareas.ejecutar(self._calcular_pruebas, self.us, elegidas, alpha, k, descripcion="Probando",
+                             al_terminar=self._mostrar_pruebas,
+                             al_error=lambda e: messagebox.showerror("Error en pruebas", str(e)))
+
+    @staticmethod
+    def _calcular_pruebas(tarea, us, elegidas, alpha, k):
+        # corre en un hilo: no toca widgets
+        resultados = {}
+        for i, nombre in enumerate(elegidas):
+            tarea.reportar(i, len(elegidas))
+            if nombre == "medias":
+                resultados[nombre] = prueba_medias(us, alpha=alpha)
+            elif nombre == "varianza":
+                resultados[nombre] = prueba_varianza(us, alpha=alpha)
+            else:
+                resultados[nombre] = prueba_uniformidad(us, k=k, alpha=alpha)
+        tarea.reportar(1)
+        return resultados
+
+    def _mostrar_pruebas(self, resultados):
+        self.txt.delete("1.0", "end")
+        titulos = {"medias": "Prueba de Medias", "varianza": "Prueba de Varianza", "uniformidad": "Prueba de Uniformidad"}
+        for j, (nombre, r) in enumerate(resultados.items()):
+            self.txt.insert("end", ("\n" if j else "") + f"=== {titulos[nombre]} ===\n")
+            for k,v in r.items():
+                if k in ('frecuencias','intervalos'): continue
+                self.txt.insert("end", f"{k}: {v}\n")
+        if "uniformidad" in resultados:
+            # plot frecuencias
+            freqs = resultados["uniformidad"]['frecuencias']
+            self.hist2.mostrar(freqs, np.arange(0.5, len(freqs)+1), "Frecuencias observadas", xlabel="Intervalo")
+        self._resultados_cache = resultados
 
     def exportar_numeros(self):
-        if not hasattr(self, "us") or not self.us:
+        if not hasattr(self, "us") or len(self.us) == 0:
             messagebox.showwarning("Atención", "No hay números para exportar.")
             return
-        f = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV","*.csv")])
+        f = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=TIPOS_ARCHIVO)
         if not f: return
-        import csv
-        with open(f, "w", newline="", encoding="utf-8") as fh:
-            w = csv.writer(fh)
-            w.writerow(["i","x_i","u_i"])
-            for i,(x,u) in enumerate(zip(self.xs,self.us), start=1):
-                w.writerow([i,x,f"{u:.10f}"])
-        messagebox.showinfo("Exportar", "Archivo guardado.")
+        # CSV con i, x_i, u_i; .npy/.f64 solo u_i (se pueden volver a cargar como memmap); .npz ambas
+        xs, us = self.xs, self.us
+        self.tareas.ejecutar(lambda tarea: exportar(f, [("x_i", xs), ("u_i", us)], formatos=["%d", "%.10f"],
+                                                    progreso=tarea.reportar),
+                             descripcion="Exportando",
+                             al_terminar=lambda _: messagebox.showinfo("Exportar", "Archivo guardado."),
+                             al_error=lambda e: messagebox.showerror("Exportar", str(e)))
 
     def exportar_resultados(self):
         if not hasattr(self, "_resultados_cache") or not self._resultados_cache:
@@ -0,0 +1,180 @@
+"""
+Histograma incremental para matplotlib embebido en Tkinter
+Los datos llegan ya agrupados (conteos y bordes, ver `agrupar`), así el costo
+de dibujar depende del número de barras y no del tamaño de la muestra.
+Las barras son una sola PolyCollection: si los bordes no cambian, solo se
+reescriben las alturas de sus vértices y se redibuja con blitting sobre un
+fondo guardado (ejes, rejilla, título); solo se rehace la figura completa cuando cambian los bordes o la escala.
+Las etiquetas de frecuencia se diezman a `max_etiquetas` como máximo.
+"""
+from typing import Optional, Sequence, Tuple
+import numpy as np
+from matplotlib.collections import PolyCollection
+
+# etiquetas de frecuencia dibujadas como máximo (una cada `paso` barras)
+MAX_ETIQUETAS = 20
+# margen sobre la barra más alta; al superarlo (o quedar muy holgado) se reescala
+MARGEN_Y = 1.12
+# enteros: una barra por valor hasta MAX_BARRAS valores; con rangos mayores
+# (p. ej. Uniforme en 0..1e9) cada barra cubre un intervalo de enteros
+MAX_BARRAS = 1000
+
+def bordes_enteros(inicio: int, fin: int, max_barras: int=MAX_BARRAS) -> np.ndarray:
+    """Bordes en k + 0.5 para los enteros inicio..fin, de ancho entero y a lo sumo max_barras barras."""
+    ancho = -(-(fin - inicio + 1) // max_barras)
+    barras = -(-(fin - inicio + 1) // ancho)
+    return inicio - 0.5 + ancho * np.arange(barras + 1, dtype=float)
+
+def agrupar_tabla(valores, conteo, max_barras: int=MAX_BARRAS):
+    """(conteo, bordes) desde una tabla de enteros distintos ordenados (np.unique,
+    AcumuladorDiscreto.tabla()); el costo depende de los valores distintos, no del rango."""
+    valores = np.asarray(valores)
+    conteo = np.asarray(conteo, dtype=np.int64)
+    if valores.size == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(1)
+    inicio, fin = int(valores[0]), int(valores[-1])
+    bordes = bordes_enteros(inicio, fin, max_barras)
+    if bordes.size - 1 == fin - inicio + 1:
+        barras = np.zeros(fin - inicio + 1, dtype=np.int64)
+        barras[valores - inicio] = conteo
+        return barras, bordes
+    return np.histogram(valores, bins=bordes, weights=conteo)[0].astype(np.int64), bordes
+
+def agrupar(valores, bins: int=10, rango: Optional[Tuple[float, float]]=None):
+    """(conteo, bordes) con np.histogram; enteros con bincount (una barra por valor)
+    o, si el rango supera MAX_BARRAS, por intervalos de enteros."""
+    valores = np.asarray(valores)
+    if valores.size == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(1)
+    if valores.dtype.kind in "iu":
+        inicio, fin = int(valores.min()), int(valores.max())
+        if fin - inicio < MAX_BARRAS:
+            conteo = np.bincount(valores - inicio)
+            return conteo, np.arange(inicio - 0.5, inicio + conteo.size + 0.5)
+        bordes = bordes_enteros(inicio, fin)
+        return np.histogram(valores, bins=bordes)[0], bordes
+    return np.histogram(valores, bins=bins, range=rango)
+
+class HistogramaVivo:
+    """Barras persistentes sobre `ax`; `canvas` es el FigureCanvas que lo contiene."""
+    def __init__(self, ax, canvas, max_etiquetas: int=MAX_ETIQUETAS):
+        self.ax = ax
+        self.canvas = canvas
+        self.max_etiquetas = max_etiquetas
+        self.barras = None
+        self._vertices = None
+        self.etiquetas = []
+        self.indices_etiquetas = np.zeros(0, dtype=np.intp)
+        self.curva = None
+        self.bordes = None
+        self.titulo = None
+        self._fondo = None
+        # el fondo se vuelve a capturar tras cada dibujo completo (incluye redimensionar)
+        canvas.mpl_connect("draw_event", self._al_dibujar)
+
+    def mensaje(self, texto: str):
+        """Deja los ejes vacíos con un texto centrado."""
+        self._reiniciar()
+        self.ax.text(0.5, 0.5, texto, ha="center", va="center", fontsize=12, color="#666666")
+        self.ax.axis("off")
+        self.canvas.draw_idle()
+
+    def mostrar(self, conteo, bordes, titulo: str="", xlabel: str="Valores", ylabel: str="Frecuencia",
+                curva: Optional[Tuple[Sequence, Sequence]]=None, estilo_curva: str="-",
+                ancho: float=0.9, etiqueta_curva: str="Teórica"):
+        """Dibuja o actualiza el histograma. `curva` es (xs, ys) ya escalada a frecuencias."""
+        conteo = np.asarray(conteo)
+        bordes = np.asarray(bordes, dtype=float)
+        if (self.bordes is None or titulo != self.titulo or bordes.shape != self.bordes.shape
+                or not np.array_equal(bordes, self.bordes) or (curva is None) != (self.curva is None)):
+            self._construir(conteo, bordes, titulo, xlabel, ylabel, curva, estilo_curva, ancho, etiqueta_curva)
+            return
+        if curva is not None:
+            self.curva.set_data(*curva)
+        self.actualizar(conteo)
+
+    def actualizar(self, conteo):
+        """Cambia solo las alturas (mismos bordes); usa blitting si la escala sigue sirviendo."""
+        conteo = np.asarray(conteo)
+        # vértices (n, 4, 2): esquinas inf-izq, sup-izq, sup-der, inf-der
+        self._vertices[:, 1:3, 1] = conteo[:, None]
+        self.barras.set_verts(self._vertices)
+        self._poner_etiquetas(conteo)
+        tope = self._tope(conteo)
+        actual = self.ax.get_ylim()[1]
+        if tope > actual or tope < actual / 2 or self._fondo is None:
+            self.ax.set_ylim(0, tope)
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._fondo)
+        self._dibujar_animados()
+        self.canvas.blit(self.ax.bbox)
+
+    # ---------- internos ----------
+    def _reiniciar(self):
+        self.ax.clear()
+        self.barras, self._vertices, self.etiquetas, self.curva = None, None, [], None
+        self.bordes, self.titulo, self._fondo = None, None, None
+
+    def _construir(self, conteo, bordes, titulo, xlabel, ylabel, curva, estilo_curva, ancho, etiqueta_curva):
+        self._reiniciar()
+        self.bordes, self.titulo = bordes, titulo
+        anchos = np.diff(bordes)
+        izq = bordes[:-1] + anchos * (1 - ancho) / 2
+        der = izq + anchos * ancho
+        self._vertices = np.zeros((conteo.size, 4, 2))
+        self._vertices[:, 0:2, 0] = izq[:, None]
+        self._vertices[:, 2:4, 0] = der[:, None]
+        self._vertices[:, 1:3, 1] = conteo[:, None]
+        # barras, etiquetas y curva son "animadas": quedan fuera del fondo y se pintan con draw_artist
+        self.barras = PolyCollection(self._vertices, facecolors="#1f77b4", edgecolors="black",
+                                     linewidths=0.8, animated=True)
+        self.ax.add_collection(self.barras)
+        paso = max(1, -(-conteo.size // self.max_etiquetas))
+        self.indices_etiquetas = np.arange(0, conteo.size, paso)
+        centros = (bordes[:-1] + bordes[1:]) / 2
+        self.etiquetas = [self.ax.text(centros[i], 0, "", ha="center", va="bottom", fontsize=8, animated=True)
+                          for i in self.indices_etiquetas.tolist()]
+        if curva is not None:
+            self.curva, = self.ax.plot(*curva, estilo_curva, color="#d62728", linewidth=2,
+                                       label=etiqueta_curva, animated=True)
+            self.ax.legend(handles=[self.curva], loc="upper right")
+        self._poner_etiquetas(conteo)
+        self.ax.set_xlim(bordes[0] - anchos[0] / 2, bordes[-1] + anchos[-1] / 2)
+        self.ax.set_ylim(0, self._tope(conteo))
+        if titulo:
+            self.ax.set_title(titulo, fontsize=13, fontweight="bold")
+        self.ax.set_xlabel(xlabel); self.ax.set_ylabel(ylabel)
+        self.ax.grid(axis="y", linestyle="--", alpha=0.6)
+        self.canvas.draw_idle()
+
+    def _tope(self, conteo):
+        tope = float(conteo.max()) if conteo.size else 0.0
+        if self.curva is not None:
+            ys = np.asarray(self.curva.get_ydata(), dtype=float)
+            if ys.size:
+                tope = max(tope, float(np.nanmax(ys)))
+        return max(tope, 1.0) * MARGEN_Y
+
+    def _poner_etiquetas(self, conteo):
+        if not self.etiquetas:
+            return
+        alturas = conteo[self.indices_etiquetas]
+        desfase = float(conteo.max()) * 0.01 if conteo.size else 0.0
+        for texto, h in zip(self.etiquetas, alturas.tolist()):
+            texto.set_visible(h >= 1)
+            texto.set_y(h + desfase)
+            texto.set_text(str(int(h)))
+
+    def _dibujar_animados(self):
+        self.ax.draw_artist(self.barras)
+        for artista in self.etiquetas:
+            self.ax.draw_artist(artista)
+        if self.curva is not None:
+            self.ax.draw_artist(self.curva)
+
+    def _al_dibujar(self, evento):
+        if self.barras is None or self.barras.axes is not self.ax:
+            return
+        self._fondo = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._dibujar_animados()
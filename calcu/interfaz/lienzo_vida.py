@@ -0,0 +1,158 @@
+"""
+Dibujo incremental de un tablero 0/1 en un tk.Canvas
+La rejilla (filas + columnas líneas) y un rectángulo por celda se crean una
+sola vez; cada cuadro solo cambia el estado (visible / oculto) de las celdas
+que difieren del cuadro anterior, así el costo es proporcional a los cambios
+y la cantidad de ítems del canvas no crece con las generaciones.
+Con un ítem por celda el canvas deja de ser manejable a partir de unos cientos
+de filas: para tableros grandes ImagenVida dibuja todo en un solo PhotoImage
+(PPM armado con NumPy), reduciendo el tablero por bloques si no cabe en
+MAX_PIXELES (un píxel vivo si hay alguna célula viva en su bloque). Ambos
+tienen la misma interfaz: configurar, colorear, dibujar, celda, ancho y alto.
+"""
+import math
+import tkinter as tk
+import numpy as np
+
+# lado máximo de la imagen en píxeles
+MAX_PIXELES = 1024
+
+class LienzoVida:
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.filas = self.cols = self.tam = 0
+        self._ids = np.zeros((0, 0), dtype=np.int64)
+        self._mostrado = np.zeros((0, 0), dtype=bool)
+
+    def configurar(self, filas: int, cols: int, tam: int, color_viva: str, color_rejilla: str):
+        """Recrea los ítems (solo al cambiar dimensiones o tamaño de celda)."""
+        if (filas, cols, tam) == (self.filas, self.cols, self.tam):
+            return
+        c = self.canvas
+        c.delete("cell", "gridline")
+        self.filas, self.cols, self.tam = filas, cols, tam
+        ids = np.empty((filas, cols), dtype=np.int64)
+        for i in range(filas):
+            y1 = i * tam
+            for j in range(cols):
+                x1 = j * tam
+                ids[i, j] = c.create_rectangle(x1, y1, x1 + tam, y1 + tam, fill=color_viva, width=0,
+                                               state="hidden", tags="cell")
+        self._ids = ids
+        self._mostrado = np.zeros((filas, cols), dtype=bool)
+        # líneas de la cuadrícula por encima de las celdas
+        ancho, alto = cols * tam, filas * tam
+        for i in range(filas + 1):
+            c.create_line(0, i * tam, ancho, i * tam, fill=color_rejilla, tags="gridline")
+        for j in range(cols + 1):
+            c.create_line(j * tam, 0, j * tam, alto, fill=color_rejilla, tags="gridline")
+
+    @property
+    def ancho(self) -> int:
+        return self.cols * self.tam
+
+    @property
+    def alto(self) -> int:
+        return self.filas * self.tam
+
+    def celda(self, x: int, y: int):
+        """(fila, columna) bajo el punto (x, y) del canvas, o None si cae fuera."""
+        i, j = y // self.tam, x // self.tam
+        return (i, j) if 0 <= i < self.filas and 0 <= j < self.cols else None
+
+    def colorear(self, color_viva: str):
+        self.canvas.itemconfigure("cell", fill=color_viva)
+
+    def dibujar(self, tablero: np.ndarray) -> int:
+        """Actualiza solo las celdas que cambiaron; devuelve cuántas."""
+        nuevo = np.asarray(tablero)[:self.filas, :self.cols] != 0
+        cambios = np.flatnonzero(nuevo != self._mostrado)
+        if cambios.size:
+            ids = self._ids.ravel()[cambios].tolist()
+            vivas = nuevo.ravel()[cambios].tolist()
+            config = self.canvas.itemconfigure
+            for item, viva in zip(ids, vivas):
+                config(item, state="normal" if viva else "hidden")
+            self._mostrado = nuevo
+        return int(cambios.size)
+
+def reducir(tablero: np.ndarray, factor: int) -> np.ndarray:
+    """Tablero reducido por bloques factor x factor (True si el bloque tiene alguna viva)."""
+    tablero = np.asarray(tablero)
+    if factor == 1:
+        return tablero != 0
+    filas = np.arange(0, tablero.shape[0], factor)
+    cols = np.arange(0, tablero.shape[1], factor)
+    return np.maximum.reduceat(np.maximum.reduceat(tablero, filas, axis=0), cols, axis=1) != 0
+
+def ppm(vivas: np.ndarray, px: int, color_viva, color_fondo) -> bytes:
+    """Imagen PPM binaria (P6) con px x px píxeles por celda de `vivas`."""
+    paleta = np.array([color_fondo, color_viva], dtype=np.uint8)
+    rgb = paleta[vivas.astype(np.intp)]
+    if px > 1:
+        rgb = rgb.repeat(px, axis=0).repeat(px, axis=1)
+    alto, ancho = rgb.shape[:2]
+    return b"P6 %d %d 255\n" % (ancho, alto) + rgb.tobytes()
+
+class ImagenVida:
+    """Tablero dibujado en un único PhotoImage; sin rejilla. `factor` células por píxel
+    (1 si el tablero cabe en MAX_PIXELES) y `px` píxeles por célula (1 si se reduce)."""
+    def __init__(self, canvas, max_pixeles: int=MAX_PIXELES):
+        self.canvas = canvas
+        self.max_pixeles = max_pixeles
+        self.filas = self.cols = self.tam = 0
+        self.factor = self.px = 1
+        self._imagen = None
+        self._mostrado = None
+
+    def configurar(self, filas: int, cols: int, tam: int, color_viva: str, color_rejilla: str):
+        if (filas, cols, tam) == (self.filas, self.cols, self.tam):
+            return
+        c = self.canvas
+        c.delete("cell", "gridline")
+        self.filas, self.cols, self.tam = filas, cols, tam
+        lado = max(filas, cols)
+        self.px = max(1, min(tam, self.max_pixeles // lado))
+        self.factor = math.ceil(lado / self.max_pixeles) if self.px == 1 else 1
+        self._viva = self._rgb(color_viva)
+        self._imagen = tk.PhotoImage(master=c, width=self.ancho, height=self.alto)
+        c.create_image(0, 0, anchor="nw", image=self._imagen, tags="cell")
+        self._mostrado = None
+
+    @property
+    def ancho(self) -> int:
+        return -(-self.cols // self.factor) * self.px
+
+    @property
+    def alto(self) -> int:
+        return -(-self.filas // self.factor) * self.px
+
+    def _rgb(self, color: str):
+        # winfo_rgb da 16 bits por canal
+        return [v >> 8 for v in self.canvas.winfo_rgb(color)]
+
+    def celda(self, x: int, y: int):
+        """Célula bajo (x, y); reducido, la de la esquina superior izquierda del bloque."""
+        i, j = y // self.px * self.factor, x // self.px * self.factor
+        return (i, j) if 0 <= i < self.filas and 0 <= j < self.cols else None
+
+    def colorear(self, color_viva: str):
+        self._viva = self._rgb(color_viva)
+        if self._mostrado is not None:
+            self._poner(self._mostrado)
+
+    def _poner(self, vivas: np.ndarray):
+        fondo = self._rgb(self.canvas.cget("bg"))
+        self._imagen.configure(data=ppm(vivas, self.px, self._viva, fondo), format="PPM")
+
+    def dibujar(self, tablero: np.ndarray) -> int:
+        """Recompone la imagen si algo cambió; devuelve cuántos píxeles de célula cambiaron."""
+        nuevo = reducir(np.asarray(tablero)[:self.filas, :self.cols], self.factor)
+        if self._mostrado is None:
+            cambios = int(np.count_nonzero(nuevo))
+        else:
+            cambios = int(np.count_nonzero(nuevo != self._mostrado))
+        if cambios or self._mostrado is None:
+            self._poner(nuevo)
+            self._mostrado = nuevo
+        return cambios
@@ -0,0 +1,162 @@
+"""
+Tabla virtual para Tkinter respaldada por arreglos NumPy
+El Treeview tiene siempre las mismas `filas` entradas; al desplazarse solo se
+reescriben sus valores con la ventana visible de los arreglos, así el costo no
+depende de n. Incluye ir a un índice y búsqueda por valor.
+"""
+from decimal import Decimal
+from typing import List, Optional, Sequence
+import tkinter as tk
+from tkinter import ttk
+import numpy as np
+
+# valores revisados por paso al buscar (acota la memoria con memmaps grandes)
+BLOQUE_BUSQUEDA = 1_000_000
+
+class TablaVirtual(ttk.Frame):
+    """columnas: [(encabezado, ancho)]; la primera es el índice 1..n, el resto se llena con set_datos."""
+    def __init__(self, master, columnas: Sequence[tuple], filas: int=12, **kw):
+        super().__init__(master, **kw)
+        self.filas = filas
+        self.inicio = 0
+        self.n = 0
+        self.datos: List[Optional[Sequence]] = []
+        self.formatos: List[str] = []
+        self.nombres = [c[0] for c in columnas]
+
+        barra = ttk.Frame(self)
+        barra.pack(side="top", fill="x")
+        ttk.Label(barra, text="Ir a:").pack(side="left")
+        self.ir_var = tk.StringVar()
+        ent_ir = ttk.Entry(barra, textvariable=self.ir_var, width=10)
+        ent_ir.pack(side="left", padx=(2,6))
+        ent_ir.bind("<Return>", lambda e: self._ir())
+        ttk.Label(barra, text="Buscar:").pack(side="left")
+        self.buscar_var = tk.StringVar()
+        ent_buscar = ttk.Entry(barra, textvariable=self.buscar_var, width=12)
+        ent_buscar.pack(side="left", padx=2)
+        ent_buscar.bind("<Return>", lambda e: self._buscar())
+        self.col_var = tk.StringVar(value=self.nombres[-1])
+        ttk.Combobox(barra, textvariable=self.col_var, values=self.nombres[1:], state="readonly",
+                     width=8).pack(side="left", padx=2)
+        ttk.Button(barra, text="Siguiente", command=self._buscar).pack(side="left", padx=2)
+        self.estado = ttk.Label(barra, text="", foreground="#666666")
+        self.estado.pack(side="left", padx=6)
+
+        cuerpo = ttk.Frame(self)
+        cuerpo.pack(side="top", fill="both", expand=True)
+        self.scroll = ttk.Scrollbar(cuerpo, orient="vertical", command=self._on_scroll)
+        self.scroll.pack(side="right", fill="y")
+        self.tree = ttk.Treeview(cuerpo, columns=self.nombres, show="headings", height=filas, selectmode="browse")
+        for nombre, ancho in columnas:
+            self.tree.heading(nombre, text=nombre)
+            self.tree.column(nombre, width=ancho, anchor="center")
+        self.tree.pack(side="left", fill="both", expand=True)
+        # filas persistentes: nunca se insertan ni borran al desplazarse
+        self.items = [self.tree.insert("", "end", values=[""] * len(self.nombres)) for _ in range(filas)]
+        for evento in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(evento, self._on_rueda)
+        self.tree.bind("<Up>", lambda e: self._mover(-1))
+        self.tree.bind("<Down>", lambda e: self._mover(1))
+        self.tree.bind("<Prior>", lambda e: self._mover(-self.filas))
+        self.tree.bind("<Next>", lambda e: self._mover(self.filas))
+        self._refrescar()
+
+    # ------------------ datos ------------------
+    def set_datos(self, columnas: Sequence[Optional[Sequence]], formatos: Sequence[str]):
+        """Un arreglo (o None = columna vacía) por cada columna después del índice."""
+        largos = [len(c) for c in columnas if c is not None]
+        self.n = min(largos) if largos else 0
+        self.datos = list(columnas)
+        self.formatos = list(formatos)
+        self.inicio = 0
+        self.estado.config(text=f"{self.n} filas")
+        self._refrescar()
+
+    def limpiar(self):
+        self.set_datos([], [])
+
+    # ------------------ navegación ------------------
+    def ir_a(self, indice: int, seleccionar: bool=True):
+        """Muestra la fila `indice` (base 0) en la primera posición visible."""
+        indice = max(0, min(int(indice), self.n - 1))
+        self.inicio = max(0, min(indice, self.n - self.filas))
+        self._refrescar()
+        if seleccionar and self.n:
+            self.tree.selection_set(self.items[indice - self.inicio])
+
+    def _ir(self):
+        try:
+            self.ir_a(int(self.ir_var.get()) - 1)
+        except ValueError:
+            self.estado.config(text="Índice inválido")
+
+    def buscar(self, texto: str, columna: int, desde: int=0) -> Optional[int]:
+        """Primer índice >= desde cuyo valor, redondeado como `texto`, coincide con él."""
+        datos = self.datos[columna] if columna < len(self.datos) else None
+        if datos is None:
+            return None
+        objetivo = float(texto)
+        # decimales del valor escrito: "0.125" -> 3, "1e-3" -> 3, "2.5e-4" -> 5 ("inf" / "nan": 0)
+        exponente = Decimal(texto).as_tuple().exponent
+        decimales = max(0, -exponente) if isinstance(exponente, int) else 0
+        tolerancia = 0.5 * 10.0 ** (-decimales)
+        for ini in range(desde, self.n, BLOQUE_BUSQUEDA):
+            bloque = np.asarray(datos[ini:ini + BLOQUE_BUSQUEDA], dtype=float)
+            hallados = np.flatnonzero(np.abs(bloque - objetivo) < tolerancia)
+            if hallados.size:
+                return ini + int(hallados[0])
+        return None
+
+    def _buscar(self):
+        texto = self.buscar_var.get().strip()
+        if not texto or self.n == 0:
+            return
+        sel = self.tree.selection()
+        desde = self.inicio + self.items.index(sel[0]) + 1 if sel else 0
+        try:
+            pos = self.buscar(texto, self.nombres.index(self.col_var.get()) - 1, desde)
+        except ValueError:
+            self.estado.config(text="Valor inválido")
+            return
+        if pos is None:
+            self.estado.config(text="Sin coincidencias")
+        else:
+            self.ir_a(pos)
+            self.estado.config(text=f"Fila {pos + 1} de {self.n}")
+
+    def _mover(self, filas: int):
+        self.inicio = max(0, min(self.inicio + filas, self.n - self.filas))
+        self._refrescar()
+        return "break"
+
+    def _on_rueda(self, event):
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            return self._mover(-3)
+        return self._mover(3)
+
+    def _on_scroll(self, accion, cantidad, unidad=None):
+        if accion == "moveto":
+            self.inicio = int(float(cantidad) * self.n)
+            self._mover(0)
+        elif accion == "scroll":
+            paso = self.filas if unidad == "pages" else 1
+            self._mover(int(cantidad) * paso)
+
+    # ------------------ dibujo ------------------
+    def _refrescar(self):
+        self.inicio = max(0, self.inicio)
+        fin = min(self.n, self.inicio + self.filas)
+        ventana = [None if c is None else c[self.inicio:fin] for c in self.datos]
+        for k, item in enumerate(self.items):
+            i = self.inicio + k
+            if i < fin:
+                valores = [i + 1] + ["" if col is None else fmt.format(col[k])
+                                     for col, fmt in zip(ventana, self.formatos)]
+            else:
+                valores = [""] * len(self.nombres)
+            self.tree.item(item, values=valores)
+        if self.n:
+            self.scroll.set(self.inicio / self.n, fin / self.n)
+        else:
+            self.scroll.set(0.0, 1.0)
@@ -0,0 +1,175 @@
+"""
+Ejecución de trabajos en segundo plano para las ventanas Tkinter
+Los trabajos corren en un pool de hilos (o de procesos) fuera del bucle de Tk.
+La ventana sondea con `after` el progreso y el estado, y los resultados se
+entregan por callbacks en el hilo principal, así la interfaz no se congela.
+Un callback que lanza se informa (traceback en stderr, como hace Tk) sin
+cortar el sondeo ni la entrega a las demás tareas.
+La cancelación es cooperativa: el trabajo llama a tarea.reportar(), que lanza
+Cancelado si el usuario pidió cancelar.
+"""
+from typing import Callable, Optional
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future
+import multiprocessing
+import threading
+import traceback
+from tkinter import ttk
+
+class Cancelado(Exception):
+    """El usuario canceló el trabajo."""
+
+class Tarea:
+    def __init__(self, descripcion: str=""):
+        self.descripcion = descripcion
+        self.progreso: Optional[float] = None
+        self.parcial = None
+        self._version_parcial = 0
+        self._version_entregada = 0
+        self._cancelar = threading.Event()
+        self.futuro: Optional[Future] = None
+
+    @property
+    def cancelada(self) -> bool:
+        return self._cancelar.is_set()
+
+    def cancelar(self):
+        self._cancelar.set()
+        if self.futuro is not None:
+            self.futuro.cancel()
+
+    def reportar(self, hecho: float, total: float=1.0):
+        """Actualiza el progreso (0..1) y corta el trabajo si fue cancelado."""
+        if self._cancelar.is_set():
+            raise Cancelado()
+        self.progreso = hecho / total if total else None
+
+    def publicar(self, parcial):
+        """Deja un resultado intermedio para que la ventana lo muestre en el próximo sondeo."""
+        self.parcial = parcial
+        self._version_parcial += 1
+
+class EjecutorTareas:
+    """Pool compartido por una ventana. `widget` es cualquier widget Tk (para `after`)."""
+    def __init__(self, widget, intervalo_ms: int=100, hilos: int=2, procesos: int=0):
+        self.widget = widget
+        self.intervalo_ms = intervalo_ms
+        self._hilos = ThreadPoolExecutor(max_workers=hilos)
+        # spawn: los procesos no heredan el estado de Tk
+        self._procesos = (ProcessPoolExecutor(max_workers=procesos, mp_context=multiprocessing.get_context("spawn"))
+                          if procesos else None)
+        self._activas = []
+        self._oyentes = []
+        self._sondeando = False
+
+    def ejecutar(self, funcion: Callable, *args, descripcion: str="", al_terminar: Callable=None,
+                 al_error: Callable=None, al_parcial: Callable=None, en_proceso: bool=False, **kwargs) -> Tarea:
+        """Con hilos, `funcion` recibe la Tarea como primer argumento (para reportar).
+        Con en_proceso=True recibe solo *args y cancelar descarta el resultado.
+        `al_parcial(dato)` recibe en el hilo de Tk lo último que el trabajo pasó a tarea.publicar()."""
+        tarea = Tarea(descripcion)
+        if en_proceso and self._procesos is not None:
+            tarea.futuro = self._procesos.submit(funcion, *args, **kwargs)
+        else:
+            tarea.futuro = self._hilos.submit(funcion, tarea, *args, **kwargs)
+        self._activas.append((tarea, al_terminar, al_error, al_parcial))
+        self._notificar()
+        if not self._sondeando:
+            self._sondeando = True
+            self.widget.after(self.intervalo_ms, self._sondear)
+        return tarea
+
+    def ocupado(self) -> bool:
+        return bool(self._activas)
+
+    def cancelar_todo(self):
+        for tarea, *_ in self._activas:
+            tarea.cancelar()
+
+    def suscribir(self, oyente: Callable):
+        """oyente(tareas_activas) se llama en el hilo de Tk en cada sondeo."""
+        self._oyentes.append(oyente)
+
+    def cerrar(self):
+        self.cancelar_todo()
+        self._hilos.shutdown(wait=False, cancel_futures=True)
+        if self._procesos is not None:
+            self._procesos.shutdown(wait=False, cancel_futures=True)
+
+    def _notificar(self):
+        activas = [t for t, *_ in self._activas]
+        for oyente in self._oyentes:
+            oyente(activas)
+
+    @staticmethod
+    def _llamar(callback: Callable, *args):
+        try:
+            callback(*args)
+        except Exception:
+            traceback.print_exc()
+
+    def _sondear(self):
+        try:
+            pendientes = []
+            terminadas = []
+            for entrada in self._activas:
+                (pendientes if not entrada[0].futuro.done() else terminadas).append(entrada)
+            self._activas = pendientes
+            self._llamar(self._notificar)
+            for tarea, _, _, al_parcial in pendientes:
+                if al_parcial is not None and tarea._version_parcial != tarea._version_entregada:
+                    tarea._version_entregada = tarea._version_parcial
+                    self._llamar(al_parcial, tarea.parcial)
+            for tarea, al_terminar, al_error, _ in terminadas:
+                if tarea.cancelada or tarea.futuro.cancelled():
+                    continue
+                error = tarea.futuro.exception()
+                if error is None:
+                    if al_terminar is not None:
+                        self._llamar(al_terminar, tarea.futuro.result())
+                elif isinstance(error, Cancelado):
+                    continue
+                elif al_error is not None:
+                    self._llamar(al_error, error)
+        finally:
+            # siempre se reprograma (o se libera) el sondeo, aunque algo haya fallado
+            if self._activas:
+                self.widget.after(self.intervalo_ms, self._sondear)
+            else:
+                self._sondeando = False
+
+class BarraTareas(ttk.Frame):
+    """Barra de estado con progreso y botón Cancelar ligada a un EjecutorTareas."""
+    def __init__(self, master, ejecutor: EjecutorTareas, **kw):
+        super().__init__(master, **kw)
+        self.ejecutor = ejecutor
+        self.etiqueta = ttk.Label(self, text="Listo", foreground="#666666")
+        self.etiqueta.pack(side="left", padx=(0,6))
+        self.barra = ttk.Progressbar(self, length=180, mode="determinate", maximum=1.0)
+        self.barra.pack(side="left", fill="x", expand=True)
+        self.btn = ttk.Button(self, text="Cancelar", command=ejecutor.cancelar_todo, state="disabled")
+        self.btn.pack(side="left", padx=(6,0))
+        self._indeterminada = False
+        ejecutor.suscribir(self._actualizar)
+
+    def _actualizar(self, activas):
+        if not activas:
+            if self._indeterminada:
+                self.barra.stop()
+                self._indeterminada = False
+            self.barra.config(mode="determinate", value=0.0)
+            self.etiqueta.config(text="Listo")
+            self.btn.config(state="disabled")
+            return
+        tarea = activas[0]
+        self.etiqueta.config(text=(tarea.descripcion or "Trabajando") + "...")
+        self.btn.config(state="normal")
+        if tarea.progreso is None:
+            if not self._indeterminada:
+                self.barra.config(mode="indeterminate")
+                self.barra.start(15)
+                self._indeterminada = True
+        else:
+            if self._indeterminada:
+                self.barra.stop()
+                self._indeterminada = False
+            self.barra.config(mode="determinate", value=tarea.progreso)
@@ -10,9 +10,21 @@ Se mantiene la detección de "esquina alcanzada" y el comportamiento
 original.
 """
 import tkinter as tk
-from tkinter import ttk, messagebox, colorchooser
-import random
+from tkinter import ttk, messagebox, colorchooser, filedialog
 import math
+import numpy as np
+
+from vida.motores import MOTORES, MOTORES_GRANDES, crear_motor
+from vida.reglas import REGLAS, BORDES
+from vida.simulador import Simulador, FPS
+from vida.historia import Historia
+from vida.patrones import cargar_patron, guardar_patron, TIPOS_ARCHIVO
+from interfaz.lienzo_vida import LienzoVida, ImagenVida
+
+# lado máximo dibujando un ítem del canvas por célula; más grande se dibuja como imagen
+LADO_CELDAS = 200
+# Bits y Hashlife llegan a LADO_GRANDE; los motores de un byte por célula, a LADO_CELDAS
+LADO_GRANDE = 10_000
 
 class GameOfLifeUI:
     def __init__(self, root,
@@ -26,13 +38,22 @@ class GameOfLifeUI:
         self.cell_size = cell_size
         self.init_prob = init_prob
         self.running = False
-        self.generation = 0
         self.alive_color = "#111111"
         self.bg_color = "#d0ebff"
         self.grid_color = "#c0c0c0"
 
-        # Estado de la cuadrícula (0/1)
-        self.grid = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
+        # Estado de la cuadrícula (0/1): lo guarda el motor elegido (NumPy uint8 o bits uint64)
+        self.backend_var = tk.StringVar(value=next(iter(MOTORES)))
+        # regla B/S (nombre de REGLAS o texto como "B36/S23") y borde del tablero
+        self.rule_var = tk.StringVar(value=next(iter(REGLAS)))
+        self.edge_var = tk.StringVar(value=BORDES[0])
+        # la simulación corre en su propio hilo; la ventana dibuja a FPS fijos
+        self.sim = Simulador(crear_motor(self.backend_var.get(), np.zeros((self.rows, self.cols), dtype=np.uint8),
+                                         self.rule_var.get(), self.edge_var.get()),
+                             parar_si=lambda motor: self._check_corner_hit())
+        # deltas XOR entre generaciones para retroceder / repetir
+        self.history = Historia()
+        self.sim.historia = self.history
 
         # Layout: izquierdo controles, derecho canvas
         self.main_frame = ttk.Frame(root, padding=8)
@@ -52,13 +73,13 @@ class GameOfLifeUI:
         rc_frame.pack(fill="x", pady=4)
         ttk.Label(rc_frame, text="Filas:").grid(row=0, column=0, sticky="w")
         self.rows_var = tk.IntVar(value=self.rows)
-        self.rows_sb = ttk.Spinbox(rc_frame, from_=5, to=200, textvariable=self.rows_var, width=7,
+        self.rows_sb = ttk.Spinbox(rc_frame, from_=5, to=LADO_GRANDE, textvariable=self.rows_var, width=7,
                                    command=self._apply_size_change)
         self.rows_sb.grid(row=0, column=1, padx=6)
 
         ttk.Label(rc_frame, text="Columnas:").grid(row=1, column=0, sticky="w")
         self.cols_var = tk.IntVar(value=self.cols)
-        self.cols_sb = ttk.Spinbox(rc_frame, from_=5, to=200, textvariable=self.cols_var, width=7,
+        self.cols_sb = ttk.Spinbox(rc_frame, from_=5, to=LADO_GRANDE, textvariable=self.cols_var, width=7,
                                    command=self._apply_size_change)
         self.cols_sb.grid(row=1, column=1, padx=6)
 
@@ -81,6 +102,29 @@ class GameOfLifeUI:
         self.speed_scale = ttk.Scale(self.controls_frame, from_=50, to=1000, orient="horizontal",
                                      variable=self.speed_var)
         self.speed_scale.pack(fill="x", pady=4)
+        # turbo: sin pausa entre generaciones, tan rápido como permita el motor
+        self.turbo_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.controls_frame, text="Turbo", variable=self.turbo_var).pack(anchor="w")
+
+        # Motor de simulación
+        ttk.Label(self.controls_frame, text="Motor:").pack(anchor="w", pady=(8,0))
+        self.backend_cb = ttk.Combobox(self.controls_frame, textvariable=self.backend_var, values=list(MOTORES),
+                                       state="readonly", width=14)
+        self.backend_cb.pack(pady=4)
+        self.backend_cb.bind("<<ComboboxSelected>>", self._change_backend)
+
+        # Regla y borde (se compilan en la tabla que usa el motor)
+        rule = ttk.Frame(self.controls_frame)
+        rule.pack(fill="x", pady=(8,0))
+        ttk.Label(rule, text="Regla:").grid(row=0, column=0, sticky="w")
+        self.rule_cb = ttk.Combobox(rule, textvariable=self.rule_var, values=list(REGLAS), width=14)
+        self.rule_cb.grid(row=0, column=1, padx=6)
+        self.rule_cb.bind("<<ComboboxSelected>>", self._change_backend)
+        self.rule_cb.bind("<Return>", self._change_backend)
+        ttk.Label(rule, text="Borde:").grid(row=1, column=0, sticky="w")
+        self.edge_cb = ttk.Combobox(rule, textvariable=self.edge_var, values=list(BORDES), state="readonly", width=14)
+        self.edge_cb.grid(row=1, column=1, padx=6, pady=(4,0))
+        self.edge_cb.bind("<<ComboboxSelected>>", self._change_backend)
 
         # Color alive
         cframe = ttk.Frame(self.controls_frame)
@@ -102,6 +146,15 @@ class GameOfLifeUI:
         self.clear_btn = ttk.Button(btns, text="✖ Limpiar", command=self.clear)
         self.clear_btn.grid(row=1, column=1, padx=4, pady=4)
 
+        # Saltar N generaciones (con Hashlife los saltos grandes cuestan poco)
+        jump = ttk.Frame(self.controls_frame)
+        jump.pack(fill="x", pady=(6,0))
+        ttk.Label(jump, text="Saltar:").grid(row=0, column=0, sticky="w")
+        self.jump_var = tk.StringVar(value="1000")
+        ttk.Entry(jump, textvariable=self.jump_var, width=10).grid(row=0, column=1, padx=4)
+        self.jump_btn = ttk.Button(jump, text="⏭ Gen.", command=self.jump)
+        self.jump_btn.grid(row=0, column=2)
+
         # Aleatorizar y reiniciar
         extras = ttk.Frame(self.controls_frame)
         extras.pack(pady=(6,8))
@@ -110,6 +163,18 @@ class GameOfLifeUI:
         self.restart_btn = ttk.Button(extras, text="↺ Reiniciar", command=self.reset)
         self.restart_btn.grid(row=0, column=1, padx=4)
 
+        # Historia (retroceder / repetir lo ya simulado) y patrones (RLE / binario)
+        hist = ttk.Frame(self.controls_frame)
+        hist.pack(pady=(0,6))
+        self.back_btn = ttk.Button(hist, text="⏪ Atrás", command=self.rewind)
+        self.back_btn.grid(row=0, column=0, padx=4)
+        self.fwd_btn = ttk.Button(hist, text="⏩ Adelante", command=self.replay)
+        self.fwd_btn.grid(row=0, column=1, padx=4)
+        self.open_btn = ttk.Button(hist, text="📂 Abrir patrón", command=self.load_pattern)
+        self.open_btn.grid(row=1, column=0, padx=4, pady=(4,0))
+        self.save_btn = ttk.Button(hist, text="💾 Guardar patrón", command=self.save_pattern)
+        self.save_btn.grid(row=1, column=1, padx=4, pady=(4,0))
+
         # Información / estadísticas
         info = ttk.Frame(self.controls_frame)
         info.pack(fill="x", pady=(8,0))
@@ -117,11 +182,17 @@ class GameOfLifeUI:
         self.gen_label.pack(anchor="w")
         self.count_label = ttk.Label(info, text="Células vivas: 0")
         self.count_label.pack(anchor="w")
+        self.rate_label = ttk.Label(info, text="Gen/s: 0")
+        self.rate_label.pack(anchor="w")
+        self.hist_label = ttk.Label(info, text="Historia: 1/1")
+        self.hist_label.pack(anchor="w")
 
         # Canvas para la cuadrícula
         self.canvas = tk.Canvas(self.canvas_frame, bg=self.bg_color)
         self.canvas.pack(fill="both", expand=True)
         self.canvas.bind("<Button-1>", self._on_canvas_click)
+        # ítems persistentes: una celda por rectángulo, solo se cambia su visibilidad
+        self.lienzo = LienzoVida(self.canvas)
 
         # Resizable behavior
         self.canvas_frame.bind("<Configure>", self._on_canvas_resize)
@@ -140,43 +211,97 @@ class GameOfLifeUI:
         except Exception:
             return
         new_cell = int(self.cell_var.get())
-        # límites razonables para evitar canvas gigantes
-        max_dim = max(5, min(200, new_rows))
-        max_c = max(5, min(200, new_cols))
+        # límites razonables para evitar canvas gigantes (según el motor)
+        side = self._max_side()
+        max_dim = max(5, min(side, new_rows))
+        max_c = max(5, min(side, new_cols))
         self.rows, self.cols = max_dim, max_c
         self.cell_size = max(6, min(100, new_cell))
-        self._rebuild_grid_struct()
-        self._draw_grid()
+        with self.sim.pausa():
+            self._rebuild_grid_struct()
+            self._draw_grid()
 
     def _choose_alive_color(self):
         c = colorchooser.askcolor(title="Elige color para células vivas", initialcolor=self.alive_color)
         if c and c[1]:
             self.alive_color = c[1]
-            self._draw_grid()
+            self.lienzo.colorear(self.alive_color)
 
     def _reset_colors(self):
         self.alive_color = "#111111"
         self.bg_color = "#d0ebff"
         self.canvas.configure(bg=self.bg_color)
-        self._draw_grid()
+        self.lienzo.colorear(self.alive_color)
+
+    def _change_backend(self, event=None):
+        # mismo tablero, otro motor / regla / borde
+        with self.sim.pausa():
+            try:
+                if max(self.rows, self.cols) > self._max_side():
+                    raise ValueError(f"El motor {self.backend_var.get()} admite tableros de hasta "
+                                     f"{LADO_CELDAS}x{LADO_CELDAS}; para más use {' o '.join(MOTORES_GRANDES)}.")
+                self._set_grid(self.grid)
+            except ValueError as e:
+                messagebox.showerror("Juego de la Vida", str(e))
+                # volver a lo que usa el motor actual
+                self.backend_var.set(self.motor.nombre)
+                self.rule_var.set(self.motor.regla.texto)
+                self.edge_var.set(self.motor.borde)
+
+    def _max_side(self):
+        return LADO_GRANDE if self.backend_var.get() in MOTORES_GRANDES else LADO_CELDAS
 
     def _on_canvas_resize(self, event):
-        # redraw para adaptarse al nuevo tamaño
+        # los ítems no dependen del tamaño de la ventana: solo se refrescan las celdas
         self._draw_grid()
 
     # ------------------ lógica de la cuadrícula ------------------
+    # mientras la simulación corre, el motor solo se toca dentro de self.sim.pausa()
+    @property
+    def motor(self):
+        return self.sim.motor
+
+    @property
+    def generation(self):
+        return self.sim.generacion
+
+    @generation.setter
+    def generation(self, value):
+        self.sim.generacion = value
+
+    @property
+    def grid(self):
+        # tablero (rows x cols) uint8 del motor, solo lectura (con bits es una copia)
+        return self.motor.tablero
+
+    def _set_grid(self, board):
+        old = self.sim.motor
+        # el motor paralelo recibe el tablero en su memoria compartida sin relanzar los procesos
+        if (hasattr(old, "cargar") and old.nombre == self.backend_var.get()
+                and (old.filas, old.cols) == np.shape(board)):
+            old.cargar(board, self.rule_var.get(), self.edge_var.get())
+            return
+        self.sim.motor = crear_motor(self.backend_var.get(), board, self.rule_var.get(), self.edge_var.get())
+        # el motor paralelo tiene procesos y memoria compartida que liberar
+        if hasattr(old, "cerrar"):
+            old.cerrar()
+
     def _rebuild_grid_struct(self):
         # Asegura que self.grid tenga el tamaño (rows x cols)
-        new_grid = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
+        new_grid = np.zeros((self.rows, self.cols), dtype=np.uint8)
         # Copiar lo que quepa de la vieja cuadrícula
-        for i in range(min(self.rows, len(self.grid))):
-            for j in range(min(self.cols, len(self.grid[0]) if self.grid else 0)):
-                new_grid[i][j] = self.grid[i][j]
-        self.grid = new_grid
+        old = self.grid
+        r, c = min(self.rows, old.shape[0]), min(self.cols, old.shape[1])
+        new_grid[:r, :c] = old[:r, :c]
+        self._set_grid(new_grid)
+        self.history.reiniciar(self.grid, self.generation)
+        # celda a celda hasta LADO_CELDAS; más grande, una sola imagen (reducida si no cabe)
+        renderer = LienzoVida if max(self.rows, self.cols) <= LADO_CELDAS else ImagenVida
+        if not isinstance(self.lienzo, renderer):
+            self.lienzo = renderer(self.canvas)
+        self.lienzo.configurar(self.rows, self.cols, self.cell_size, self.alive_color, self.grid_color)
         # ajustar tamaño del canvas
-        width = self.cols * self.cell_size
-        height = self.rows * self.cell_size
-        self.canvas.config(width=width, height=height)
+        self.canvas.config(width=self.lienzo.ancho, height=self.lienzo.alto)
 
     def randomize_grid(self):
         try:
@@ -184,114 +309,201 @@ class GameOfLifeUI:
         except Exception:
             p = self.init_prob
             self.prob_var.set(p)
-        for i in range(self.rows):
-            for j in range(self.cols):
-                self.grid[i][j] = 1 if random.random() < p else 0
-        self.generation = 0
-        self._update_info()
+        with self.sim.pausa():
+            self._set_grid((np.random.random((self.rows, self.cols)) < p).astype(np.uint8))
+            self.generation = 0
+            self.history.reiniciar(self.grid, 0)
+            self._update_info()
 
     def clear(self):
-        self.running = False
-        self.grid = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
+        self.stop()
+        self._set_grid(np.zeros((self.rows, self.cols), dtype=np.uint8))
         self.generation = 0
+        self.history.reiniciar(self.grid, 0)
         self._draw_grid()
         self._update_info()
 
     def reset(self):
-        self.running = False
+        self.stop()
         self._rebuild_grid_struct()
         self.randomize_grid()
         self._draw_grid()
 
     def _on_canvas_click(self, event):
-        col = event.x // self.cell_size
-        row = event.y // self.cell_size
-        if 0 <= row < self.rows and 0 <= col < self.cols:
-            self.grid[row][col] = 1 - self.grid[row][col]
-            self._draw_grid()
-            self._update_info()
+        # con la imagen reducida se alterna la célula de la esquina del bloque
+        cell = self.lienzo.celda(event.x, event.y)
+        if cell is not None:
+            row, col = cell
+            with self.sim.pausa():
+                self.motor.alternar(row, col)
+                self.history.registrar(self.grid, self.generation)
+                self._draw_grid()
 
     def _draw_grid(self):
-        self.canvas.delete("cell")
-        alive_count = 0
-        for i in range(self.rows):
-            for j in range(self.cols):
-                x1 = j * self.cell_size
-                y1 = i * self.cell_size
-                x2 = x1 + self.cell_size
-                y2 = y1 + self.cell_size
-                if self.grid[i][j] == 1:
-                    alive_count += 1
-                    self.canvas.create_rectangle(x1, y1, x2, y2, fill=self.alive_color,
-                                                 width=0, tags=("cell", "alive"))
-                else:
-                    # Solo para mantener fondo uniforme; no se dibuja rect para 0
-                    pass
-                # línea de la cuadrícula (delgada)
-                self.canvas.create_rectangle(x1, y1, x2, y2, outline=self.grid_color, width=1, tags="gridline")
-        self._update_info(alive_count)
-
-    def _update_info(self, alive_count=None):
+        # con la simulación corriendo dibuja _render (desde la instantánea)
+        if self.sim.corriendo:
+            return
+        # solo cambian las celdas que difieren del cuadro anterior
+        self.lienzo.dibujar(self.grid)
+        self._update_info()
+
+    def _update_info(self, alive_count=None, generation=None):
         if alive_count is None:
-            alive_count = sum(sum(row) for row in self.grid)
-        self.gen_label.config(text=f"Generación: {self.generation}")
+            # el motor lleva la población (el de teselas activas la actualiza en cada paso)
+            alive_count = self.motor.poblacion()
+        if generation is None:
+            generation = self.generation
+        self.gen_label.config(text=f"Generación: {generation}")
         self.count_label.config(text=f"Células vivas: {alive_count}")
+        # el hilo de simulación puede estar registrando: leer todo junto bajo el candado
+        posicion, estados, usados = self.history.resumen()
+        self.hist_label.config(text=f"Historia: {posicion + 1}/{estados} ({usados / 1024:,.0f} KB)")
 
     # ------------------ motor del juego ------------------
     def start(self):
         if not self.running:
             self.running = True
-            self._run()
+            self._sync_speed()
+            self.sim.iniciar()
+            self._render()
 
     def stop(self):
         self.running = False
+        self.sim.detener()
+        self._draw_grid()
 
     def step_once(self):
         # Ejecuta una sola iteración
-        self._iterate()
+        with self.sim.pausa():
+            self._iterate()
+            self.history.registrar(self.grid, self.generation)
+            self._draw_grid()
+
+    def jump(self):
+        # Avanza N generaciones de una vez y dibuja solo el resultado
+        try:
+            n = int(self.jump_var.get())
+            if n < 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Saltar", "N debe ser un entero >= 0.")
+            return
+        # el salto corre en el hilo de simulación; _render sigue el avance y dibuja el final
+        self.stop()
+        self.running = True
+        self.sim.saltar(n)
+        self._render()
+
+    def rewind(self):
+        self._travel(self.history.atras)
+
+    def replay(self):
+        self._travel(self.history.adelante)
+
+    def _travel(self, move):
+        # recorre estados ya registrados sin simular; al reanudar se descarta lo posterior
+        self.stop()
+        state = move()
+        if state is None:
+            return
+        board, self.generation = state
+        self._set_grid(board)
         self._draw_grid()
 
-    def _run(self):
+    # ------------------ patrones ------------------
+    def load_pattern(self):
+        path = filedialog.askopenfilename(title="Abrir patrón", filetypes=TIPOS_ARCHIVO)
+        if not path:
+            return
+        self.stop()
+        try:
+            board, rule = cargar_patron(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Abrir patrón", str(e))
+            return
+        rows, cols = board.shape
+        side = self._max_side()
+        if rows > side or cols > side:
+            hint = "" if side == LADO_GRANDE else f" {' y '.join(MOTORES_GRANDES)} admiten hasta {LADO_GRANDE}x{LADO_GRANDE}."
+            messagebox.showwarning("Abrir patrón", f"El patrón ({rows}x{cols}) supera el máximo del motor "
+                                   f"({side}x{side}); se muestra recortado.{hint}")
+            board = board[:side, :side]
+            rows, cols = board.shape
+        # el tablero crece si hace falta y el patrón queda centrado
+        self.rows, self.cols = max(self.rows, rows), max(self.cols, cols)
+        self.rows_var.set(self.rows)
+        self.cols_var.set(self.cols)
+        new_grid = np.zeros((self.rows, self.cols), dtype=np.uint8)
+        i0, j0 = (self.rows - rows) // 2, (self.cols - cols) // 2
+        new_grid[i0:i0+rows, j0:j0+cols] = board
+        self.generation = 0
+        self._rebuild_grid_struct()
+        old_rule = self.rule_var.get()
+        if rule:
+            self.rule_var.set(rule)
+        try:
+            self._set_grid(new_grid)
+        except ValueError as e:
+            self.rule_var.set(old_rule)
+            self._set_grid(new_grid)
+            messagebox.showwarning("Abrir patrón", f"Se ignora la regla del archivo:\n{e}")
+        self.history.reiniciar(self.grid, 0)
+        self._draw_grid()
+
+    def save_pattern(self):
+        path = filedialog.asksaveasfilename(title="Guardar patrón", defaultextension=".rle",
+                                            filetypes=TIPOS_ARCHIVO)
+        if not path:
+            return
+        with self.sim.pausa():
+            board = np.array(self.grid, dtype=np.uint8)
+            rule = self.motor.regla.texto
+        try:
+            guardar_patron(path, board, rule)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Guardar patrón", str(e))
+
+    def _sync_speed(self):
+        self.sim.turbo = bool(self.turbo_var.get())
+        self.sim.retardo = max(10, int(self.speed_var.get())) / 1000
+
+    def _render(self):
+        # cuadro a FPS fijos con la última instantánea del hilo de simulación
         if not self.running:
             return
-        self._iterate()
+        sim = self.sim
+        self._sync_speed()
+        if sim.instantanea is not None:
+            board, generation, alive = sim.instantanea
+            self.lienzo.dibujar(board)
+            self._update_info(alive, generation)
+        self.rate_label.config(text=f"Gen/s: {sim.gen_por_segundo():,.0f}")
+        if sim.corriendo:
+            self.root.after(1000 // FPS, self._render)
+            return
+        # el hilo terminó solo: fin del salto, esquina alcanzada o error del motor
+        self.running = False
         self._draw_grid()
-        # detectar esquinas alcanzadas
-        if self._check_corner_hit():
-            self.running = False
+        if sim.error is not None:
+            messagebox.showerror("Juego de la Vida", f"Error en la simulación:\n{sim.error}")
+        elif sim.detenido_por_condicion:
             if messagebox.askyesno("Esquina alcanzada", "¡Una célula llegó a la esquina!\n¿Desea reiniciar?"):
                 self.reset()
-        else:
-            delay = max(10, int(self.speed_var.get()))
-            self.root.after(delay, self._run)
 
     def _iterate(self):
-        new_grid = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
-        for i in range(self.rows):
-            for j in range(self.cols):
-                alive_neighbors = self._count_neighbors(i, j)
-                if self.grid[i][j] == 1:
-                    new_grid[i][j] = 1 if alive_neighbors in (2, 3) else 0
-                else:
-                    new_grid[i][j] = 1 if alive_neighbors == 3 else 0
-        self.grid = new_grid
+        # motor vectorizado (vida/motores.py) con la regla y el borde elegidos
+        self.motor.paso()
         self.generation += 1
 
-    def _count_neighbors(self, i, j):
-        count = 0
-        for di in (-1, 0, 1):
-            for dj in (-1, 0, 1):
-                if di == 0 and dj == 0:
-                    continue
-                ni, nj = i + di, j + dj
-                if 0 <= ni < self.rows and 0 <= nj < self.cols:
-                    count += self.grid[ni][nj]
-        return count
-
     def _check_corner_hit(self):
         corners = [(0, 0), (0, self.cols - 1), (self.rows - 1, 0), (self.rows - 1, self.cols - 1)]
+        # Bits y Hashlife leen las cuatro celdas sin sacar el tablero entero
+        cell = getattr(self.motor, "celda", None)
+        if cell is None:
+            grid = self.grid
+            cell = lambda i, j: grid[i][j]
         for (i, j) in corners:
-            if self.grid[i][j] == 1:
+            if cell(i, j) == 1:
                 return True
         return False
 
@@ -0,0 +1,197 @@
+"""
+Prueba de bondad de ajuste de variables generadas contra la distribución teórica
+Discretas: Chi-cuadrado contra la PMF exacta (con soportes enormes, p. ej.
+Uniforme en 0..1e9, contra intervalos de igual probabilidad calculados con la CDF).
+Continuas: Kolmogorov-Smirnov contra la CDF implícita en cada rama de generar_muestras.
+Ambas trabajan sobre conteos, así que aceptan muestras acumuladas por bloques.
+"""
+from typing import Dict, Any, Tuple
+import math
+import numpy as np
+from scipy import stats
+
+from simulacion.tabla_guia import guia_binomial, guia_poisson
+from simulacion.alias import parsear_tabla
+
+# resolución de los valores de generar_muestras (redondeo a 2 decimales)
+RESOLUCION = 0.01
+# tope de celdas de la malla KS; si se supera se usa una malla más gruesa
+MAX_CELDAS_KS = 2_000_000
+# soportes más grandes no se recorren valor por valor: χ² sobre INTERVALOS_CHI2 intervalos
+MAX_CATEGORIAS = 100_000
+INTERVALOS_CHI2 = 1000
+
+def distribucion_continua(dist: str, params: Dict[str, Any]):
+    """Distribución scipy equivalente a cada rama (con sus parametrizaciones propias)."""
+    if dist == "Uniforme":
+        a, b = float(params["p1"]), float(params["p2"])
+        return stats.uniform(loc=a, scale=b - a)
+    if dist == "k-Erlang":
+        k, theta = float(params["p1"]), float(params["p2"])
+        return stats.gamma(k, scale=theta / k)
+    if dist == "Exponencial":
+        return stats.expon(scale=float(params["p1"]))
+    if dist == "Gamma":
+        media, varianza = float(params["p1"]), float(params["p2"])
+        return stats.gamma(media ** 2 / varianza, scale=varianza / media)
+    if dist == "Normal":
+        return stats.norm(float(params["p1"]), math.sqrt(float(params["p2"])))
+    if dist == "Weibull":
+        # desplaz + escala**2 * E**(1/forma), E ~ Exp(1)
+        forma, escala = float(params["p1"]), float(params["p2"])
+        return stats.weibull_min(forma, loc=float(params.get("p3") or 0), scale=escala ** 2)
+    raise ValueError(f"Distribución no soportada: {dist}")
+
+def distribucion_discreta(nombre: str, params: Dict[str, Any]):
+    """Distribución scipy de las discretas con forma cerrada (la Empírica no la tiene)."""
+    if nombre == "Uniforme":
+        return stats.randint(int(params["a"]), int(params["b"]) + 1)
+    if nombre == "Bernoulli":
+        return stats.bernoulli(float(params["p"]))
+    if nombre == "Binomial":
+        return stats.binom(int(params["n"]), float(params["p"]))
+    if nombre == "Poisson":
+        return stats.poisson(float(params["lam"]))
+    raise ValueError(f"Distribución no soportada: {nombre}")
+
+def tam_soporte(nombre: str, params: Dict[str, Any]) -> int:
+    """Cantidad de valores que tendría pmf_discreta (sin construirla)."""
+    if nombre == "Uniforme":
+        return max(0, int(params["b"]) - int(params["a"]) + 1)
+    if nombre == "Bernoulli":
+        return 2
+    if nombre == "Binomial":
+        return int(params["n"]) + 1
+    if nombre == "Poisson":
+        lam = float(params["lam"])
+        return int(lam + 12 * math.sqrt(lam) + 20) + 1
+    if nombre == "Empírica":
+        return int(parsear_tabla(params["tabla"])[0].size)
+    raise ValueError(f"Distribución no soportada: {nombre}")
+
+def probabilidad_intervalos(nombre: str, params: Dict[str, Any], bordes) -> np.ndarray:
+    """Probabilidad de cada intervalo [bordes[i], bordes[i+1]); para enteros conviene
+    usar bordes en k + 0.5. No construye la PMF salvo en la Empírica."""
+    bordes = np.asarray(bordes, dtype=float)
+    if nombre == "Empírica" or tam_soporte(nombre, params) <= MAX_CATEGORIAS:
+        soporte, probs = pmf_discreta(nombre, params)
+        return np.histogram(soporte, bins=bordes, weights=probs)[0]
+    return np.diff(distribucion_discreta(nombre, params).cdf(bordes))
+
+def pmf_discreta(nombre: str, params: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """(valores, probabilidades) del soporte; las colas truncadas van al último valor."""
+    if nombre == "Uniforme":
+        a, b = int(params["a"]), int(params["b"])
+        valores = np.arange(a, b + 1)
+        return valores, np.full(valores.size, 1.0 / valores.size)
+    if nombre == "Bernoulli":
+        p = float(params["p"])
+        return np.array([0, 1]), np.array([1.0 - p, p])
+    if nombre == "Binomial":
+        tabla = guia_binomial(int(params["n"]), float(params["p"]))
+        return tabla.valores, tabla.pmf
+    if nombre == "Poisson":
+        tabla = guia_poisson(float(params["lam"]))
+        return tabla.valores, tabla.pmf
+    if nombre == "Empírica":
+        valores, pesos = parsear_tabla(params["tabla"])
+        unicos, inv = np.unique(valores, return_inverse=True)
+        return unicos, np.bincount(inv, weights=pesos) / pesos.sum()
+    raise ValueError(f"Distribución no soportada: {nombre}")
+
+def prueba_chi2_discreta(valores, conteo, nombre: str, params: Dict[str, Any], alpha: float=0.05,
+                         estimados: int=0) -> Dict[str, Any]:
+    """valores/conteo observados (p. ej. de np.unique o AcumuladorDiscreto.tabla()).
+    `estimados`: parámetros ajustados con los mismos datos (se restan de los grados de libertad)."""
+    valores = np.asarray(valores)
+    conteo = np.asarray(conteo, dtype=float)
+    n = float(conteo.sum())
+    if n < 2:
+        raise ValueError("Se requieren al menos 2 valores.")
+    if nombre != "Empírica" and tam_soporte(nombre, params) > MAX_CATEGORIAS:
+        obs, probs = _por_intervalos(valores, conteo, distribucion_discreta(nombre, params))
+    else:
+        soporte, probs = pmf_discreta(nombre, params)
+        pos = np.searchsorted(soporte, valores)
+        dentro = (pos < soporte.size) & (soporte[np.minimum(pos, soporte.size - 1)] == valores)
+        obs = np.bincount(pos[dentro], weights=conteo[dentro], minlength=soporte.size)
+    fuera = n - float(obs.sum())
+    esp = probs * n
+    # se agrupan categorías contiguas hasta que el esperado sea >= 5
+    obs_g, esp_g = [], []
+    acum_o = acum_e = 0.0
+    for o, e in zip(obs.tolist(), esp.tolist()):
+        acum_o += o; acum_e += e
+        if acum_e >= 5:
+            obs_g.append(acum_o); esp_g.append(acum_e)
+            acum_o = acum_e = 0.0
+    if acum_e > 0 or acum_o > 0:
+        if esp_g:
+            obs_g[-1] += acum_o; esp_g[-1] += acum_e
+        else:
+            obs_g.append(acum_o); esp_g.append(acum_e)
+    obs_g, esp_g = np.array(obs_g), np.array(esp_g)
+    gl = max(1, obs_g.size - 1 - estimados)
+    if fuera > 0:
+        x2 = math.inf
+    else:
+        x2 = float(((obs_g - esp_g) ** 2 / esp_g).sum())
+    chi2_crit = stats.chi2.ppf(1 - alpha, gl)
+    p_value = float(stats.chi2.sf(x2, gl))
+    return {"n": int(n), "categorias": int(obs_g.size), "fuera_de_soporte": int(fuera), "x2": x2, "gl": gl,
+            "chi2_critico": chi2_crit, "alpha": alpha, "p_value": p_value, "pasa": bool(x2 <= chi2_crit)}
+
+def _por_intervalos(valores: np.ndarray, conteo: np.ndarray, teorica) -> Tuple[np.ndarray, np.ndarray]:
+    """(observados, probabilidades) en intervalos de enteros de igual probabilidad
+    (-inf, c0], (c0, c1], ..., (c_k, inf); los valores fuera del soporte no se cuentan."""
+    cortes = np.unique(teorica.ppf(np.linspace(0.0, 1.0, INTERVALOS_CHI2 + 1)[1:-1]))
+    probs = np.diff(np.concatenate([[0.0], teorica.cdf(cortes), [1.0]]))
+    lo, hi = teorica.support()
+    dentro = (valores >= lo) & (valores <= hi) & (valores == np.round(valores))
+    pos = np.searchsorted(cortes, valores[dentro], side="left")
+    return np.bincount(pos, weights=conteo[dentro], minlength=cortes.size + 1), probs
+
+class AcumuladorKS:
+    """Conteos en una malla fina centrada en la resolución de los datos.
+    Con datos redondeados a `resolucion`, la D obtenida es exacta para la variable redondeada."""
+    def __init__(self, dist: str, params: Dict[str, Any], resolucion: float=RESOLUCION):
+        self.teorica = distribucion_continua(dist, params)
+        lo, hi = self.teorica.ppf([1e-9, 1 - 1e-9])
+        if not (np.isfinite(lo) and np.isfinite(hi) and hi > lo):
+            raise ValueError("La distribución teórica es degenerada; no se aplica KS.")
+        paso = resolucion
+        while (hi - lo) / paso > MAX_CELDAS_KS:
+            paso *= 2
+        self.paso = paso
+        # bordes en los puntos medios entre valores representables
+        inicio = math.floor(lo / resolucion) * resolucion - resolucion / 2
+        celdas = int(math.ceil((hi - inicio) / paso)) + 1
+        self.bordes = inicio + paso * np.arange(celdas + 1)
+        self.conteo = np.zeros(celdas, dtype=np.int64)
+        self.debajo = 0
+        self.n = 0
+
+    def agregar(self, b: np.ndarray):
+        b = np.asarray(b, dtype=float)
+        if b.size == 0:
+            return
+        c = np.histogram(b, bins=self.conteo.size, range=(self.bordes[0], self.bordes[-1]))[0]
+        self.conteo += c
+        self.debajo += int((b < self.bordes[0]).sum())
+        self.n += b.size
+
+    def resultado(self, alpha: float=0.05) -> Dict[str, Any]:
+        if self.n < 2:
+            raise ValueError("Se requieren al menos 2 valores.")
+        ecdf = np.concatenate([[self.debajo], self.debajo + np.cumsum(self.conteo)]) / self.n
+        d = float(np.abs(ecdf - self.teorica.cdf(self.bordes)).max())
+        d_crit = float(stats.kstwo.ppf(1 - alpha, self.n))
+        p_value = float(stats.kstwo.sf(d, self.n))
+        return {"n": self.n, "d": d, "d_critico": d_crit, "malla": self.paso, "alpha": alpha,
+                "p_value": p_value, "pasa": bool(d <= d_crit)}
+
+def prueba_ks_continua(valores, dist: str, params: Dict[str, Any], alpha: float=0.05,
+                       resolucion: float=RESOLUCION) -> Dict[str, Any]:
+    acum = AcumuladorKS(dist, params, resolucion)
+    acum.agregar(valores)
+    return acum.resultado(alpha)
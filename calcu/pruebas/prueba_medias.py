@@ -3,16 +3,20 @@ Prueba de Medias (Z) para U(0,1)
 Z = (mean - 0.5) * sqrt(12n)
 """
 from typing import Dict, Any
-import numpy as np
-from math import sqrt
 from scipy.stats import norm
 
+from datos.archivos import bloques
+
 def prueba_medias(u: list, alpha: float=0.05) -> Dict[str, Any]:
-    u = np.asarray(u, dtype=float)
-    n = len(u)
+    # u puede ser lista, arreglo, memmap o secuencia de archivo: se suma por bloques
+    n = 0
+    suma = 0.0
+    for b in bloques(u):
+        n += b.size
+        suma += float(b.sum())
     if n < 2:
         raise ValueError("Se requieren al menos 2 valores.")
-    mean = float(np.mean(u))
+    mean = suma / n
     z = (mean - 0.5) * (12*n)**0.5
     zcrit = norm.ppf(1 - alpha/2.0)
     p_value = 2*(1 - norm.cdf(abs(z)))
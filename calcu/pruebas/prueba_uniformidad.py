@@ -5,9 +5,14 @@ from typing import Dict, Any, Tuple
 import numpy as np
 from scipy.stats import chi2
 
+from datos.archivos import bloques
+
 def tabla_frecuencias(u: list, k: int):
-    u = np.asarray(u, dtype=float)
-    counts, edges = np.histogram(u, bins=k, range=(0.0,1.0))
+    # Conteos acumulados por bloques: los archivos grandes no se cargan completos
+    edges = np.linspace(0.0, 1.0, k+1)
+    counts = np.zeros(k, dtype=np.int64)
+    for b in bloques(u):
+        counts += np.histogram(b, bins=k, range=(0.0,1.0))[0]
     return counts.tolist(), edges.tolist()
 
 def prueba_uniformidad(u: list, k: int=None, alpha: float=0.05) -> Dict[str, Any]:
@@ -2,16 +2,32 @@
 Prueba de Varianza (Chi-cuadrado) para U(0,1)
 X2 = (n-1)*S2 / (1/12)
 """
-from typing import Dict, Any
-import numpy as np
+from typing import Dict, Any, Tuple
 from scipy.stats import chi2
 
+from datos.archivos import bloques
+
+def _momentos(u) -> Tuple[int, float, float]:
+    # Media y suma de cuadrados centrada combinando bloques (Chan et al.)
+    n, media, m2 = 0, 0.0, 0.0
+    for b in bloques(u):
+        nb = b.size
+        if nb == 0:
+            continue
+        media_b = float(b.mean())
+        m2_b = float(((b - media_b)**2).sum())
+        delta = media_b - media
+        total = n + nb
+        media += delta * nb / total
+        m2 += m2_b + delta*delta * n * nb / total
+        n = total
+    return n, media, m2
+
 def prueba_varianza(u: list, alpha: float=0.05) -> Dict[str, Any]:
-    u = np.asarray(u, dtype=float)
-    n = len(u)
+    n, _, m2 = _momentos(u)
     if n < 2:
         raise ValueError("Se requieren al menos 2 valores.")
-    s2 = float(np.var(u, ddof=1))
+    s2 = m2 / (n - 1)
     sigma2 = 1.0/12.0
     gl = n - 1
     x2 = gl * s2 / sigma2
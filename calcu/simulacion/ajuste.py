@@ -0,0 +1,218 @@
+"""
+Ajuste de distribuciones por máxima verosimilitud desde archivos grandes
+Un solo recorrido por bloques (datos.archivos) acumula los estadísticos
+suficientes (n, momentos, suma de logaritmos, mínimo, máximo), la tabla de
+frecuencias si los datos son enteros y una submuestra uniforme de tamaño fijo.
+Con eso se ajustan Exponencial, Gamma, Normal, Weibull, k-Erlang, Poisson y
+Binomial. El AIC de una densidad y el de una PMF no son comparables, así que
+continuas y discretas se ordenan por separado. Las continuas se prueban con KS
+sobre la submuestra (Weibull, sin estadístico suficiente, también se ajusta
+con ella); las discretas con chi-cuadrado sobre la tabla de frecuencias completa.
+Los parámetros se devuelven en el formato de generar_muestras (p1, p2, p3) o
+de muestras_discretas (n, p / lam), listos para simular con ellos.
+"""
+from typing import Callable, Dict, Any, List, Optional
+import math
+import numpy as np
+from scipy import stats
+from scipy.optimize import brentq
+from scipy.special import digamma, polygamma, gammaln
+
+from datos.archivos import Secuencia, bloques, abrir_secuencia
+from simulacion.histograma import Momentos, AcumuladorDiscreto
+from pruebas.prueba_ajuste import distribucion_continua, prueba_chi2_discreta
+
+TAM_SUBMUESTRA = 200_000
+# Binomial: n se busca en [máximo, FACTOR_ENSAYOS * máximo + 100]
+FACTOR_ENSAYOS = 10
+# con máximos mayores no se ajustan discretas (las tablas de la PMF para χ²
+# serían enormes; a esa escala la Poisson ya es prácticamente normal)
+MAX_DISCRETO = 1_000_000
+# puntos por paso de la búsqueda de n (malla gruesa que se va refinando)
+PUNTOS_BUSQUEDA = 33
+
+class EstadisticosSuficientes(Momentos):
+    def __init__(self, tam_submuestra: Optional[int]=None, semilla=None):
+        super().__init__()
+        self.suma_log = 0.0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+        self.tabla = AcumuladorDiscreto()
+        self.enteros = True
+        self._rng = np.random.default_rng(semilla)
+        # TAM_SUBMUESTRA se lee al crear el objeto, no al definir la clase
+        self._tam = TAM_SUBMUESTRA if tam_submuestra is None else int(tam_submuestra)
+        self._claves = np.empty(0)
+        self._muestra = np.empty(0)
+
+    def agregar(self, b: np.ndarray):
+        b = np.asarray(b, dtype=float)
+        b = b[np.isfinite(b)]
+        if b.size == 0:
+            return
+        self._agregar_momentos(b)
+        self.minimo = min(self.minimo, float(b.min()))
+        self.maximo = max(self.maximo, float(b.max()))
+        if self.minimo > 0:
+            self.suma_log += float(np.log(b).sum())
+        if self.enteros:
+            if np.all(b == np.round(b)):
+                self.tabla.agregar(b.astype(np.int64))
+            else:
+                self.enteros = False
+                self.tabla = None
+        # submuestra uniforme: se conservan los valores con las claves aleatorias más pequeñas
+        claves = np.concatenate([self._claves, self._rng.random(b.size)])
+        valores = np.concatenate([self._muestra, b])
+        if claves.size > self._tam:
+            idx = np.argpartition(claves, self._tam)[:self._tam]
+            claves, valores = claves[idx], valores[idx]
+        self._claves, self._muestra = claves, valores
+
+    @property
+    def submuestra(self) -> np.ndarray:
+        return self._muestra
+
+def _forma_gamma(s: float) -> float:
+    """Resuelve log(k) - digamma(k) = s (Newton desde la aproximación de Minka)."""
+    k = (3 - s + math.sqrt((s - 3) ** 2 + 24 * s)) / (12 * s)
+    for _ in range(50):
+        paso = (math.log(k) - digamma(k) - s) / (1 / k - polygamma(1, k))
+        k = max(k - paso, k / 10)
+        if abs(paso) < 1e-10 * k:
+            break
+    return k
+
+def _loglik_gamma(est: EstadisticosSuficientes, k: float, escala: float) -> float:
+    n = est.n
+    return (k - 1) * est.suma_log - n * est.media / escala - n * k * math.log(escala) - n * gammaln(k)
+
+# intervalo donde se busca la forma de Weibull
+FORMA_WEIBULL = (1e-3, 1e3)
+
+def _forma_weibull(x: np.ndarray) -> Optional[float]:
+    """Forma MLE de Weibull; None si la raíz no está en FORMA_WEIBULL (p. ej. datos casi constantes)."""
+    lx = np.log(x / x.max())
+    media_lx = lx.mean()
+    def ecuacion(beta):
+        w = np.exp(beta * lx)
+        return (w * lx).sum() / w.sum() - 1 / beta - media_lx
+    try:
+        return brentq(ecuacion, *FORMA_WEIBULL)
+    except ValueError:
+        return None
+
+def _loglik_binomial(ensayos: np.ndarray, n: int, media: float, valores: np.ndarray, conteo: np.ndarray,
+                     suma: float, log_fact: float) -> np.ndarray:
+    """Verosimilitud perfil para cada n_ensayos (p = media / n_ensayos); -inf donde no vale."""
+    ensayos = ensayos.astype(float)
+    p = media / ensayos
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ll = (n * gammaln(ensayos + 1) - log_fact
+              - gammaln(ensayos[:, None] - valores[None, :] + 1) @ conteo
+              + suma * np.log(p) + (n * ensayos - suma) * np.log1p(-p))
+    return np.where(np.isfinite(ll), ll, -np.inf)
+
+def _mejor_ensayos(loglik: Callable, lo: int, hi: int, puntos: int=PUNTOS_BUSQUEDA) -> int:
+    """Máximo de una función unimodal en los enteros lo..hi, de malla gruesa a fina:
+    cada paso evalúa `puntos` valores y se queda con el tramo alrededor del mejor."""
+    while hi - lo > puntos:
+        malla = np.unique(np.linspace(lo, hi, puntos).round().astype(np.int64))
+        j = int(np.argmax(loglik(malla)))
+        lo, hi = int(malla[max(j - 1, 0)]), int(malla[min(j + 1, malla.size - 1)])
+    malla = np.arange(lo, hi + 1)
+    return int(malla[int(np.argmax(loglik(malla)))])
+
+def ajustar(datos: Secuencia, semilla=None, progreso: Callable=None,
+            tam_submuestra: Optional[int]=None) -> List[Dict[str, Any]]:
+    """Ajusta las distribuciones aplicables: primero las continuas y después las
+    discretas, cada grupo ordenado por AIC (`rango` es la posición en su grupo).
+    Cada fila trae la prueba de bondad de ajuste (KS o χ²), su estadístico y p.
+    `progreso(bloques_leidos, None)` se llama tras cada bloque (puede lanzar para cortar).
+    `tam_submuestra` (por omisión TAM_SUBMUESTRA) es el tamaño de la submuestra para KS y Weibull."""
+    est = EstadisticosSuficientes(tam_submuestra, semilla=semilla)
+    for i, b in enumerate(bloques(datos)):
+        est.agregar(b)
+        if progreso is not None:
+            progreso(i + 1, None)
+    n = est.n
+    if n < 2:
+        raise ValueError("Se requieren al menos 2 valores.")
+    media, var = est.media, est.varianza
+    muestra = est.submuestra
+    res = []
+
+    def agregar(nombre, tipo, params, loglik, k_params, cdf=None):
+        fila = {"distribucion": nombre, "tipo": tipo, "params": params, "loglik": float(loglik),
+                "aic": float(2 * k_params - 2 * loglik)}
+        if tipo == "continua":
+            ks = stats.kstest(muestra, cdf)
+            fila.update(prueba="KS", estadistico=float(ks.statistic), p_value=float(ks.pvalue))
+        else:
+            chi2 = prueba_chi2_discreta(valores, conteo, nombre, params, estimados=k_params)
+            fila.update(prueba="χ²", estadistico=chi2["x2"], p_value=chi2["p_value"])
+        res.append(fila)
+
+    if var > 0:
+        params = {"p1": media, "p2": var}
+        agregar("Normal", "continua", params, -n / 2 * (math.log(2 * math.pi * var) + 1), 2,
+                distribucion_continua("Normal", params).cdf)
+
+    if est.minimo >= 0 and media > 0:
+        params = {"p1": media}
+        agregar("Exponencial", "continua", params, -n * math.log(media) - n, 1,
+                distribucion_continua("Exponencial", params).cdf)
+
+    if est.minimo > 0 and var > 0:
+        s = math.log(media) - est.suma_log / n
+        k = _forma_gamma(s)
+        escala = media / k
+        params = {"p1": media, "p2": k * escala ** 2}
+        agregar("Gamma", "continua", params, _loglik_gamma(est, k, escala), 2,
+                distribucion_continua("Gamma", params).cdf)
+
+        # k-Erlang: mejor entero alrededor de la forma Gamma; con k fijo la escala MLE es media/k
+        candidatos = {max(1, math.floor(k)), max(1, math.ceil(k))}
+        k_e = max(candidatos, key=lambda kk: _loglik_gamma(est, kk, media / kk))
+        params = {"p1": k_e, "p2": media}
+        agregar("k-Erlang", "continua", params, _loglik_gamma(est, k_e, media / k_e), 2,
+                distribucion_continua("k-Erlang", params).cdf)
+
+        beta = _forma_weibull(muestra)
+        if beta is not None:
+            lam = float(np.mean(muestra ** beta)) ** (1 / beta)
+            # verosimilitud estimada con la submuestra y escalada a n
+            ll_w = float(stats.weibull_min.logpdf(muestra, beta, scale=lam).mean()) * n
+            params = {"p1": beta, "p2": math.sqrt(lam), "p3": 0.0}
+            agregar("Weibull", "continua", params, ll_w, 2, distribucion_continua("Weibull", params).cdf)
+
+    if est.enteros and est.minimo >= 0 and est.maximo <= MAX_DISCRETO:
+        valores, conteo = est.tabla.tabla()
+        valores = valores.astype(float)
+        conteo = conteo.astype(float)
+        suma = float(conteo @ valores)
+        log_fact = float(conteo @ gammaln(valores + 1))
+        if media > 0:
+            ll = suma * math.log(media) - n * media - log_fact
+            agregar("Poisson", "discreta", {"lam": media}, ll, 1)
+
+        # Binomial: verosimilitud perfil en n_ensayos (p = media / n_ensayos). Con var >= media
+        # el máximo se va a n infinito (el límite es la Poisson) y no hay ajuste binomial.
+        maximo = int(est.maximo)
+        if maximo > 0 and 0 < var < media:
+            def loglik(ensayos):
+                return _loglik_binomial(ensayos, n, media, valores, conteo, suma, log_fact)
+            n_b = _mejor_ensayos(loglik, maximo, FACTOR_ENSAYOS * maximo + 100)
+            agregar("Binomial", "discreta", {"n": n_b, "p": media / n_b},
+                    float(loglik(np.array([n_b]))[0]), 2)
+
+    res.sort(key=lambda f: (f["tipo"] != "continua", f["aic"]))
+    for tipo in ("continua", "discreta"):
+        for i, fila in enumerate(f for f in res if f["tipo"] == tipo):
+            fila["rango"] = i + 1
+    return res
+
+def ajustar_archivo(ruta: str, formato: str=None, semilla=None, progreso: Callable=None,
+                    tam_submuestra: Optional[int]=None) -> List[Dict[str, Any]]:
+    return ajustar(abrir_secuencia(ruta, formato), semilla=semilla, progreso=progreso,
+                   tam_submuestra=tam_submuestra)
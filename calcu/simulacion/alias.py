@@ -0,0 +1,92 @@
+"""
+Método alias (Walker / Vose) para distribuciones discretas empíricas
+La tabla se construye una vez en O(k) y cada muestra cuesta O(1): un solo
+uniforme elige la columna y decide entre el valor propio y su alias.
+"""
+from typing import Tuple
+from functools import lru_cache
+import numpy as np
+
+def parsear_tabla(texto: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Lee pares 'valor:peso' separados por ';' o saltos de línea (también 'valor,peso').
+    Los pesos pueden ser probabilidades o frecuencias: se normalizan."""
+    valores, pesos = [], []
+    for par in texto.replace("\n", ";").split(";"):
+        par = par.strip()
+        if not par:
+            continue
+        sep = ":" if ":" in par else ","
+        partes = par.split(sep)
+        if len(partes) != 2:
+            raise ValueError(f"Par inválido: '{par}' (use valor:probabilidad).")
+        valores.append(float(partes[0]))
+        pesos.append(float(partes[1]))
+    return np.array(valores), np.array(pesos)
+
+def leer_tabla(ruta: str) -> Tuple[np.ndarray, np.ndarray]:
+    """CSV de dos columnas (valor, probabilidad o frecuencia), encabezado opcional."""
+    with open(ruta, "r", encoding="utf-8") as fh:
+        lineas = [l.strip() for l in fh if l.strip()]
+    if lineas:
+        try:
+            float(lineas[0].split(",")[0])
+        except ValueError:
+            lineas = lineas[1:]
+    if not lineas:
+        raise ValueError("El archivo no contiene pares valor,peso.")
+    datos = np.loadtxt(lineas, delimiter=",", usecols=(0, 1), ndmin=2)
+    return datos[:, 0], datos[:, 1]
+
+def tabla_a_texto(valores, pesos) -> str:
+    return "; ".join(f"{v:g}:{w:g}" for v, w in zip(valores, pesos))
+
+class TablaAlias:
+    def __init__(self, valores, pesos):
+        valores = np.asarray(valores, dtype=float)
+        pesos = np.asarray(pesos, dtype=float)
+        if valores.ndim != 1 or valores.size == 0 or valores.shape != pesos.shape:
+            raise ValueError("Se requieren listas de valores y pesos del mismo tamaño.")
+        if (pesos < 0).any() or pesos.sum() <= 0:
+            raise ValueError("Los pesos deben ser no negativos y sumar más que 0.")
+        k = valores.size
+        self.probabilidades = pesos / pesos.sum()
+        self.valores = valores.astype(np.int64) if np.all(valores == np.round(valores)) else valores
+
+        # Vose: columnas escaladas a media 1, se emparejan pequeñas con grandes
+        escalada = self.probabilidades * k
+        prob = np.ones(k)
+        alias = np.arange(k)
+        pequenas = [i for i in range(k) if escalada[i] < 1.0]
+        grandes = [i for i in range(k) if escalada[i] >= 1.0]
+        while pequenas and grandes:
+            s = pequenas.pop()
+            g = grandes[-1]
+            prob[s] = escalada[s]
+            alias[s] = g
+            escalada[g] -= 1.0 - escalada[s]
+            if escalada[g] < 1.0:
+                grandes.pop()
+                pequenas.append(g)
+        # las que quedan valen 1 salvo error de redondeo
+        self.prob = prob
+        self.alias = alias
+
+    def desde_u(self, u) -> np.ndarray:
+        """Transforma uniformes en [0, 1) en valores de la tabla."""
+        u = np.asarray(u, dtype=float) * self.prob.size
+        col = np.minimum(u.astype(np.intp), self.prob.size - 1)
+        elegido = np.where(u - col < self.prob[col], col, self.alias[col])
+        return self.valores[elegido]
+
+    def muestrear(self, cantidad: int, semilla=None) -> np.ndarray:
+        rng = np.random.default_rng(semilla)
+        return self.desde_u(rng.random(cantidad))
+
+@lru_cache(maxsize=32)
+def _tabla_cacheada(valores: tuple, pesos: tuple) -> TablaAlias:
+    return TablaAlias(valores, pesos)
+
+def tabla_alias(valores, pesos) -> TablaAlias:
+    """TablaAlias reutilizada mientras los pares no cambien."""
+    return _tabla_cacheada(tuple(np.asarray(valores, dtype=float).tolist()),
+                           tuple(np.asarray(pesos, dtype=float).tolist()))
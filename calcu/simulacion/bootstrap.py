@@ -0,0 +1,146 @@
+"""
+Intervalos de confianza bootstrap (percentil) para media, varianza y cuantiles
+Las remuestras se calculan por lotes como matrices NumPy. Si los datos tienen
+pocos valores distintos (enteros, o reales redondeados a 2 decimales) cada
+remuestra es un vector de conteos multinomial sobre esos valores: el costo por
+remuestra depende de los valores distintos y no de n. Si no, se usan matrices de
+índices limitadas a MAX_ELEMENTOS por lote, salvo con más de MAX_INDICES datos.
+Con muchos valores distintos (más de BINS_AGRUPADO en la tabla, o más de
+MAX_INDICES datos) la tabla se agrupa en BINS_AGRUPADO celdas: los
+COLAS_EXACTAS datos de cada extremo quedan sueltos y el resto va a celdas de
+igual frecuencia, cada una representada por su media y su varianza interna
+(que se suma a la varianza de cada remuestra). Se remuestrean esos conteos;
+los cuantiles centrales quedan con la resolución de una celda. Los lotes pueden repartirse en un pool de
+procesos; el resultado no depende del número de procesos.
+"""
+from typing import Dict, Any, Sequence, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+REMUESTRAS = 10_000
+# elementos por matriz de remuestreo (acota la memoria de cada lote)
+MAX_ELEMENTOS = 20_000_000
+# se usan conteos cuando hay a lo sumo n / PROPORCION_CONTEOS valores distintos
+PROPORCION_CONTEOS = 4
+# por encima de este n las matrices de índices son demasiado lentas: se agrupa
+MAX_INDICES = 10_000
+BINS_AGRUPADO = 4096
+# datos de cada extremo que no se agrupan: con colas pesadas la varianza y los
+# cuantiles extremos dependen de unos pocos valores que deben remuestrearse tal cual
+COLAS_EXACTAS = 1024
+
+def agrupar(valores: np.ndarray, conteo: np.ndarray, bins: int=BINS_AGRUPADO,
+            colas: int=COLAS_EXACTAS) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Tabla (valores ordenados, conteo) reducida a celdas no vacías: los `colas` datos
+    más chicos y más grandes quedan como sus propios valores y el resto se agrupa en
+    celdas de igual frecuencia. Devuelve (media, conteo, varianza) de cada celda; la
+    media y la varianza de la tabla (media de las celdas más varianza dentro de ellas)
+    son las de los datos."""
+    n = int(conteo.sum())
+    colas = min(colas, n // 4, bins // 4)
+    medio = max(1, bins - 2 * colas)
+    # rango del primer dato de cada valor: las colas van a celdas propias
+    rango = np.cumsum(conteo) - conteo
+    abajo, arriba = rango < colas, rango >= n - colas
+    centro = ~(abajo | arriba)
+    celda = np.empty(valores.size, dtype=np.int64)
+    celda[abajo] = np.arange(np.count_nonzero(abajo))
+    celda[centro] = colas + ((rango[centro] - colas) * medio) // max(1, n - 2 * colas)
+    celda[arriba] = colas + medio + np.arange(np.count_nonzero(arriba))
+    total = colas + medio + np.count_nonzero(arriba)
+    cantidad = np.bincount(celda, weights=conteo, minlength=total)
+    ocupadas = np.flatnonzero(cantidad)
+    media = np.zeros(total)
+    media[ocupadas] = np.bincount(celda, weights=conteo * valores, minlength=total)[ocupadas] / cantidad[ocupadas]
+    # varianza dentro de cada celda, respecto de su propia media (sin cancelación)
+    dentro = np.bincount(celda, weights=conteo * (valores - media[celda]) ** 2, minlength=total)
+    return media[ocupadas], cantidad[ocupadas].astype(np.int64), dentro[ocupadas] / cantidad[ocupadas]
+
+def _lote_conteos(valores: np.ndarray, conteo: np.ndarray, dentro: np.ndarray, cuantiles: Sequence[float],
+                  b: int, semilla: np.random.SeedSequence) -> np.ndarray:
+    rng = np.random.default_rng(semilla)
+    n = int(conteo.sum())
+    remuestras = rng.multinomial(n, conteo / n, size=b).astype(float)
+    media = remuestras @ valores / n
+    # desplazada por la media original c para evitar cancelación: E[(x-c)^2] - (media-c)^2;
+    # con celdas agrupadas cada dato remuestreado aporta además la varianza de su celda
+    c = float(conteo @ valores / n)
+    varianza = remuestras @ ((valores - c) ** 2 + dentro) / n - (media - c) ** 2
+    acumulado = np.cumsum(remuestras, axis=1)
+    cols = [media, varianza]
+    for q in cuantiles:
+        # cuantil 'inverted_cdf': primer valor con acumulado >= q*n
+        idx = np.minimum((acumulado < q * n).sum(axis=1), valores.size - 1)
+        cols.append(valores[idx])
+    return np.column_stack(cols)
+
+def _lote_indices(datos: np.ndarray, cuantiles: Sequence[float], b: int,
+                  semilla: np.random.SeedSequence) -> np.ndarray:
+    rng = np.random.default_rng(semilla)
+    remuestras = datos[rng.integers(0, datos.size, size=(b, datos.size))]
+    cols = [remuestras.mean(axis=1), remuestras.var(axis=1)]
+    for q in cuantiles:
+        cols.append(np.quantile(remuestras, q, axis=1, method="inverted_cdf"))
+    return np.column_stack(cols)
+
+def _ejecutar(funcion, args: Tuple, remuestras: int, por_lote: int, semilla, trabajadores: int) -> np.ndarray:
+    n_lotes = -(-remuestras // por_lote)
+    hijos = np.random.SeedSequence(semilla).spawn(n_lotes)
+    tamanos = [min(por_lote, remuestras - i * por_lote) for i in range(n_lotes)]
+    if trabajadores <= 1 or n_lotes == 1:
+        partes = [funcion(*args, b, hijo) for b, hijo in zip(tamanos, hijos)]
+    else:
+        with ProcessPoolExecutor(max_workers=min(trabajadores, n_lotes)) as pool:
+            tareas = [pool.submit(funcion, *args, b, hijo) for b, hijo in zip(tamanos, hijos)]
+            partes = [t.result() for t in tareas]
+    return np.vstack(partes)
+
+def _resumen(puntual: Sequence[float], remuestras: np.ndarray, nivel: float,
+             cuantiles: Sequence[float]) -> Dict[str, Any]:
+    alfa = 1.0 - nivel
+    lim = np.quantile(remuestras, [alfa / 2, 1 - alfa / 2], axis=0)
+    nombres = ["media", "varianza"] + [f"q{q:g}" for q in cuantiles]
+    res = {"nivel": nivel, "remuestras": remuestras.shape[0]}
+    for j, nombre in enumerate(nombres):
+        res[nombre] = {"estimacion": float(puntual[j]), "ic_inf": float(lim[0, j]), "ic_sup": float(lim[1, j])}
+    return res
+
+def bootstrap_conteos(valores, conteo, remuestras: int=REMUESTRAS, nivel: float=0.95,
+                      cuantiles: Sequence[float]=(0.5,), semilla=None, trabajadores: int=1) -> Dict[str, Any]:
+    """Bootstrap a partir de una tabla de frecuencias (p. ej. AcumuladorDiscreto.tabla()).
+    Las estimaciones puntuales salen siempre de la tabla completa."""
+    orden = np.argsort(valores)
+    valores = np.asarray(valores, dtype=float)[orden]
+    conteo = np.asarray(conteo, dtype=np.int64)[orden]
+    n = int(conteo.sum())
+    if n < 2:
+        raise ValueError("Se requieren al menos 2 valores.")
+    media = float(conteo @ valores / n)
+    varianza = float(conteo @ (valores - media) ** 2 / n)
+    acumulado = np.cumsum(conteo)
+    puntual = [media, varianza] + [valores[min(int((acumulado < q * n).sum()), valores.size - 1)] for q in cuantiles]
+    agrupado = valores.size > BINS_AGRUPADO
+    if agrupado:
+        valores, conteo, dentro = agrupar(valores, conteo, BINS_AGRUPADO, COLAS_EXACTAS)
+    else:
+        dentro = np.zeros(valores.size)
+    por_lote = max(1, MAX_ELEMENTOS // valores.size)
+    res = _ejecutar(_lote_conteos, (valores, conteo, dentro, cuantiles), remuestras, por_lote, semilla, trabajadores)
+    res = _resumen(puntual, res, nivel, cuantiles)
+    if agrupado:
+        res["agrupado"] = True
+    return res
+
+def bootstrap(datos, remuestras: int=REMUESTRAS, nivel: float=0.95, cuantiles: Sequence[float]=(0.5,),
+              semilla=None, trabajadores: int=1) -> Dict[str, Any]:
+    """IC percentil de media, varianza (ddof=0) y cuantiles de `datos`."""
+    datos = np.asarray(datos, dtype=float).ravel()
+    if datos.size < 2:
+        raise ValueError("Se requieren al menos 2 valores.")
+    valores, conteo = np.unique(datos, return_counts=True)
+    if valores.size * PROPORCION_CONTEOS <= datos.size or datos.size > MAX_INDICES:
+        return bootstrap_conteos(valores, conteo, remuestras, nivel, cuantiles, semilla, trabajadores)
+    puntual = [datos.mean(), datos.var()] + [np.quantile(datos, q, method="inverted_cdf") for q in cuantiles]
+    por_lote = max(1, MAX_ELEMENTOS // datos.size)
+    res = _ejecutar(_lote_indices, (datos, cuantiles), remuestras, por_lote, semilla, trabajadores)
+    return _resumen(puntual, res, nivel, cuantiles)
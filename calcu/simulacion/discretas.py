@@ -0,0 +1,40 @@
+"""
+Muestreo de distribuciones discretas (Uniforme, Bernoulli, Binomial, Poisson, Empírica)
+Separado de la ventana para poder usarlo desde otros procesos.
+"""
+from typing import Dict, Any
+import numpy as np
+
+from simulacion.alias import parsear_tabla, tabla_alias
+
+DISTRIBUCIONES = ["Uniforme", "Bernoulli", "Binomial", "Poisson", "Empírica"]
+
+def muestras_discretas(nombre: str, params: Dict[str, Any], cantidad: int, semilla=None) -> np.ndarray:
+    """Genera `cantidad` valores enteros. `params` trae valores ya leidos
+    (a, b / p / n, p / lam / tabla); `semilla` acepta int, SeedSequence o Generator.
+    La Empírica recibe el texto 'valor:peso; ...' y se muestrea con el método alias."""
+    rng = np.random.default_rng(semilla)
+    if nombre == "Uniforme":
+        return rng.integers(int(params["a"]), int(params["b"]) + 1, cantidad)
+    if nombre == "Bernoulli":
+        return rng.binomial(1, float(params["p"]), cantidad)
+    if nombre == "Binomial":
+        return rng.binomial(int(params["n"]), float(params["p"]), cantidad)
+    if nombre == "Poisson":
+        return rng.poisson(float(params["lam"]), cantidad)
+    if nombre == "Empírica":
+        return tabla_alias(*parsear_tabla(params["tabla"])).muestrear(cantidad, semilla=rng)
+    return np.array([], dtype=np.int64)
+
+def titulo_discreta(nombre: str, params: Dict[str, Any]) -> str:
+    if nombre == "Uniforme":
+        return f"UNIFORME DISCRETA (a={int(params['a'])}, b={int(params['b'])})"
+    if nombre == "Bernoulli":
+        return f"BERNOULLI (p={float(params['p'])})"
+    if nombre == "Binomial":
+        return f"BINOMIAL (n={int(params['n'])}, p={float(params['p'])})"
+    if nombre == "Poisson":
+        return f"POISSON (λ={float(params['lam'])})"
+    if nombre == "Empírica":
+        return f"EMPÍRICA ({len(parsear_tabla(params['tabla'])[0])} valores)"
+    return ""
@@ -0,0 +1,181 @@
+"""
+Histogramas por bloques en memoria constante
+Las muestras se generan y acumulan bloque a bloque: conteos con np.bincount
+(enteros) o con bordes fijos (continuas), más media y varianza corrientes.
+Los bloques usan las mismas semillas que simulacion.paralelo, así que la
+secuencia acumulada es la misma que generaría generar_paralelo; con
+trabajadores > 1 acumular_por_bloques los genera en su pool de procesos
+(bloques_paralelo) y el resultado no cambia. Una muestra en
+memoria (hasta TAM_BLOQUE valores) debe generarse con semilla_en_memoria():
+así la misma semilla da los mismos primeros valores en ambos caminos.
+"""
+from typing import Callable, Optional, Sequence
+import numpy as np
+
+from simulacion.paralelo import bloques_paralelo
+
+TAM_BLOQUE = 1_000_000
+# valores que se conservan para mostrar en tablas
+MUESTRA_INICIAL = 1000
+# conteo denso (bincount) mientras el rango de enteros no supere
+# max(MIN_DENSO, FACTOR_DENSO * muestras); si no, tabla dispersa con np.unique
+MIN_DENSO = 1 << 16
+FACTOR_DENSO = 4
+
+def semillas_bloques(semilla, n_bloques: int):
+    """Subflujos SeedSequence de los bloques 0..n_bloques-1."""
+    return np.random.SeedSequence(semilla).spawn(n_bloques)
+
+def semilla_en_memoria(semilla):
+    """Semilla del primer bloque, para generar una muestra de una sola vez."""
+    return semillas_bloques(semilla, 1)[0]
+
+class Momentos:
+    """Media y varianza combinando bloques (Chan et al.)."""
+    def __init__(self):
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+        self.muestra_inicial = np.array([])
+
+    def _agregar_momentos(self, b: np.ndarray):
+        nb = b.size
+        if nb == 0:
+            return
+        if self.muestra_inicial.size < MUESTRA_INICIAL:
+            falta = MUESTRA_INICIAL - self.muestra_inicial.size
+            self.muestra_inicial = np.concatenate([self.muestra_inicial, b[:falta]])
+        media_b = float(b.mean())
+        m2_b = float(((b - media_b) ** 2).sum())
+        delta = media_b - self.media
+        total = self.n + nb
+        self.media += delta * nb / total
+        self.m2 += m2_b + delta * delta * self.n * nb / total
+        self.n = total
+
+    @property
+    def varianza(self) -> float:
+        """Varianza poblacional (ddof=0), como en las tarjetas de estadísticas."""
+        return self.m2 / self.n if self.n else float("nan")
+
+class AcumuladorDiscreto(Momentos):
+    """Conteos por valor. Enteros con np.bincount desplazado mientras el rango
+    min..max sea del orden de la cantidad de muestras; si no (p. ej. Uniforme con
+    b = 1e9), o con valores no enteros, tabla dispersa de valores distintos."""
+    def __init__(self):
+        super().__init__()
+        self._inicio = None
+        self._conteo = np.zeros(0, dtype=np.int64)
+        # modo disperso: valores distintos ordenados y sus conteos
+        self._valores = None
+        self._conteos = None
+
+    def agregar(self, b: np.ndarray):
+        b = np.asarray(b)
+        if b.size == 0:
+            return
+        self._agregar_momentos(b)
+        if self._valores is None and b.dtype.kind in "iu":
+            lo, hi = int(b.min()), int(b.max())
+            if self._inicio is not None:
+                lo, hi = min(lo, self._inicio), max(hi, self._inicio + self._conteo.size - 1)
+            if hi - lo + 1 <= max(MIN_DENSO, FACTOR_DENSO * self.n):
+                self._agregar_denso(b, lo, hi)
+                return
+            self._a_disperso()
+        if self._valores is None:
+            self._a_disperso()
+        vals, cnt = np.unique(b, return_counts=True)
+        vals, inv = np.unique(np.concatenate([self._valores, vals]), return_inverse=True)
+        conteos = np.zeros(vals.size, dtype=np.int64)
+        np.add.at(conteos, inv, np.concatenate([self._conteos, cnt]))
+        self._valores, self._conteos = vals, conteos
+
+    def _agregar_denso(self, b: np.ndarray, lo: int, hi: int):
+        if self._inicio is None:
+            self._inicio, self._conteo = lo, np.zeros(0, dtype=np.int64)
+        antes = self._inicio - lo
+        despues = hi - lo + 1 - antes - self._conteo.size
+        if antes or despues:
+            self._conteo = np.concatenate([np.zeros(antes, dtype=np.int64), self._conteo,
+                                           np.zeros(despues, dtype=np.int64)])
+            self._inicio = lo
+        self._conteo += np.bincount(b - lo, minlength=self._conteo.size)
+
+    def _a_disperso(self):
+        if self._inicio is None:
+            self._valores, self._conteos = np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        else:
+            nz = np.flatnonzero(self._conteo)
+            self._valores, self._conteos = nz + self._inicio, self._conteo[nz]
+            self._inicio, self._conteo = None, np.zeros(0, dtype=np.int64)
+
+    def tabla(self):
+        """(valores, conteos) con conteo > 0, ordenados."""
+        if self._valores is not None:
+            return self._valores, self._conteos
+        if self._inicio is None:
+            return np.array([], dtype=np.int64), np.array([], dtype=np.int64)
+        nz = np.flatnonzero(self._conteo)
+        return nz + self._inicio, self._conteo[nz]
+
+class AcumuladorContinuo(Momentos):
+    """Histograma de bordes fijos; si no se dan límites los fija el primer bloque.
+    Los valores que caen fuera de los bordes se cuentan en `bajo` y `sobre`
+    (celdas de desborde) para poder mostrarlos junto al histograma."""
+    def __init__(self, bins: int, lim_inf: Optional[float]=None, lim_sup: Optional[float]=None):
+        super().__init__()
+        self.bins = int(bins)
+        self.bordes = None
+        self.conteo = np.zeros(self.bins, dtype=np.int64)
+        self.bajo = 0
+        self.sobre = 0
+        if lim_inf is not None and lim_sup is not None:
+            self.bordes = np.linspace(lim_inf, lim_sup, self.bins + 1)
+
+    def agregar(self, b: np.ndarray):
+        b = np.asarray(b, dtype=float)
+        if b.size == 0:
+            return
+        self._agregar_momentos(b)
+        if self.bordes is None:
+            lo, hi = float(b.min()), float(b.max())
+            margen = 0.1 * (hi - lo) if hi > lo else 0.5
+            self.bordes = np.linspace(lo - margen, hi + margen, self.bins + 1)
+        c = np.histogram(b, bins=self.bins, range=(self.bordes[0], self.bordes[-1]))[0]
+        self.conteo += c
+        self.bajo += int(np.count_nonzero(b < self.bordes[0]))
+        self.sobre += int(np.count_nonzero(b > self.bordes[-1]))
+
+    @property
+    def fuera(self) -> int:
+        return self.bajo + self.sobre
+
+    def texto_fuera(self) -> str:
+        """Resumen de los valores fuera del histograma ('' si no hay)."""
+        if not self.fuera:
+            return ""
+        return f"fuera del rango: {self.fuera} ({self.bajo} por debajo, {self.sobre} por encima)"
+
+def acumular_por_bloques(funcion: Callable, args: Sequence, cantidad: int, acumulador,
+                         semilla=None, tam_bloque: int=TAM_BLOQUE, progreso: Optional[Callable]=None,
+                         trabajadores: int=1):
+    """Llama funcion(*args, n_bloque, semilla=hijo) bloque a bloque y acumula.
+    `acumulador` puede ser una tupla: cada bloque se entrega a todos.
+    `progreso(hechos, total)` se llama tras cada bloque (puede lanzar para cortar).
+    Con trabajadores > 1 (None: todos los núcleos) los bloques se generan en un pool
+    de procesos (`funcion` debe ser importable) y se acumulan en orden aquí."""
+    destinos = acumulador if isinstance(acumulador, (list, tuple)) else (acumulador,)
+    if cantidad <= 0:
+        raise ValueError("Cantidad debe ser > 0")
+    n_bloques = -(-cantidad // tam_bloque)
+    generados = bloques_paralelo(funcion, args, cantidad, semilla, trabajadores, tam_bloque)
+    try:
+        for i, bloque in enumerate(generados):
+            for destino in destinos:
+                destino.agregar(bloque)
+            if progreso is not None:
+                progreso(i + 1, n_bloques)
+    finally:
+        generados.close()
+    return acumulador
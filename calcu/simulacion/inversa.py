@@ -0,0 +1,156 @@
+"""
+Transformada inversa: convierte los u_i de los generadores del proyecto
+(cuadrados_medios, productos_medios, multiplicador_constante) en variables
+aleatorias, todo vectorizado con NumPy.
+Las parametrizaciones son las mismas que generar_muestras (p1, p2, p3) y
+muestras_discretas (a, b / p / n, p / lam).
+Donde no hay forma cerrada (Gamma, k-Erlang) se interpola una tabla de
+cuantiles calculada una sola vez por forma; Binomial y Poisson usan las
+tablas guía de simulacion.tabla_guia. VariableDesdeU transforma una secuencia
+de u_i por bloques, sin cargarla ni armar la variable completa.
+"""
+from typing import Dict, Any, Iterator, Tuple
+from functools import lru_cache
+import math
+import numpy as np
+from scipy.special import ndtr, ndtri, gammaincinv
+
+from datos.archivos import TAM_BLOQUE, bloques, primeros
+from simulacion.tabla_guia import guia_binomial, guia_poisson
+from simulacion.alias import parsear_tabla, tabla_alias
+
+CONTINUAS = ["Uniforme", "k-Erlang", "Exponencial", "Gamma", "Normal", "Weibull"]
+DISCRETAS = ["Uniforme", "Bernoulli", "Binomial", "Poisson", "Empírica"]
+
+# los generadores pueden devolver u = 0 exacto; se recorta para no producir infinitos
+_EPS = 1e-12
+# malla de la tabla de cuantiles, uniforme en z = ndtri(u) para cubrir bien las colas
+_Z_MIN, _Z_MAX, _PUNTOS = -7.5, 7.5, 4097
+
+def _como_u(u) -> np.ndarray:
+    u = np.asarray(u, dtype=float)
+    if u.size and (u.min() < 0.0 or u.max() > 1.0):
+        raise ValueError("Los u_i deben estar en [0, 1].")
+    return np.clip(u, _EPS, 1.0 - _EPS)
+
+@lru_cache(maxsize=64)
+def _tabla_gamma(forma: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Cuantiles de Gamma(forma, 1) sobre la malla z; se reutiliza entre llamadas."""
+    z = np.linspace(_Z_MIN, _Z_MAX, _PUNTOS)
+    q = gammaincinv(forma, ndtr(z))
+    return z, q
+
+def cuantil_gamma(forma: float, escala: float, u) -> np.ndarray:
+    _, q_tabla = _tabla_gamma(float(forma))
+    # la malla es uniforme en z: el intervalo se obtiene por aritmética, sin búsqueda
+    paso = (_Z_MAX - _Z_MIN) / (_PUNTOS - 1)
+    pos = np.clip((ndtri(_como_u(u)) - _Z_MIN) / paso, 0.0, _PUNTOS - 1.0)
+    i = np.minimum(pos.astype(np.intp), _PUNTOS - 2)
+    frac = pos - i
+    return escala * (q_tabla[i] + frac * (q_tabla[i + 1] - q_tabla[i]))
+
+def continua_desde_u(dist: str, params: Dict[str, Any], u) -> np.ndarray:
+    """Variables continuas por inversa de la CDF, con los parámetros de generar_muestras."""
+    u = _como_u(u)
+    if dist == "Uniforme":
+        a = float(params["p1"])
+        b = float(params["p2"])
+        if a >= b:
+            raise ValueError("El mínimo debe ser menor que el máximo.")
+        return a + (b - a) * u
+
+    if dist == "k-Erlang":
+        k = float(params["p1"])
+        theta = float(params["p2"])
+        if k <= 0 or theta <= 0:
+            raise ValueError("Forma y escala deben ser positivas.")
+        return cuantil_gamma(k, theta / k, u)
+
+    if dist == "Exponencial":
+        lambd = float(params["p1"])
+        if lambd <= 0:
+            raise ValueError("La escala debe ser positiva.")
+        return -lambd * np.log1p(-u)
+
+    if dist == "Gamma":
+        media = float(params["p1"])
+        varianza = float(params["p2"])
+        if media <= 0 or varianza <= 0:
+            raise ValueError("Media y varianza deben ser positivas.")
+        return cuantil_gamma(media ** 2 / varianza, varianza / media, u)
+
+    if dist == "Normal":
+        media = float(params["p1"])
+        varianza = float(params["p2"])
+        if varianza < 0:
+            raise ValueError("Varianza debe ser no negativa.")
+        return media + math.sqrt(varianza) * ndtri(u)
+
+    if dist == "Weibull":
+        forma = float(params["p1"])
+        escala = float(params["p2"])
+        desplaz = float(params.get("p3") or 0)
+        if forma <= 0:
+            raise ValueError("La forma debe ser positiva.")
+        return desplaz + (escala ** 2) * (-np.log1p(-u)) ** (1 / forma)
+
+    raise ValueError(f"Distribución no soportada: {dist}")
+
+def discreta_desde_u(nombre: str, params: Dict[str, Any], u) -> np.ndarray:
+    """Variables discretas por inversa de la CDF, con los parámetros de muestras_discretas."""
+    u = _como_u(u)
+    if nombre == "Uniforme":
+        a = int(params["a"])
+        b = int(params["b"])
+        if a > b:
+            raise ValueError("a debe ser menor o igual que b.")
+        return np.minimum(a + np.floor(u * (b - a + 1)).astype(np.int64), b)
+
+    if nombre == "Bernoulli":
+        p = float(params["p"])
+        if not 0.0 <= p <= 1.0:
+            raise ValueError("p debe estar en [0, 1].")
+        return (u >= 1.0 - p).astype(np.int64)
+
+    if nombre == "Binomial":
+        n = int(params["n"])
+        p = float(params["p"])
+        if n < 0 or not 0.0 <= p <= 1.0:
+            raise ValueError("n debe ser >= 0 y p estar en [0, 1].")
+        return guia_binomial(n, p).muestrear(u)
+
+    if nombre == "Poisson":
+        lam = float(params["lam"])
+        if lam < 0:
+            raise ValueError("λ debe ser no negativa.")
+        return guia_poisson(lam).muestrear(u)
+
+    if nombre == "Empírica":
+        return tabla_alias(*parsear_tabla(params["tabla"])).desde_u(u)
+
+    raise ValueError(f"Distribución no soportada: {nombre}")
+
+class VariableDesdeU:
+    """continua_desde_u / discreta_desde_u aplicada bloque a bloque a una secuencia de u_i
+    (arreglo, memmap o archivo de datos.archivos), sin armar la variable completa.
+    Admite len(), bloques() y primeros() como esas secuencias, así se puede acumular
+    (simulacion.histograma) o exportar (datos.exportar) con memoria constante."""
+    def __init__(self, tipo: str, dist: str, params: Dict[str, Any], us):
+        if tipo not in ("Continua", "Discreta"):
+            raise ValueError(f"Tipo no soportado: {tipo}")
+        self.tipo, self.dist, self.params, self.us = tipo, dist, params, us
+        self._desde_u = continua_desde_u if tipo == "Continua" else discreta_desde_u
+
+    @property
+    def discreta(self) -> bool:
+        return self.tipo == "Discreta"
+
+    def __len__(self) -> int:
+        return len(self.us)
+
+    def bloques(self, tam_bloque: int=TAM_BLOQUE) -> Iterator[np.ndarray]:
+        for b in bloques(self.us, tam_bloque):
+            yield self._desde_u(self.dist, self.params, b)
+
+    def primeros(self, k: int) -> np.ndarray:
+        return self._desde_u(self.dist, self.params, primeros(self.us, k))
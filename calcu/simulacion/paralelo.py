@@ -0,0 +1,128 @@
+"""
+Generación paralela de muestras con subflujos SeedSequence independientes
+La cantidad pedida se divide en bloques de tamaño fijo; el bloque i usa el hijo i
+de SeedSequence(semilla).spawn(...), así el resultado es el mismo sin importar
+cuántos procesos trabajen. generar_paralelo escribe cada bloque directamente en
+un arreglo de memoria compartida; bloques_paralelo los entrega en orden a quien
+los acumule (simulacion.histograma.acumular_por_bloques) con pocos bloques en
+vuelo, así la memoria no crece con la cantidad. Los procesos se crean con spawn
+(no heredan el estado de Tk ni los hilos de la ventana).
+"""
+from collections import deque
+from typing import Callable, Iterator, Optional, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import multiprocessing
+import os
+import numpy as np
+
+TAM_BLOQUE = 1_000_000
+# bloques encargados por trabajador en bloques_paralelo
+BLOQUES_EN_VUELO = 2
+
+def _pool(trabajadores: int) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=trabajadores, mp_context=multiprocessing.get_context("spawn"))
+
+class MuestraCompartida:
+    """Arreglo respaldado por memoria compartida. Llamar a liberar() (o usar
+    `with`) al terminar para devolver el segmento al sistema."""
+    def __init__(self, shm: shared_memory.SharedMemory, cantidad: int, dtype):
+        self.shm = shm
+        self.datos = np.ndarray((cantidad,), dtype=dtype, buffer=shm.buf)
+
+    def liberar(self):
+        if self.shm is None:
+            return
+        self.datos = None
+        self.shm.close()
+        self.shm.unlink()
+        self.shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.liberar()
+
+def _llenar_bloque(nombre_shm: str, cantidad: int, dtype, ini: int, fin: int,
+                   funcion: Callable, args: Sequence, semilla: np.random.SeedSequence) -> int:
+    shm = shared_memory.SharedMemory(name=nombre_shm)
+    try:
+        salida = np.ndarray((cantidad,), dtype=dtype, buffer=shm.buf)
+        salida[ini:fin] = funcion(*args, fin - ini, semilla=semilla)
+        del salida
+    finally:
+        shm.close()
+    return fin - ini
+
+def generar_paralelo(funcion: Callable, args: Sequence, cantidad: int, semilla=None,
+                     trabajadores: Optional[int]=None, tam_bloque: int=TAM_BLOQUE,
+                     dtype=np.float64, compartida: bool=False):
+    """Ejecuta funcion(*args, n_bloque, semilla=hijo) por bloques en un pool de procesos.
+    `funcion` debe ser importable (p. ej. generar_muestras o muestras_discretas).
+    Devuelve un ndarray, o una MuestraCompartida si compartida=True (evita la copia final)."""
+    if cantidad <= 0:
+        raise ValueError("Cantidad debe ser > 0")
+    if tam_bloque <= 0:
+        raise ValueError("El tamaño de bloque debe ser > 0")
+    if trabajadores is None:
+        trabajadores = os.cpu_count() or 1
+    dtype = np.dtype(dtype)
+    n_bloques = -(-cantidad // tam_bloque)
+    hijos = np.random.SeedSequence(semilla).spawn(n_bloques)
+    limites = [(i * tam_bloque, min(cantidad, (i + 1) * tam_bloque)) for i in range(n_bloques)]
+
+    shm = shared_memory.SharedMemory(create=True, size=cantidad * dtype.itemsize)
+    muestra = MuestraCompartida(shm, cantidad, dtype)
+    try:
+        if trabajadores <= 1 or n_bloques == 1:
+            for (ini, fin), hijo in zip(limites, hijos):
+                _llenar_bloque(shm.name, cantidad, dtype, ini, fin, funcion, args, hijo)
+        else:
+            with _pool(min(trabajadores, n_bloques)) as pool:
+                tareas = [pool.submit(_llenar_bloque, shm.name, cantidad, dtype, ini, fin, funcion, args, hijo)
+                          for (ini, fin), hijo in zip(limites, hijos)]
+                for t in tareas:
+                    t.result()
+    except BaseException:
+        muestra.liberar()
+        raise
+    if compartida:
+        return muestra
+    with muestra:
+        return muestra.datos.copy()
+
+def _generar_bloque(funcion: Callable, args: Sequence, n: int, semilla: np.random.SeedSequence) -> np.ndarray:
+    return funcion(*args, n, semilla=semilla)
+
+def bloques_paralelo(funcion: Callable, args: Sequence, cantidad: int, semilla=None,
+                     trabajadores: Optional[int]=None, tam_bloque: int=TAM_BLOQUE) -> Iterator[np.ndarray]:
+    """Bloques funcion(*args, n_bloque, semilla=hijo) en orden, los mismos que generar_paralelo,
+    generados en un pool de procesos con a lo sumo BLOQUES_EN_VUELO por trabajador pendientes.
+    Con un trabajador o un solo bloque se generan en el proceso actual."""
+    if cantidad <= 0:
+        raise ValueError("Cantidad debe ser > 0")
+    if tam_bloque <= 0:
+        raise ValueError("El tamaño de bloque debe ser > 0")
+    if trabajadores is None:
+        trabajadores = os.cpu_count() or 1
+    n_bloques = -(-cantidad // tam_bloque)
+    hijos = np.random.SeedSequence(semilla).spawn(n_bloques)
+    tamanos = [min(tam_bloque, cantidad - i * tam_bloque) for i in range(n_bloques)]
+    trabajadores = min(trabajadores, n_bloques)
+    if trabajadores <= 1:
+        for n, hijo in zip(tamanos, hijos):
+            yield funcion(*args, n, semilla=hijo)
+        return
+    pool = _pool(trabajadores)
+    try:
+        en_vuelo = deque()
+        for n, hijo in zip(tamanos, hijos):
+            en_vuelo.append(pool.submit(_generar_bloque, funcion, args, n, hijo))
+            if len(en_vuelo) >= BLOQUES_EN_VUELO * trabajadores:
+                yield en_vuelo.popleft().result()
+        while en_vuelo:
+            yield en_vuelo.popleft().result()
+    finally:
+        # si quien consume corta (p. ej. cancelar), no se generan los bloques pendientes
+        pool.shutdown(wait=True, cancel_futures=True)
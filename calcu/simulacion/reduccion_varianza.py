@@ -0,0 +1,97 @@
+"""
+Técnicas de reducción de varianza: antitéticas, estratificado, hipercubo latino
+y variable de control
+Las muestras se obtienen por transformada inversa (simulacion.inversa), así que
+sirven para las distribuciones continuas y discretas. Cada modo estima E[g(X)]
+(la media si no se da g) e informa cuánto redujo la varianza del estimador
+frente al muestreo simple con la misma cantidad de valores. Los modos que
+agrupan (pares, estratos, réplicas) completan el último grupo, así que pueden
+usar unos valores más que los pedidos: el informe trae ambos (n y n_pedido) y
+nota_tamano() lo resume para mostrarlo junto a la reducción.
+"""
+from typing import Callable, Dict, Any, Optional, Tuple
+import numpy as np
+
+from simulacion.inversa import continua_desde_u, discreta_desde_u
+
+MODOS = ["Simple", "Antitética", "Estratificada", "Hipercubo latino", "Variable de control"]
+# valores por estrato en el modo estratificado (>= 2 para estimar la varianza interna)
+POR_ESTRATO = 10
+# réplicas independientes del hipercubo latino
+REPLICAS_HIPERCUBO = 10
+
+def _uniformes(modo: str, cantidad: int, rng: np.random.Generator) -> np.ndarray:
+    """Uniformes con la estructura del modo: cada fila es un grupo para el estimador."""
+    if modo in ("Simple", "Variable de control"):
+        return rng.random((1, cantidad))
+    # grupos redondeados hacia arriba: nunca menos valores que los pedidos
+    if modo == "Antitética":
+        if cantidad < 4:
+            raise ValueError("Se requieren al menos 4 valores.")
+        m = -(-cantidad // 2)
+        u = rng.random(m)
+        return np.stack([u, 1.0 - u])
+    if modo == "Estratificada":
+        if cantidad < POR_ESTRATO:
+            raise ValueError(f"Se requieren al menos {POR_ESTRATO} valores.")
+        k = -(-cantidad // POR_ESTRATO)
+        # fila j: POR_ESTRATO valores dentro de [j/k, (j+1)/k)
+        return (np.arange(k)[:, None] + rng.random((k, POR_ESTRATO))) / k
+    if modo == "Hipercubo latino":
+        if cantidad < REPLICAS_HIPERCUBO:
+            raise ValueError(f"Se requieren al menos {REPLICAS_HIPERCUBO} valores.")
+        m = -(-cantidad // REPLICAS_HIPERCUBO)
+        # cada réplica toma un valor por estrato, en orden aleatorio
+        u = (np.arange(m) + rng.random((REPLICAS_HIPERCUBO, m))) / m
+        return rng.permuted(u, axis=1)
+    raise ValueError(f"Modo no soportado: {modo}")
+
+def _estimador(modo: str, u: np.ndarray, g: np.ndarray) -> Tuple[float, float]:
+    """(estimación, varianza del estimador) según la estructura de u y g."""
+    if modo == "Simple":
+        return float(g.mean()), float(g.var(ddof=1) / g.size)
+    if modo == "Antitética":
+        pares = g.mean(axis=0)
+        return float(pares.mean()), float(pares.var(ddof=1) / pares.size)
+    if modo == "Estratificada":
+        k = g.shape[0]
+        # estratos de igual probabilidad 1/k
+        return float(g.mean()), float((g.var(axis=1, ddof=1) / g.shape[1]).sum() / k ** 2)
+    if modo == "Hipercubo latino":
+        medias = g.mean(axis=1)
+        return float(medias.mean()), float(medias.var(ddof=1) / medias.size)
+    if modo == "Variable de control":
+        # control: el propio u, con E[u] = 1/2 y Var[u] = 1/12 conocidas
+        c = u.ravel(); y = g.ravel()
+        beta = float(np.cov(y, c, ddof=1)[0, 1] * 12.0)
+        ajustado = y - beta * (c - 0.5)
+        return float(ajustado.mean()), float(ajustado.var(ddof=1) / ajustado.size)
+    raise ValueError(f"Modo no soportado: {modo}")
+
+def muestrear_con_reduccion(dist: str, params: Dict[str, Any], cantidad: int, modo: str="Simple",
+                            semilla=None, discreta: bool=False,
+                            funcion: Optional[Callable[[np.ndarray], np.ndarray]]=None) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """Devuelve (valores, informe). El informe trae la estimación de E[g(X)], su error
+    estándar y la reducción de varianza lograda respecto del muestreo simple."""
+    if cantidad < 2:
+        raise ValueError("Se requieren al menos 2 valores.")
+    rng = np.random.default_rng(semilla)
+    u = _uniformes(modo, cantidad, rng)
+    transformar = discreta_desde_u if discreta else continua_desde_u
+    x = transformar(dist, params, u.ravel()).reshape(u.shape)
+    g = np.asarray(funcion(x) if funcion is not None else x, dtype=float)
+    estimacion, var_est = _estimador(modo, u, g)
+    # referencia: varianza del estimador simple con los mismos n valores
+    n = g.size
+    var_simple = float(g.var(ddof=1) / n)
+    reduccion = var_simple / var_est if var_est > 0 else float("inf")
+    informe = {"modo": modo, "n": n, "n_pedido": int(cantidad), "estimacion": estimacion, "error_estandar": var_est ** 0.5,
+               "varianza_estimador": var_est, "varianza_simple": var_simple, "reduccion": reduccion,
+               "n_simple_equivalente": int(round(n * reduccion)) if np.isfinite(reduccion) else None}
+    return x.ravel(), informe
+
+def nota_tamano(informe: Dict[str, Any]) -> str:
+    """'' si se usaron los valores pedidos; si no, cuántos se usaron."""
+    if informe["n"] == informe["n_pedido"]:
+        return ""
+    return f"n usado: {informe['n']} (pedidos {informe['n_pedido']}; el modo completa grupos)"
@@ -0,0 +1,54 @@
+"""
+Muestreo discreto por búsqueda indexada (tabla guía de Chen y Asau)
+La tabla guía g[j] = min{i : F(i) > j/m} deja cada u a uno o dos pasos del
+valor buscado, así transformar un arreglo de uniformes cuesta casi O(1) por
+muestra. Las tablas (PMF, CDF y guía) se construyen una vez por (n, p) o λ
+y se reutilizan entre llamadas.
+"""
+from functools import lru_cache
+import math
+import numpy as np
+from scipy.stats import binom, poisson
+
+# celdas mínimas de la guía: con soportes pequeños más celdas evitan pasos extra
+M_MINIMO = 1024
+
+class TablaGuia:
+    """Distribución discreta sobre inicio, inicio+1, ... dada por su CDF."""
+    def __init__(self, cdf: np.ndarray, inicio: int=0, m: int=None):
+        cdf = np.asarray(cdf, dtype=float).copy()
+        if cdf.ndim != 1 or cdf.size == 0:
+            raise ValueError("La CDF debe ser un arreglo no vacío.")
+        cdf[-1] = 1.0
+        self.cdf = cdf
+        self.pmf = np.diff(cdf, prepend=0.0)
+        self.inicio = int(inicio)
+        self.m = int(m) if m else max(cdf.size, M_MINIMO)
+        self.guia = np.searchsorted(cdf, np.arange(self.m) / self.m, side="right")
+
+    @property
+    def valores(self) -> np.ndarray:
+        return np.arange(self.inicio, self.inicio + self.cdf.size)
+
+    def muestrear(self, u) -> np.ndarray:
+        u = np.asarray(u, dtype=float)
+        j = np.minimum((u * self.m).astype(np.intp), self.m - 1)
+        i = self.guia[j]
+        # avanza solo los que aún no alcanzan su intervalo (pocos y cada vez menos);
+        # u = 1 (o por encima de la CDF) se queda en el último valor
+        ultimo = self.cdf.size - 1
+        pend = np.flatnonzero((self.cdf[i] <= u) & (i < ultimo))
+        while pend.size:
+            i[pend] += 1
+            pend = pend[(self.cdf[i[pend]] <= u[pend]) & (i[pend] < ultimo)]
+        return i.astype(np.int64) + self.inicio
+
+@lru_cache(maxsize=128)
+def guia_binomial(n: int, p: float) -> TablaGuia:
+    return TablaGuia(binom.cdf(np.arange(n + 1), n, p))
+
+@lru_cache(maxsize=128)
+def guia_poisson(lam: float) -> TablaGuia:
+    # se trunca donde la cola restante es despreciable
+    tope = int(lam + 12 * math.sqrt(lam) + 20)
+    return TablaGuia(poisson.cdf(np.arange(tope + 1), lam))
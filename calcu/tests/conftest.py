@@ -0,0 +1,5 @@
+import os
+import sys
+
+# las pruebas importan los módulos del proyecto como lo hace main.py (desde calcu/)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
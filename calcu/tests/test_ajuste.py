@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+import simulacion.ajuste as aj
+from simulacion.ajuste import _loglik_binomial, _mejor_ensayos, ajustar, ajustar_archivo
+
+def _por_nombre(res):
+    return {r["distribucion"]: r for r in res}
+
+def test_continuas_y_discretas_se_ordenan_por_separado():
+    x = np.random.default_rng(0).binomial(20, 0.3, 20_000)
+    res = ajustar(x, semilla=1)
+    tipos = [r["tipo"] for r in res]
+    assert tipos == sorted(tipos, key=lambda t: t != "continua")
+    for tipo in ("continua", "discreta"):
+        grupo = [r for r in res if r["tipo"] == tipo]
+        assert [r["rango"] for r in grupo] == list(range(1, len(grupo) + 1))
+        assert [r["aic"] for r in grupo] == sorted(r["aic"] for r in grupo)
+    porn = _por_nombre(res)
+    assert porn["Binomial"]["rango"] == 1
+    assert porn["Binomial"]["params"]["n"] == pytest.approx(20, abs=2)
+    assert porn["Binomial"]["p_value"] > 1e-3
+
+def test_pruebas_por_tipo():
+    x = np.random.default_rng(1).poisson(6, 10_000)
+    for r in ajustar(x, semilla=1):
+        assert r["prueba"] == ("KS" if r["tipo"] == "continua" else "χ²")
+        assert 0.0 <= r["p_value"] <= 1.0
+
+def test_continuas_recuperan_parametros():
+    x = np.random.default_rng(2).gamma(3.0, 2.0, 50_000)
+    porn = _por_nombre(ajustar(x, semilla=1))
+    assert "Poisson" not in porn
+    assert porn["Gamma"]["rango"] == 1
+    assert porn["Gamma"]["params"]["p1"] == pytest.approx(6.0, rel=0.02)
+    assert porn["Gamma"]["params"]["p2"] == pytest.approx(12.0, rel=0.05)
+
+def test_busqueda_de_ensayos_igual_a_fuerza_bruta():
+    x = np.random.default_rng(3).binomial(150, 0.6, 5000)
+    valores, conteo = np.unique(x, return_counts=True)
+    valores, conteo = valores.astype(float), conteo.astype(float)
+    args = (x.size, x.mean(), valores, conteo, float(x.sum()), float(conteo @ aj.gammaln(valores + 1)))
+    todos = np.arange(x.max(), 10 * x.max() + 100)
+    esperado = int(todos[np.argmax(_loglik_binomial(todos, *args))])
+    assert _mejor_ensayos(lambda e: _loglik_binomial(e, *args), int(x.max()), 10 * int(x.max()) + 100) == esperado
+
+def test_maximo_enorme_no_ajusta_discretas():
+    x = np.random.default_rng(4).integers(0, 10**9, 3000)
+    res = ajustar(x, semilla=1)
+    assert res and all(r["tipo"] == "continua" for r in res)
+
+def test_sobredispersion_no_ajusta_binomial():
+    x = np.random.default_rng(5).negative_binomial(3, 0.3, 5000)
+    assert "Binomial" not in _por_nombre(ajustar(x, semilla=1))
+
+def test_archivo_por_bloques(tmp_path, monkeypatch):
+    x = np.random.default_rng(6).exponential(2.0, 30_000)
+    np.save(tmp_path / "x.npy", x)
+    monkeypatch.setattr(aj, "TAM_SUBMUESTRA", 1000)
+    submuestras = []
+    agregar = aj.EstadisticosSuficientes.agregar
+    def espiar(est, b):
+        agregar(est, b)
+        submuestras.append(est.submuestra.size)
+    monkeypatch.setattr(aj.EstadisticosSuficientes, "agregar", espiar)
+    bloques = []
+    res = ajustar_archivo(str(tmp_path / "x.npy"), semilla=2, progreso=lambda i, _: bloques.append(i))
+    assert bloques == [1]
+    assert submuestras == [1000]
+    assert _por_nombre(res)["Exponencial"]["params"]["p1"] == pytest.approx(x.mean())
+    ajustar_archivo(str(tmp_path / "x.npy"), semilla=2, tam_submuestra=500)
+    assert submuestras[-1] == 500
+
+def test_casi_constante_no_ajusta_weibull():
+    # la forma de Weibull quedaría muy por encima del intervalo de búsqueda
+    x = 1 + 1e-6 * np.random.default_rng(7).random(5000)
+    res = _por_nombre(ajustar(x, semilla=1))
+    assert "Weibull" not in res
+    assert "Normal" in res
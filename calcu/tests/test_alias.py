@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from simulacion.alias import TablaAlias, leer_tabla, parsear_tabla, tabla_a_texto, tabla_alias
+
+def test_frecuencias_chi_cuadrado():
+    valores, pesos = np.arange(6), np.array([1, 5, 0.5, 10, 3, 0.5])
+    x = TablaAlias(valores, pesos).muestrear(300_000, semilla=4)
+    observados = np.bincount(x, minlength=6)
+    assert stats.chisquare(observados, pesos / pesos.sum() * x.size).pvalue > 1e-3
+
+def test_probabilidad_exacta_por_columna():
+    # cada columna aporta prob a sí misma y 1-prob a su alias: se recupera la distribución exacta
+    pesos = np.array([0.1, 0.2, 0.3, 0.4])
+    t = TablaAlias(np.arange(4), pesos)
+    masa = t.prob.copy()
+    np.add.at(masa, t.alias, 1.0 - t.prob)
+    assert np.allclose(masa / 4, pesos)
+
+def test_peso_cero_nunca_sale():
+    x = TablaAlias([1, 2, 3], [1, 0, 1]).muestrear(50_000, semilla=1)
+    assert 2 not in x
+
+def test_parsear_y_texto():
+    valores, pesos = parsear_tabla("1:0.2; 2:0.3\n5,0.5")
+    assert valores.tolist() == [1, 2, 5] and pesos.tolist() == [0.2, 0.3, 0.5]
+    assert parsear_tabla(tabla_a_texto(valores, pesos))[0].tolist() == [1, 2, 5]
+
+def test_leer_tabla_con_encabezado(tmp_path):
+    ruta = tmp_path / "t.csv"
+    ruta.write_text("valor,peso\n1,3\n2,1\n", encoding="utf-8")
+    valores, pesos = leer_tabla(str(ruta))
+    assert valores.tolist() == [1, 2] and pesos.tolist() == [3, 1]
+
+def test_valores_no_enteros_se_conservan():
+    assert TablaAlias([0.5, 1.5], [1, 1]).muestrear(10, semilla=0).dtype == float
+
+def test_cache():
+    assert tabla_alias([1, 2], [1, 1]) is tabla_alias([1, 2], [1, 1])
+
+@pytest.mark.parametrize("valores, pesos", [([], []), ([1, 2], [1]), ([1], [-1]), ([1, 2], [0, 0])])
+def test_tablas_invalidas(valores, pesos):
+    with pytest.raises(ValueError):
+        TablaAlias(valores, pesos)
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+import simulacion.bootstrap as bs
+from simulacion.bootstrap import agrupar, bootstrap, bootstrap_conteos
+
+def test_conteos_igual_a_datos_repetidos():
+    valores, conteo = np.array([1.0, 2.0, 5.0]), np.array([30, 50, 20])
+    datos = np.repeat(valores, conteo)
+    a = bootstrap_conteos(valores, conteo, remuestras=2000, semilla=3)
+    b = bootstrap(datos, remuestras=2000, semilla=3)
+    assert a == b
+    assert a["media"]["estimacion"] == pytest.approx(datos.mean())
+    assert a["varianza"]["estimacion"] == pytest.approx(datos.var())
+    assert a["q0.5"]["estimacion"] == 2.0
+
+def test_intervalo_cubre_la_media():
+    x = np.random.default_rng(5).normal(10, 2, 3000)
+    r = bootstrap(x, remuestras=2000, semilla=1)
+    assert r["media"]["ic_inf"] < 10 < r["media"]["ic_sup"]
+    assert r["varianza"]["ic_inf"] < 4 < r["varianza"]["ic_sup"]
+
+def test_no_depende_de_los_trabajadores():
+    x = np.random.default_rng(2).random(500)
+    assert bootstrap(x, remuestras=300, semilla=4, trabajadores=1) == \
+        bootstrap(x, remuestras=300, semilla=4, trabajadores=2)
+
+def test_agrupar_conserva_n_media_y_varianza():
+    x = np.random.default_rng(1).exponential(3, 50_000)
+    valores, conteo, dentro = agrupar(*np.unique(x, return_counts=True), bins=256, colas=0)
+    assert conteo.sum() == x.size and valores.size <= 256
+    assert conteo.max() - conteo.min() <= 1
+    assert np.all(np.diff(valores) > 0)
+    media = conteo @ valores / x.size
+    assert media == pytest.approx(x.mean(), rel=1e-12)
+    assert conteo @ ((valores - media) ** 2 + dentro) / x.size == pytest.approx(x.var(), rel=1e-9)
+
+def test_agrupar_deja_las_colas_sueltas():
+    x = np.random.default_rng(3).standard_cauchy(20_000)
+    valores, conteo, dentro = agrupar(*np.unique(x, return_counts=True), bins=512, colas=100)
+    orden = np.sort(x)
+    assert np.array_equal(valores[:100], orden[:100]) and np.array_equal(valores[-100:], orden[-100:])
+    assert np.all(conteo[:100] == 1) and np.all(dentro[-100:] == 0)
+
+def test_agrupado_para_n_grande_se_parece_al_de_indices(monkeypatch):
+    x = np.random.default_rng(8).exponential(5, 4000)
+    exacto = bootstrap(x, remuestras=1000, semilla=2)
+    monkeypatch.setattr(bs, "MAX_INDICES", 1000)
+    monkeypatch.setattr(bs, "BINS_AGRUPADO", 512)
+    agrupado = bootstrap(x, remuestras=1000, semilla=2)
+    assert agrupado["agrupado"] and "agrupado" not in exacto
+    for nombre in ("media", "varianza", "q0.5"):
+        assert agrupado[nombre]["estimacion"] == pytest.approx(exacto[nombre]["estimacion"], rel=1e-12)
+        ancho = exacto[nombre]["ic_sup"] - exacto[nombre]["ic_inf"]
+        assert agrupado[nombre]["ic_inf"] == pytest.approx(exacto[nombre]["ic_inf"], abs=0.2 * ancho)
+        assert agrupado[nombre]["ic_sup"] == pytest.approx(exacto[nombre]["ic_sup"], abs=0.2 * ancho)
+
+def test_tabla_con_muchos_valores_distintos():
+    valores = np.arange(0, 10**9, 10**4)
+    r = bootstrap_conteos(valores, np.ones(valores.size, dtype=np.int64), remuestras=200, semilla=1)
+    assert r["agrupado"]
+    assert r["media"]["estimacion"] == pytest.approx(valores.mean())
+    assert r["media"]["ic_inf"] < valores.mean() < r["media"]["ic_sup"]
+
+def test_datos_constantes():
+    r = bootstrap(np.full(50_000, 2.5), remuestras=100, semilla=0)
+    assert r["media"]["ic_inf"] == r["media"]["ic_sup"] == 2.5
+
+def test_muy_pocos_datos():
+    with pytest.raises(ValueError):
+        bootstrap([1.0])
+
+@pytest.mark.parametrize("muestra", [
+    lambda rng: rng.weibull(0.3, 200_000),
+    lambda rng: rng.standard_cauchy(200_000),
+])
+def test_varianza_con_colas_pesadas_dentro_del_intervalo(muestra):
+    x = muestra(np.random.default_rng(4))
+    r = bootstrap(x, remuestras=400, semilla=1)
+    assert r["agrupado"]
+    v = r["varianza"]
+    assert v["estimacion"] == pytest.approx(x.var(), rel=1e-9)
+    assert v["ic_inf"] <= v["estimacion"] <= v["ic_sup"]
+    q = r["q0.5"]
+    assert q["ic_inf"] <= q["estimacion"] <= q["ic_sup"]
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from datos.archivos import abrir_secuencia
+from datos.exportar import exportar
+
+GRANDES = np.array([2**53 + 1, 2**62 + 7, -(2**60) - 3, 5], dtype=np.int64)
+
+def test_csv_enteros_exactos(tmp_path):
+    ruta = tmp_path / "x.csv"
+    exportar(str(ruta), [("x_i", GRANDES), ("u_i", np.linspace(0, 1, 4))], formatos=["%d", "%.10f"],
+             tam_bloque=3)
+    lineas = ruta.read_text(encoding="utf-8").splitlines()
+    assert lineas[0] == "i,x_i,u_i"
+    assert [int(l.split(",")[1]) for l in lineas[1:]] == GRANDES.tolist()
+    assert [int(l.split(",")[0]) for l in lineas[1:]] == [1, 2, 3, 4]
+
+def test_npz_enteros_exactos(tmp_path):
+    ruta = tmp_path / "x.npz"
+    exportar(str(ruta), [("x_i", GRANDES), ("u_i", np.arange(4) / 4)], formatos=["%d", "%.10f"], tam_bloque=3)
+    with np.load(ruta) as npz:
+        assert npz["x_i"].dtype == np.int64 and np.array_equal(npz["x_i"], GRANDES)
+        assert np.array_equal(npz["u_i"], np.arange(4) / 4)
+
+def test_lista_de_enteros_python(tmp_path):
+    ruta = tmp_path / "x.csv"
+    exportar(str(ruta), [("x_i", [2**60 + 1, 3])], formatos=["%d"], indice=None)
+    assert ruta.read_text(encoding="utf-8").splitlines()[1:] == [str(2**60 + 1), "3"]
+
+@pytest.mark.parametrize("nombre", ["u.npy", "u.f64", "u.csv"])
+def test_vuelve_a_abrirse(tmp_path, nombre):
+    u = np.random.default_rng(0).random(2501)
+    ruta = str(tmp_path / nombre)
+    avances = []
+    exportar(ruta, [("x_i", None), ("u_i", u)], formatos=["%d", "%.17g"], tam_bloque=1000,
+             progreso=lambda h, t: avances.append((h, t)))
+    assert avances[-1] == (2501, 2501) and len(avances) == 3
+    assert np.array_equal(np.asarray(abrir_secuencia(ruta)[:] if nombre != "u.csv"
+                                     else np.concatenate(list(abrir_secuencia(ruta).bloques()))), u)
+
+def test_archivo_parcial_se_borra(tmp_path):
+    ruta = tmp_path / "u.csv"
+    def cortar(hechos, total):
+        raise KeyboardInterrupt
+    with pytest.raises(KeyboardInterrupt):
+        exportar(str(ruta), [("u_i", np.arange(10.0))], tam_bloque=3, progreso=cortar)
+    assert not ruta.exists()
+
+def test_longitudes_distintas(tmp_path):
+    with pytest.raises(ValueError):
+        exportar(str(tmp_path / "x.csv"), [("a", [1, 2]), ("b", [1.0])])
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from formularioDeDistribucionesVariables import generar_muestras
+
+CASOS = [
+    ("Uniforme", {"p1": 2, "p2": 5}, 3.5, 0.75),
+    ("k-Erlang", {"p1": 3, "p2": 6}, 6.0, 12.0),
+    ("Exponencial", {"p1": 2}, 2.0, 4.0),
+    ("Gamma", {"p1": 4, "p2": 2}, 4.0, 2.0),
+    ("Normal", {"p1": 1, "p2": 9}, 1.0, 9.0),
+]
+
+@pytest.mark.parametrize("dist, params, media, varianza", CASOS)
+def test_momentos(dist, params, media, varianza):
+    x = generar_muestras(dist, params, 200_000, semilla=1)
+    assert x.shape == (200_000,)
+    assert x.mean() == pytest.approx(media, abs=5 * np.sqrt(varianza / x.size) + 0.01)
+    assert x.var() == pytest.approx(varianza, rel=0.03)
+
+def test_semilla_reproducible():
+    a = generar_muestras("Normal", {"p1": 0, "p2": 1}, 1000, semilla=42)
+    b = generar_muestras("Normal", {"p1": 0, "p2": 1}, 1000, semilla=np.random.SeedSequence(42))
+    assert np.array_equal(a, b)
+    assert not np.array_equal(a, generar_muestras("Normal", {"p1": 0, "p2": 1}, 1000, semilla=43))
+
+def test_redondeo_a_dos_decimales():
+    x = generar_muestras("Uniforme", {"p1": 0, "p2": 1}, 1000, semilla=3)
+    assert np.allclose(x, np.round(x, 2))
+
+@pytest.mark.parametrize("dist, params", [
+    ("Uniforme", {"p1": 5, "p2": 5}),
+    ("Exponencial", {"p1": 0}),
+    ("Gamma", {"p1": 1, "p2": 0}),
+    ("Weibull", {"p1": -1, "p2": 1}),
+])
+def test_parametros_invalidos(dist, params):
+    with pytest.raises(ValueError):
+        generar_muestras(dist, params, 10)
+
+def test_distribucion_desconocida():
+    assert generar_muestras("Cauchy", {}, 10).size == 0
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from vida.hashlife import MotorHashlife, UniversoHashlife
+from vida.reglas import REGLAS
+from vida.simulador import Simulador
+from vida_referencia import aleatorio, avanzar
+
+@pytest.mark.parametrize("regla", list(REGLAS))
+def test_igual_a_la_referencia_en_el_plano(regla):
+    # sopa en el centro de un tablero grande: en pocas generaciones no llega al borde
+    inicial = np.zeros((48, 48), dtype=np.uint8)
+    inicial[18:30, 18:30] = aleatorio(12, 12, semilla=4)
+    m = MotorHashlife(inicial, regla)
+    for n in (1, 2, 5):
+        m.paso(n)
+        inicial = avanzar(inicial, n, regla)
+        assert np.array_equal(m.tablero, inicial)
+        assert m.poblacion() == int(inicial.sum())
+
+def test_salto_grande_de_un_planeador():
+    t = np.zeros((8, 8), dtype=np.uint8)
+    t[0, 1] = t[1, 2] = t[2, 0] = t[2, 1] = t[2, 2] = 1
+    u = UniversoHashlife()
+    u.cargar(t)
+    u.avanzar(4 * 1000)
+    # cada 4 generaciones el planeador se desplaza una celda en diagonal
+    assert u.poblacion == 5
+    assert np.array_equal(u.region(1000, 1000, 8, 8), t)
+
+def test_alternar():
+    m = MotorHashlife(np.zeros((6, 6), dtype=np.uint8))
+    m.alternar(2, 3)
+    assert m.tablero[2, 3] == 1 and m.poblacion() == 1
+    assert m.celda(2, 3) == 1 and m.celda(3, 2) == 0
+    m.alternar(2, 3)
+    assert m.poblacion() == 0
+
+def test_rechaza_bordes():
+    with pytest.raises(ValueError):
+        MotorHashlife(np.zeros((4, 4)), borde="toroidal")
+
+def test_saltar_en_el_hilo_del_simulador():
+    inicial = aleatorio(30, 30, semilla=2)
+    sim = Simulador(MotorHashlife(inicial))
+    sim.saltar(37)
+    sim._hilo.join(30)
+    assert not sim.corriendo and sim.error is None
+    assert sim.generacion == 37 and sim.restantes is None
+    tablero, generacion, _ = sim.instantanea
+    assert generacion == 37
+    assert np.array_equal(tablero, sim.motor.tablero)
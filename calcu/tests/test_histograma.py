@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from formularioDeDistribucionesVariables import generar_muestras
+from simulacion.discretas import muestras_discretas
+from simulacion.histograma import (AcumuladorContinuo, AcumuladorDiscreto, acumular_por_bloques,
+                                   semilla_en_memoria)
+
+def test_momentos_por_bloques_igual_a_una_pasada():
+    x = np.random.default_rng(0).normal(3, 2, 10_007)
+    acum = AcumuladorContinuo(20)
+    for ini in range(0, x.size, 1000):
+        acum.agregar(x[ini:ini + 1000])
+    assert acum.n == x.size
+    assert acum.media == pytest.approx(x.mean(), rel=1e-12)
+    assert acum.varianza == pytest.approx(x.var(), rel=1e-10)
+    assert np.array_equal(acum.muestra_inicial, x[:1000])
+
+def test_desborde_se_cuenta_por_lado():
+    acum = AcumuladorContinuo(4, 0.0, 1.0)
+    acum.agregar(np.array([-1.0, 0.0, 0.5, 1.0, 2.0, 3.0]))
+    assert acum.conteo.sum() == 3
+    assert (acum.bajo, acum.sobre, acum.fuera) == (1, 2, 3)
+    assert "1 por debajo" in acum.texto_fuera()
+    vacio = AcumuladorContinuo(4, 0.0, 1.0)
+    vacio.agregar(np.array([0.2]))
+    assert vacio.texto_fuera() == ""
+
+def test_bordes_del_primer_bloque():
+    acum = AcumuladorContinuo(10)
+    acum.agregar(np.linspace(0, 1, 100))
+    acum.agregar(np.array([5.0]))
+    assert acum.bordes[0] < 0 < 1 < acum.bordes[-1] < 5
+    assert acum.sobre == 1
+
+def test_discreto_igual_a_unique():
+    x = np.random.default_rng(1).poisson(7, 5000)
+    acum = AcumuladorDiscreto()
+    for ini in range(0, x.size, 700):
+        acum.agregar(x[ini:ini + 700])
+    esperado = np.unique(x, return_counts=True)
+    valores, conteo = acum.tabla()
+    assert np.array_equal(valores, esperado[0]) and np.array_equal(conteo, esperado[1])
+
+def test_semilla_igual_en_memoria_y_por_bloques():
+    args = ("Normal", {"p1": 0, "p2": 1})
+    en_memoria = generar_muestras(*args, 1000, semilla=semilla_en_memoria(9))
+    acum = acumular_por_bloques(generar_muestras, args, 2500, AcumuladorContinuo(10), semilla=9, tam_bloque=1000)
+    assert np.array_equal(acum.muestra_inicial, en_memoria)
+
+def test_progreso_y_varios_destinos():
+    llamadas = []
+    a, b = AcumuladorDiscreto(), AcumuladorDiscreto()
+    acumular_por_bloques(muestras_discretas, ("Bernoulli", {"p": 0.5}), 2500, (a, b), semilla=1,
+                         tam_bloque=1000, progreso=lambda h, t: llamadas.append((h, t)))
+    assert llamadas == [(1, 3), (2, 3), (3, 3)]
+    assert a.n == b.n == 2500
+
+def test_con_procesos_igual_que_en_serie():
+    args = ("Poisson", {"lam": 3})
+    serie = acumular_por_bloques(muestras_discretas, args, 5000, AcumuladorDiscreto(), semilla=4, tam_bloque=700)
+    pool = acumular_por_bloques(muestras_discretas, args, 5000, AcumuladorDiscreto(), semilla=4, tam_bloque=700,
+                                trabajadores=2)
+    for x, y in zip(serie.tabla(), pool.tabla()):
+        assert np.array_equal(x, y)
+    assert pool.media == serie.media and pool.n == 5000
+
+def test_cortar_con_procesos():
+    class Cortado(Exception):
+        pass
+    def progreso(hechos, total):
+        if hechos == 2:
+            raise Cortado
+    acum = AcumuladorDiscreto()
+    with pytest.raises(Cortado):
+        acumular_por_bloques(muestras_discretas, ("Bernoulli", {"p": 0.5}), 10_000, acum, semilla=1,
+                             tam_bloque=1000, progreso=progreso, trabajadores=2)
+    assert acum.n == 2000
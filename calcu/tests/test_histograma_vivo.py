@@ -0,0 +1,35 @@
+import numpy as np
+
+from interfaz.histograma_vivo import MAX_BARRAS, agrupar, agrupar_tabla, bordes_enteros
+
+def test_enteros_una_barra_por_valor():
+    conteo, bordes = agrupar(np.array([3, 3, 5, 7]))
+    assert conteo.tolist() == [2, 0, 1, 0, 1]
+    assert bordes.tolist() == [2.5, 3.5, 4.5, 5.5, 6.5, 7.5]
+
+def test_rango_enorme_se_agrupa_en_intervalos():
+    x = np.random.default_rng(0).integers(0, 10**9 + 1, 10_000)
+    conteo, bordes = agrupar(x)
+    assert conteo.size <= MAX_BARRAS and conteo.sum() == x.size
+    assert bordes[0] <= x.min() - 0.5 and bordes[-1] >= x.max() + 0.5
+    assert np.all(np.diff(bordes) == bordes[1] - bordes[0])
+
+def test_tabla_igual_a_datos():
+    x = np.random.default_rng(1).integers(-5 * 10**6, 5 * 10**6, 5000)
+    valores, conteo = np.unique(x, return_counts=True)
+    de_tabla = agrupar_tabla(valores, conteo)
+    de_datos = agrupar(x)
+    assert np.array_equal(de_tabla[0], de_datos[0]) and np.array_equal(de_tabla[1], de_datos[1])
+    chica = agrupar_tabla(np.array([2, 4]), np.array([1, 3]))
+    assert chica[0].tolist() == [1, 0, 3]
+
+def test_bordes_enteros_cubren_el_rango():
+    for inicio, fin in [(0, 999), (0, 1000), (7, 7), (-3, 10**9)]:
+        bordes = bordes_enteros(inicio, fin)
+        ancho = bordes[1] - bordes[0]
+        assert ancho == int(ancho) and bordes.size - 1 <= MAX_BARRAS
+        assert bordes[0] == inicio - 0.5 and fin + 0.5 <= bordes[-1] < fin + 0.5 + ancho
+
+def test_continuos_con_histogram():
+    conteo, bordes = agrupar(np.linspace(0, 1, 100), bins=4)
+    assert conteo.tolist() == [25, 25, 25, 25] and bordes.size == 5
@@ -0,0 +1,109 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from vida.historia import Historia
+from vida.motor_numpy import MotorNumpy
+from vida.simulador import Simulador
+from vida_referencia import aleatorio
+
+def _registrar(h, motor, generaciones):
+    estados = [np.array(motor.tablero)]
+    for g in range(1, generaciones + 1):
+        motor.paso()
+        h.registrar(motor.tablero, g)
+        estados.append(np.array(motor.tablero))
+    return estados
+
+def test_retroceder_y_repetir():
+    m = MotorNumpy(aleatorio(30, 41, semilla=1))
+    h = Historia()
+    h.reiniciar(m.tablero, 0)
+    estados = _registrar(h, m, 10)
+    assert len(h) == 11 and h.posicion == 10
+    tablero, g = h.atras(3)
+    assert g == 7 and np.array_equal(tablero, estados[7])
+    tablero, g = h.atras(100)
+    assert g == 0 and np.array_equal(tablero, estados[0])
+    assert h.atras() is None
+    tablero, g = h.adelante(4)
+    assert g == 4 and np.array_equal(tablero, estados[4])
+    tablero, g = h.adelante(100)
+    assert g == 10 and np.array_equal(tablero, estados[10])
+    assert h.adelante() is None
+
+def test_registrar_tras_retroceder_descarta_lo_posterior():
+    h = Historia()
+    a, b, c = (aleatorio(8, 8, semilla=s) for s in (1, 2, 3))
+    h.reiniciar(a, 0)
+    h.registrar(b, 1)
+    h.atras()
+    h.registrar(c, 5)
+    assert len(h) == 2
+    assert h.actual()[1] == 5 and np.array_equal(h.actual()[0], c)
+    assert np.array_equal(h.atras()[0], a)
+
+def test_anillo_acotado_por_bytes():
+    t = aleatorio(64, 64, semilla=4)
+    h = Historia(max_bytes=4096)
+    h.reiniciar(t, 0)
+    for g in range(1, 50):
+        # estados muy distintos: deltas densos
+        h.registrar(aleatorio(64, 64, semilla=g), g)
+    assert h.bytes_usados <= 4096
+    assert 1 < len(h) < 50
+    posicion, estados, usados = h.resumen()
+    assert (posicion, estados, usados) == (len(h) - 1, len(h), h.bytes_usados)
+    # lo más antiguo que queda
+    assert h.atras(1000)[1] == 50 - len(h)
+
+def test_cambio_de_forma_reinicia():
+    h = Historia()
+    h.reiniciar(np.zeros((4, 4)), 0)
+    h.registrar(np.ones((5, 5)), 3)
+    assert len(h) == 1 and h.forma == (5, 5) and h.actual()[1] == 3
+
+def test_lectura_desde_otro_hilo():
+    h = Historia()
+    m = MotorNumpy(aleatorio(50, 50, semilla=6))
+    h.reiniciar(m.tablero, 0)
+    fin = threading.Event()
+    errores = []
+
+    def leer():
+        try:
+            while not fin.is_set():
+                posicion, estados, _ = h.resumen()
+                assert 0 <= posicion < estados
+                h.actual()
+        except Exception as e:
+            errores.append(e)
+    lector = threading.Thread(target=leer)
+    lector.start()
+    try:
+        _registrar(h, m, 200)
+    finally:
+        fin.set()
+        lector.join()
+    assert not errores
+
+def test_max_bytes_invalido():
+    with pytest.raises(ValueError):
+        Historia(0)
+
+def test_simulador_en_turbo_registra_un_estado_por_cuadro():
+    m = MotorNumpy(aleatorio(32, 32, semilla=7))
+    sim = Simulador(m, fps=20)
+    sim.historia = h = Historia()
+    h.reiniciar(m.tablero, 0)
+    sim.turbo = True
+    sim.iniciar()
+    time.sleep(0.3)
+    sim.detener()
+    # muchas más generaciones que estados: ~20 por segundo más el del final
+    assert sim.generacion > 3 * len(h)
+    assert len(h) <= 0.3 * 20 + 4
+    tablero, g = h.actual()
+    assert g == sim.generacion and np.array_equal(tablero, m.tablero)
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from datos.archivos import abrir_secuencia
+from datos.exportar import exportar
+from simulacion.inversa import VariableDesdeU, continua_desde_u, cuantil_gamma, discreta_desde_u
+
+U = np.linspace(0.001, 0.999, 999)
+
+@pytest.mark.parametrize("dist, params, esperado", [
+    ("Uniforme", {"p1": 2, "p2": 6}, stats.uniform(2, 4)),
+    ("Exponencial", {"p1": 3}, stats.expon(scale=3)),
+    ("Normal", {"p1": 1, "p2": 4}, stats.norm(1, 2)),
+    ("Gamma", {"p1": 3, "p2": 2}, stats.gamma(4.5, scale=2 / 3)),
+    ("k-Erlang", {"p1": 2, "p2": 4}, stats.gamma(2, scale=2)),
+])
+def test_continuas_coinciden_con_ppf(dist, params, esperado):
+    x = continua_desde_u(dist, params, U)
+    assert np.allclose(x, esperado.ppf(U), rtol=1e-5, atol=1e-6)
+
+def test_cuantil_gamma_en_las_colas():
+    u = np.array([1e-10, 1e-6, 0.5, 1 - 1e-6])
+    assert np.allclose(cuantil_gamma(0.7, 1.5, u), stats.gamma(0.7, scale=1.5).ppf(u), rtol=1e-4)
+
+def test_u_extremos_no_dan_infinitos():
+    x = continua_desde_u("Exponencial", {"p1": 1}, np.array([0.0, 1.0]))
+    assert np.isfinite(x).all()
+
+def test_u_fuera_de_rango():
+    with pytest.raises(ValueError):
+        continua_desde_u("Normal", {"p1": 0, "p2": 1}, [1.5])
+
+@pytest.mark.parametrize("nombre, params, esperado", [
+    ("Uniforme", {"a": 3, "b": 7}, stats.randint(3, 8)),
+    ("Bernoulli", {"p": 0.3}, stats.bernoulli(0.3)),
+    ("Binomial", {"n": 12, "p": 0.4}, stats.binom(12, 0.4)),
+    ("Poisson", {"lam": 3.5}, stats.poisson(3.5)),
+])
+def test_discretas_coinciden_con_ppf(nombre, params, esperado):
+    # la inversa de la CDF discreta es min{x : F(x) >= u}; se evitan los saltos exactos
+    u = U[np.abs(esperado.cdf(esperado.ppf(U)) - U) > 1e-9]
+    assert np.array_equal(discreta_desde_u(nombre, params, u), esperado.ppf(u).astype(np.int64))
+
+@pytest.mark.parametrize("tipo, dist, params", [
+    ("Continua", "Exponencial", {"p1": 2}),
+    ("Discreta", "Poisson", {"lam": 3}),
+])
+def test_variable_por_bloques_igual_que_de_una_vez(tipo, dist, params):
+    us = np.random.default_rng(1).random(2500)
+    desde_u = continua_desde_u if tipo == "Continua" else discreta_desde_u
+    variable = VariableDesdeU(tipo, dist, params, us)
+    assert len(variable) == us.size
+    assert np.array_equal(np.concatenate(list(variable.bloques(700))), desde_u(dist, params, us))
+    assert np.array_equal(variable.primeros(10), desde_u(dist, params, us[:10]))
+
+def test_variable_desde_archivo_se_exporta(tmp_path):
+    us = np.random.default_rng(2).random(1000)
+    np.save(tmp_path / "u.npy", us)
+    variable = VariableDesdeU("Discreta", "Binomial", {"n": 10, "p": 0.3}, abrir_secuencia(str(tmp_path / "u.npy")))
+    exportar(str(tmp_path / "x.csv"), [("x", variable)], formatos=["%d"], tam_bloque=300)
+    x = np.loadtxt(tmp_path / "x.csv", delimiter=",", skiprows=1)[:, 1]
+    assert np.array_equal(x, discreta_desde_u("Binomial", {"n": 10, "p": 0.3}, us))
+
+def test_variable_tipo_desconocido():
+    with pytest.raises(ValueError):
+        VariableDesdeU("Mixta", "Normal", {}, np.array([0.5]))
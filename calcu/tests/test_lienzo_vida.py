@@ -0,0 +1,130 @@
+import numpy as np
+
+import interfaz.lienzo_vida as lv
+from interfaz.lienzo_vida import LienzoVida, ImagenVida, reducir, ppm
+
+class CanvasFalso:
+    """Lo mínimo de tk.Canvas que usa LienzoVida, llevando el estado de cada ítem."""
+    def __init__(self):
+        self.items = {}
+        self.configuraciones = 0
+
+    def _crear(self, tags, **opciones):
+        n = len(self.items) + 1
+        self.items[n] = dict(opciones, tags=tags)
+        return n
+
+    def create_rectangle(self, *coords, tags="", **opciones):
+        return self._crear(tags, **opciones)
+
+    def create_line(self, *coords, tags="", **opciones):
+        return self._crear(tags, **opciones)
+
+    def delete(self, *tags):
+        self.items = {k: v for k, v in self.items.items() if v["tags"] not in tags}
+
+    def create_image(self, *coords, tags="", **opciones):
+        return self._crear(tags, **opciones)
+
+    def cget(self, opcion):
+        return "#ffffff"
+
+    def winfo_rgb(self, color):
+        return {"#ffffff": (65535, 65535, 65535), "#000": (0, 0, 0), "#f00": (65535, 0, 0)}[color]
+
+    def itemconfigure(self, item, **opciones):
+        self.configuraciones += 1
+        objetivo = [k for k, v in self.items.items() if v["tags"] == item] if isinstance(item, str) else [item]
+        for k in objetivo:
+            self.items[k].update(opciones)
+
+def _visibles(lienzo, canvas):
+    return np.array([[canvas.items[i]["state"] == "normal" for i in fila] for fila in lienzo._ids.tolist()])
+
+def test_solo_cambia_las_celdas_distintas():
+    canvas = CanvasFalso()
+    lienzo = LienzoVida(canvas)
+    lienzo.configurar(4, 5, 10, "#000", "#ccc")
+    assert len(canvas.items) == 4 * 5 + (4 + 1) + (5 + 1)
+    t = np.zeros((4, 5), dtype=np.uint8)
+    t[1, 1:4] = 1
+    assert lienzo.dibujar(t) == 3
+    assert np.array_equal(_visibles(lienzo, canvas), t == 1)
+    u = t.copy()
+    u[1, 1], u[0, 2], u[2, 2] = 0, 1, 1
+    antes = canvas.configuraciones
+    assert lienzo.dibujar(u) == 3
+    assert canvas.configuraciones - antes == 3
+    assert np.array_equal(_visibles(lienzo, canvas), u == 1)
+    assert lienzo.dibujar(u) == 0
+
+def test_reconfigurar_no_acumula_items():
+    canvas = CanvasFalso()
+    lienzo = LienzoVida(canvas)
+    lienzo.configurar(3, 3, 10, "#000", "#ccc")
+    lienzo.configurar(3, 3, 10, "#000", "#ccc")
+    assert len(canvas.items) == 9 + 8
+    lienzo.configurar(2, 6, 8, "#000", "#ccc")
+    assert len(canvas.items) == 12 + 3 + 7
+    lienzo.colorear("#f00")
+    assert all(v["fill"] == "#f00" for v in canvas.items.values() if v["tags"] == "cell")
+
+class ImagenFalsa:
+    def __init__(self, master=None, width=0, height=0):
+        self.width, self.height = width, height
+        self.data = None
+
+    def configure(self, data=None, format=None):
+        self.data = data
+
+def _pixeles(imagen):
+    cabecera, datos = imagen.data.split(b"\n", 1)
+    _, ancho, alto, _ = cabecera.split()
+    return np.frombuffer(datos, dtype=np.uint8).reshape(int(alto), int(ancho), 3)
+
+def test_reducir_marca_bloques_con_alguna_viva():
+    t = np.zeros((5, 7), dtype=np.uint8)
+    t[0, 0] = t[4, 6] = t[2, 3] = 1
+    r = reducir(t, 2)
+    assert r.shape == (3, 4)
+    assert r.sum() == 3 and r[0, 0] and r[2, 3] and r[1, 1]
+    assert np.array_equal(reducir(t, 1), t == 1)
+
+def test_ppm_repite_cada_celda():
+    datos = ppm(np.array([[True, False]]), 3, (255, 0, 0), (1, 2, 3))
+    cabecera, pixeles = datos.split(b"\n", 1)
+    assert cabecera == b"P6 6 3 255"
+    rgb = np.frombuffer(pixeles, dtype=np.uint8).reshape(3, 6, 3)
+    assert (rgb[:, :3] == (255, 0, 0)).all() and (rgb[:, 3:] == (1, 2, 3)).all()
+
+def test_imagen_reduce_tableros_grandes(monkeypatch):
+    monkeypatch.setattr(lv.tk, "PhotoImage", ImagenFalsa)
+    canvas = CanvasFalso()
+    imagen = ImagenVida(canvas, max_pixeles=100)
+    imagen.configurar(1000, 450, 10, "#000", "#ccc")
+    assert (imagen.factor, imagen.px) == (10, 1)
+    assert (imagen.alto, imagen.ancho) == (100, 45)
+    # un solo ítem en el canvas sin importar el tamaño del tablero
+    assert len(canvas.items) == 1
+    t = np.zeros((1000, 450), dtype=np.uint8)
+    t[995, 449] = 1
+    assert imagen.dibujar(t) == 1
+    rgb = _pixeles(imagen._imagen)
+    assert rgb.shape == (100, 45, 3)
+    assert (rgb[99, 44] == 0).all() and (rgb[0, 0] == 255).all()
+    assert imagen.dibujar(t) == 0
+    assert imagen.celda(44, 99) == (990, 440)
+    assert imagen.celda(45, 0) is None
+
+def test_imagen_sin_reducir_y_colorear(monkeypatch):
+    monkeypatch.setattr(lv.tk, "PhotoImage", ImagenFalsa)
+    canvas = CanvasFalso()
+    imagen = ImagenVida(canvas, max_pixeles=100)
+    imagen.configurar(20, 30, 8, "#000", "#ccc")
+    assert (imagen.factor, imagen.px) == (1, 3)
+    t = np.zeros((20, 30), dtype=np.uint8)
+    t[1, 2] = 1
+    imagen.dibujar(t)
+    imagen.colorear("#f00")
+    assert (_pixeles(imagen._imagen)[3:6, 6:9] == (255, 0, 0)).all()
+    assert imagen.celda(7, 4) == (1, 2)
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from vida.lote import simular, barrer, guardar_resumen, huella
+from vida.motor_bits import MotorBits
+from vida_referencia import avanzar
+
+def _tablero(*celdas, forma=(10, 10)):
+    t = np.zeros(forma, dtype=np.uint8)
+    for i, j in celdas:
+        t[i, j] = 1
+    return t
+
+def test_extincion():
+    r = simular(_tablero((4, 4)), 100)
+    assert r["estado"] == "extinta" and r["periodo"] == 1 and r["generaciones"] == 2
+    assert r["poblacion"].tolist() == [1, 0, 0]
+
+def test_vida_estatica():
+    bloque = _tablero((4, 4), (4, 5), (5, 4), (5, 5))
+    r = simular(bloque, 100)
+    assert r["estado"] == "estable" and r["periodo"] == 1 and r["inicio_ciclo"] == 0
+
+def test_oscilador_sin_detenerse():
+    parpadeador = _tablero((5, 4), (5, 5), (5, 6))
+    r = simular(parpadeador, 11, detener_en_ciclo=False)
+    assert r["estado"] == "oscilador" and r["periodo"] == 2
+    assert r["generaciones"] == 11 and len(r["poblacion"]) == 12
+    assert np.array_equal(r["tablero"], avanzar(parpadeador, 11))
+
+def test_historia_corta_no_ve_el_ciclo():
+    parpadeador = _tablero((5, 4), (5, 5), (5, 6))
+    r = simular(parpadeador, 20, historia=1)
+    assert r["estado"] == "sin ciclo" and r["generaciones"] == 20
+
+def test_motor_y_borde():
+    planeador = _tablero((0, 1), (1, 2), (2, 0), (2, 1), (2, 2), forma=(8, 8))
+    r = simular(planeador, 32, motor=MotorBits.nombre, borde="toroidal")
+    # en un toro de 8x8 el planeador vuelve a su lugar cada 32 generaciones
+    assert r["estado"] == "oscilador" and r["periodo"] == 32
+
+def test_huella_ignora_el_tipo():
+    t = _tablero((1, 1))
+    assert huella(t) == huella(t.astype(bool)) != huella(_tablero((1, 2)))
+
+def test_barrido_no_depende_de_los_trabajadores(tmp_path):
+    args = (16, 16, [0.2, 0.4], 3, 60)
+    uno = barrer(*args, semilla=7, trabajadores=1)
+    dos = barrer(*args, semilla=7, trabajadores=2)
+    assert [(r["prob"], r["repeticion"]) for r in uno] == [(p, k) for p in (0.2, 0.4) for k in range(3)]
+    for a, b in zip(uno, dos):
+        assert a["estado"] == b["estado"] and np.array_equal(a["poblacion"], b["poblacion"])
+    ruta = tmp_path / "resumen.csv"
+    guardar_resumen(str(ruta), uno)
+    assert len(ruta.read_text(encoding="utf-8").splitlines()) == 1 + 6
+
+def test_validaciones():
+    with pytest.raises(ValueError):
+        simular(_tablero(), -1)
+    with pytest.raises(ValueError):
+        barrer(4, 4, [1.5], 1, 1)
+    with pytest.raises(ValueError):
+        simular(_tablero(), 5, motor="Hashlife (plano infinito)")
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from vida.motor_activo import MotorActivo
+from vida.reglas import REGLAS
+from vida_referencia import aleatorio, avanzar
+
+@pytest.mark.parametrize("regla", list(REGLAS))
+def test_igual_a_la_referencia(regla):
+    # tablero que no es múltiplo de la tesela; denso al principio, disperso después
+    inicial = aleatorio(45, 70, prob=0.3, semilla=1)
+    m = MotorActivo(inicial, regla, tesela=16)
+    esperado = inicial
+    for _ in range(6):
+        m.paso()
+        esperado = avanzar(esperado, 1, regla)
+        assert np.array_equal(m.tablero, esperado)
+        assert m.poblacion() == int(esperado.sum())
+
+def test_solo_evalua_teselas_activas():
+    t = np.zeros((128, 128), dtype=np.uint8)
+    t[5, 4:7] = 1  # parpadeador en la esquina
+    m = MotorActivo(t, tesela=16)
+    m.paso(2)
+    assert m.evaluadas <= 4
+    assert np.array_equal(m.tablero, t)
+    assert m.poblacion() == 3
+
+def test_alternar_reactiva_la_tesela():
+    t = np.zeros((64, 64), dtype=np.uint8)
+    m = MotorActivo(t, tesela=16)
+    m.paso()
+    for j in (40, 41, 42):
+        m.alternar(40, j)
+    m.paso()
+    esperado = t.copy()
+    esperado[39:42, 41] = 1
+    assert np.array_equal(m.tablero, esperado)
+    assert m.poblacion() == 3
+
+def test_solo_borde_muerto():
+    with pytest.raises(ValueError):
+        MotorActivo(np.zeros((8, 8)), borde="toroidal")
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from vida.motor_bits import MotorBits, empaquetar, desempaquetar, contar_bits
+from vida.reglas import REGLAS, BORDES
+from vida_referencia import aleatorio, avanzar
+
+@pytest.mark.parametrize("borde", BORDES)
+@pytest.mark.parametrize("regla", list(REGLAS))
+def test_igual_a_la_referencia(regla, borde):
+    # una palabra incompleta, exactamente una y varias con la última incompleta
+    for filas, cols in ((9, 13), (11, 64), (7, 150)):
+        inicial = aleatorio(filas, cols, semilla=cols)
+        m = MotorBits(inicial, regla, borde)
+        m.paso(4)
+        assert np.array_equal(m.tablero, avanzar(inicial, 4, regla, borde))
+
+def test_empaquetar_ida_y_vuelta():
+    t = aleatorio(5, 130, semilla=3)
+    palabras = empaquetar(t)
+    assert palabras.shape == (5, 3) and palabras.dtype == np.uint64
+    assert np.array_equal(desempaquetar(palabras, 130), t)
+    assert contar_bits(palabras) == int(t.sum())
+
+def test_columnas_sobrantes_quedan_muertas():
+    # con borde muerto nada nace en las columnas de relleno de la última palabra
+    t = np.zeros((5, 10), dtype=np.uint8)
+    t[1:4, 9] = 1
+    m = MotorBits(t)
+    m.paso(1)
+    assert np.array_equal(m.tablero, avanzar(t, 1))
+    assert m.poblacion() == int(m.tablero.sum())
+
+def test_alternar():
+    m = MotorBits(np.zeros((3, 70), dtype=np.uint8))
+    m.alternar(2, 69)
+    assert m.tablero[2, 69] == 1 and m.poblacion() == 1
+    assert m.celda(2, 69) == 1 and m.celda(2, 68) == 0 and m.celda(0, 0) == 0
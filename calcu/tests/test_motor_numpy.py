@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from vida.motor_numpy import MotorNumpy
+from vida.reglas import REGLAS, BORDES, Regla
+from vida_referencia import aleatorio, avanzar
+
+@pytest.mark.parametrize("borde", BORDES)
+@pytest.mark.parametrize("regla", list(REGLAS))
+def test_igual_a_la_referencia(regla, borde):
+    # ancho impar (el búfer del índice se redondea a par) y par
+    for filas, cols in ((17, 23), (12, 30)):
+        inicial = aleatorio(filas, cols, semilla=filas)
+        m = MotorNumpy(inicial, regla, borde)
+        m.paso(5)
+        assert np.array_equal(m.tablero, avanzar(inicial, 5, regla, borde))
+
+def test_tabla_de_la_regla():
+    r = Regla("HighLife")
+    assert r.texto == "B36/S23"
+    assert [r.siguiente(False, k) for k in range(9)] == [k in (3, 6) for k in range(9)]
+    assert [r.siguiente(True, k) for k in range(9)] == [k in (2, 3) for k in range(9)]
+    indice = np.arange(18, dtype=np.uint8).reshape(3, 6)
+    assert np.array_equal(r.aplicar(indice), r.tabla.reshape(3, 6))
+
+def test_alternar_y_poblacion():
+    m = MotorNumpy(np.zeros((4, 5), dtype=np.uint8))
+    m.alternar(1, 2)
+    m.alternar(3, 4)
+    assert m.poblacion() == 2
+    m.alternar(1, 2)
+    assert m.tablero.sum() == 1
+
+def test_regla_y_borde_invalidos():
+    with pytest.raises(ValueError):
+        MotorNumpy(np.zeros((3, 3)), "B9/S1")
+    with pytest.raises(ValueError):
+        MotorNumpy(np.zeros((3, 3)), borde="esferico")
+
+def test_reglas_al_azar_por_comparaciones_y_por_tabla():
+    rng = np.random.default_rng(11)
+    inicial = aleatorio(19, 21, semilla=5)
+    caminos = set()
+    extremos = ["B/S", "B012345678/S012345678", "B0/S8", "B45/S0"]
+    al_azar = ["B" + "".join(str(d) for d in range(9) if rng.random() < 0.4)
+               + "/S" + "".join(str(d) for d in range(9) if rng.random() < 0.4) for _ in range(30)]
+    for texto in extremos + al_azar:
+        r = Regla(texto)
+        caminos.add(r.comparaciones is None)
+        m = MotorNumpy(inicial, r, "toroidal")
+        m.paso(2)
+        assert np.array_equal(m.tablero, avanzar(inicial, 2, r, "toroidal")), texto
+    # se probaron los dos caminos de paso_tabla
+    assert caminos == {True, False}
+
+def test_conway_usa_comparaciones():
+    assert Regla("Conway").comparaciones == [(3, 3, "siempre"), (2, 2, "viva")]
+    assert Regla("Maze").comparaciones is None
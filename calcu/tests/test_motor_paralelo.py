@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from vida.motor_paralelo import MotorParalelo
+from vida.reglas import BORDES
+from vida_referencia import aleatorio, avanzar
+
+@pytest.fixture(scope="module")
+def motor():
+    # dos franjas: el halo entre procesos y el marco de cada borde quedan cubiertos
+    m = MotorParalelo(aleatorio(130, 40, semilla=1), trabajadores=2)
+    yield m
+    m.cerrar()
+
+@pytest.mark.parametrize("borde", BORDES)
+@pytest.mark.parametrize("regla", ["Conway", "HighLife", "Day & Night"])
+def test_igual_a_la_referencia(motor, regla, borde):
+    assert motor.trabajadores == 2
+    inicial = aleatorio(130, 40, semilla=len(regla) + len(borde))
+    procesos = [p.pid for p in motor._procesos]
+    motor.cargar(inicial, regla, borde)
+    motor.paso(3)
+    motor.paso(1)
+    assert np.array_equal(motor.tablero, avanzar(inicial, 4, regla, borde))
+    # cargar() reutiliza los mismos procesos
+    assert [p.pid for p in motor._procesos] == procesos
+
+def test_cargar_su_propio_tablero(motor):
+    motor.cargar(aleatorio(130, 40, semilla=9))
+    motor.paso()
+    esperado = np.array(motor.tablero)
+    motor.cargar(motor.tablero, "Seeds", "toroidal")
+    assert np.array_equal(motor.tablero, esperado)
+    assert motor.regla.texto == "B2/S" and motor.borde == "toroidal"
+
+def test_cargar_valida_antes_de_cambiar(motor):
+    motor.cargar(aleatorio(130, 40, semilla=3))
+    antes = np.array(motor.tablero)
+    with pytest.raises(ValueError):
+        motor.cargar(np.zeros((10, 10)))
+    with pytest.raises(ValueError):
+        motor.cargar(np.zeros((130, 40)), "B9/S")
+    assert np.array_equal(motor.tablero, antes) and motor.regla.texto == "B3/S23"
+
+def test_trabajador_muerto_lanza_en_lugar_de_colgarse():
+    m = MotorParalelo(aleatorio(8, 8, semilla=2), trabajadores=1)
+    m.paso()
+    m._procesos[0].terminate()
+    m._procesos[0].join()
+    with pytest.raises(RuntimeError, match="terminó inesperadamente"):
+        m.paso(2)
+    with pytest.raises(RuntimeError):
+        m.paso()
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from formularioDeDistribucionesVariables import generar_muestras
+from simulacion.discretas import muestras_discretas
+from simulacion.paralelo import bloques_paralelo, generar_paralelo
+
+def test_resultado_no_depende_de_los_trabajadores():
+    args = ("Normal", {"p1": 0, "p2": 1})
+    uno = generar_paralelo(generar_muestras, args, 10_000, semilla=5, trabajadores=1, tam_bloque=1500)
+    dos = generar_paralelo(generar_muestras, args, 10_000, semilla=5, trabajadores=2, tam_bloque=1500)
+    assert uno.shape == (10_000,)
+    assert np.array_equal(uno, dos)
+
+def test_bloques_usan_subflujos_distintos():
+    x = generar_paralelo(muestras_discretas, ("Poisson", {"lam": 4}), 4000, semilla=1,
+                         trabajadores=1, tam_bloque=1000, dtype=np.int64)
+    bloques = x.reshape(4, 1000)
+    assert not any(np.array_equal(bloques[0], b) for b in bloques[1:])
+    assert x.mean() == pytest.approx(4, abs=0.2)
+
+def test_memoria_compartida_se_libera():
+    m = generar_paralelo(muestras_discretas, ("Bernoulli", {"p": 0.5}), 100, semilla=2,
+                         trabajadores=1, dtype=np.int64, compartida=True)
+    with m:
+        assert set(np.unique(m.datos)) <= {0, 1}
+    assert m.shm is None
+
+def test_cantidad_invalida():
+    with pytest.raises(ValueError):
+        generar_paralelo(generar_muestras, ("Normal", {}), 0)
+
+def test_bloques_en_orden_iguales_a_generar_paralelo():
+    args = ("Exponencial", {"p1": 2})
+    todo = generar_paralelo(generar_muestras, args, 7000, semilla=3, trabajadores=1, tam_bloque=1000)
+    bloques = list(bloques_paralelo(generar_muestras, args, 7000, semilla=3, trabajadores=2, tam_bloque=1000))
+    assert [b.size for b in bloques] == [1000] * 7
+    assert np.array_equal(np.concatenate(bloques), todo)
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from vida.motor_bits import MotorBits
+from vida.patrones import (leer_rle, escribir_rle, leer_binario, escribir_binario, cargar_motor_bits,
+                           cargar_patron, guardar_patron, formato_patron)
+from vida_referencia import aleatorio
+
+def test_leer_planeador(tmp_path):
+    ruta = tmp_path / "planeador.rle"
+    ruta.write_text("#N Planeador\nx = 3, y = 3, rule = B3/S23\nbo$2bo$3o!\n", encoding="utf-8")
+    tablero, regla = leer_rle(str(ruta))
+    assert regla == "B3/S23"
+    assert tablero.tolist() == [[0, 1, 0], [0, 0, 1], [1, 1, 1]]
+
+@pytest.mark.parametrize("forma", [(1, 1), (7, 150), (40, 33)])
+def test_rle_ida_y_vuelta(tmp_path, forma):
+    t = aleatorio(*forma, prob=0.3, semilla=forma[1])
+    # filas vacías al principio, en medio y al final
+    if forma[0] > 5:
+        t[0] = t[3:5] = t[-1] = 0
+    ruta = str(tmp_path / "t.rle")
+    escribir_rle(ruta, t, "B36/S23")
+    leido, regla = leer_rle(ruta)
+    assert regla == "B36/S23"
+    assert np.array_equal(leido, t)
+    assert all(len(l) <= 70 for l in open(ruta, encoding="utf-8").read().splitlines()[1:])
+
+@pytest.mark.parametrize("cols", [5, 64, 130])
+def test_binario_ida_y_vuelta(tmp_path, cols):
+    t = aleatorio(300, cols, semilla=cols)
+    ruta = str(tmp_path / "t.vida")
+    escribir_binario(ruta, t, "B3/S23")
+    leido, regla = leer_binario(ruta)
+    assert regla == "B3/S23" and np.array_equal(leido, t)
+
+def test_cargar_motor_bits_sin_desempaquetar(tmp_path):
+    t = aleatorio(70, 100, semilla=1)
+    ruta = str(tmp_path / "t.vida")
+    escribir_binario(ruta, t, "B36/S23")
+    m = cargar_motor_bits(ruta, borde="toroidal")
+    assert m.regla.texto == "B36/S23" and m.borde == "toroidal"
+    assert np.array_equal(m.tablero, t)
+    m.paso(3)
+    esperado = MotorBits(t, "B36/S23", "toroidal")
+    esperado.paso(3)
+    assert np.array_equal(m.tablero, esperado.tablero)
+    assert cargar_motor_bits(ruta, "Seeds").regla.texto == "B2/S"
+
+def test_por_extension(tmp_path):
+    t = aleatorio(6, 9, semilla=2)
+    for nombre in ("a.rle", "a.vida"):
+        ruta = str(tmp_path / nombre)
+        guardar_patron(ruta, t)
+        leido, regla = cargar_patron(ruta)
+        assert regla is None and np.array_equal(leido, t)
+    with pytest.raises(ValueError):
+        formato_patron("a.txt")
+
+def test_binario_truncado_o_invalido(tmp_path):
+    ruta = tmp_path / "t.vida"
+    escribir_binario(str(ruta), aleatorio(20, 20), None)
+    datos = ruta.read_bytes()
+    ruta.write_bytes(datos[:-8])
+    with pytest.raises(ValueError, match="truncado"):
+        leer_binario(str(ruta))
+    ruta.write_bytes(b"x" * 80)
+    with pytest.raises(ValueError):
+        leer_binario(str(ruta))
+
+def test_rle_fuera_de_dimensiones(tmp_path):
+    ruta = tmp_path / "mal.rle"
+    ruta.write_text("x = 2, y = 1\n3o!\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        leer_rle(str(ruta))
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from formularioDeDistribucionesVariables import generar_muestras
+from pruebas.prueba_ajuste import (AcumuladorKS, distribucion_continua, pmf_discreta, probabilidad_intervalos,
+                                   prueba_chi2_discreta, prueba_ks_continua, tam_soporte)
+from simulacion.discretas import muestras_discretas
+
+@pytest.mark.parametrize("dist, params", [
+    ("Normal", {"p1": 2, "p2": 4}),
+    ("Exponencial", {"p1": 3}),
+    ("Gamma", {"p1": 5, "p2": 2}),
+    ("Weibull", {"p1": 1.5, "p2": 2, "p3": 1}),
+])
+def test_ks_acepta_la_propia_distribucion(dist, params):
+    x = generar_muestras(dist, params, 50_000, semilla=1)
+    assert prueba_ks_continua(x, dist, params)["p_value"] > 1e-3
+
+def test_ks_rechaza_otra_distribucion():
+    x = generar_muestras("Normal", {"p1": 0.3, "p2": 1}, 20_000, semilla=2)
+    assert not prueba_ks_continua(x, "Normal", {"p1": 0, "p2": 1})["pasa"]
+
+def test_ks_por_bloques_igual_a_una_pasada():
+    x = generar_muestras("Exponencial", {"p1": 2}, 10_000, semilla=3)
+    acum = AcumuladorKS("Exponencial", {"p1": 2})
+    for ini in range(0, x.size, 999):
+        acum.agregar(x[ini:ini + 999])
+    assert acum.resultado() == prueba_ks_continua(x, "Exponencial", {"p1": 2})
+
+def test_ks_sin_redondeo_coincide_con_scipy():
+    x = np.random.default_rng(4).normal(size=2000)
+    d = prueba_ks_continua(x, "Normal", {"p1": 0, "p2": 1}, resolucion=1e-5)["d"]
+    assert d == pytest.approx(stats.kstest(x, "norm").statistic, abs=2e-5)
+
+@pytest.mark.parametrize("nombre, params", [
+    ("Binomial", {"n": 10, "p": 0.3}),
+    ("Poisson", {"lam": 4.0}),
+    ("Uniforme", {"a": -2, "b": 5}),
+    ("Empírica", {"tabla": "1:0.5; 3:0.25; 7:0.25"}),
+])
+def test_chi2_acepta_la_propia_distribucion(nombre, params):
+    x = muestras_discretas(nombre, params, 50_000, semilla=5)
+    valores, conteo = np.unique(x, return_counts=True)
+    assert prueba_chi2_discreta(valores, conteo, nombre, params)["p_value"] > 1e-3
+
+def test_chi2_valor_fuera_de_soporte():
+    r = prueba_chi2_discreta([0, 11], [10, 1], "Binomial", {"n": 10, "p": 0.5})
+    assert r["fuera_de_soporte"] == 1 and not r["pasa"]
+
+def test_pmf_suma_uno():
+    for nombre, params in [("Poisson", {"lam": 30.0}), ("Bernoulli", {"p": 0.2}),
+                           ("Empírica", {"tabla": "2:1; 2:1; 5:2"})]:
+        valores, probs = pmf_discreta(nombre, params)
+        assert probs.sum() == pytest.approx(1.0)
+    assert pmf_discreta("Empírica", {"tabla": "2:1; 2:1; 5:2"})[1].tolist() == [0.5, 0.5]
+
+def test_weibull_con_la_parametrizacion_del_proyecto():
+    teorica = distribucion_continua("Weibull", {"p1": 2, "p2": 3, "p3": 1})
+    assert teorica.mean() == pytest.approx(1 + 9 * stats.weibull_min(2).mean())
+
+def test_chi2_soporte_enorme_por_intervalos():
+    x = np.random.default_rng(6).integers(0, 10**9 + 1, 200_000)
+    valores, conteo = np.unique(x, return_counts=True)
+    r = prueba_chi2_discreta(valores, conteo, "Uniforme", {"a": 0, "b": 10**9})
+    assert r["categorias"] <= 1000 and r["p_value"] > 1e-3
+    sesgado = np.minimum(x, 9 * 10**8)
+    valores, conteo = np.unique(sesgado, return_counts=True)
+    assert not prueba_chi2_discreta(valores, conteo, "Uniforme", {"a": 0, "b": 10**9})["pasa"]
+
+def test_chi2_intervalos_cuenta_fuera_de_soporte():
+    r = prueba_chi2_discreta([-5, 10, 2.5], [1, 10, 1], "Uniforme", {"a": 0, "b": 10**9})
+    assert r["fuera_de_soporte"] == 2
+
+def test_probabilidad_intervalos():
+    bordes = np.arange(-0.5, 11)
+    assert np.allclose(probabilidad_intervalos("Binomial", {"n": 10, "p": 0.4}, bordes),
+                       stats.binom(10, 0.4).pmf(np.arange(11)))
+    grandes = probabilidad_intervalos("Uniforme", {"a": 0, "b": 10**9 - 1}, [-0.5, 5e8 - 0.5, 1e9 - 0.5])
+    assert np.allclose(grandes, [0.5, 0.5])
+    assert tam_soporte("Uniforme", {"a": 0, "b": 10**9}) == 10**9 + 1
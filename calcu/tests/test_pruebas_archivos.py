@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from datos.archivos import abrir_secuencia, bloques
+from pruebas.prueba_medias import prueba_medias
+from pruebas.prueba_varianza import prueba_varianza
+from pruebas.prueba_uniformidad import prueba_uniformidad
+
+@pytest.fixture
+def u():
+    return np.random.default_rng(7).random(10_001)
+
+def test_momentos_por_bloques_igual_a_una_pasada(u):
+    trozos = list(bloques(u, 97))
+    assert len(trozos) == -(-u.size // 97)
+    assert np.array_equal(np.concatenate(trozos), u)
+    assert prueba_medias(u)["media_muestral"] == pytest.approx(u.mean(), rel=1e-12)
+    assert prueba_varianza(u)["var_muestral"] == pytest.approx(u.var(ddof=1), rel=1e-10)
+
+class _PorBloques:
+    """Secuencia que solo se recorre en bloques pequeños (como un archivo enorme)."""
+    def __init__(self, datos, tam):
+        self.datos, self.tam = datos, tam
+
+    def __len__(self):
+        return self.datos.size
+
+    def bloques(self, tam_bloque=None):
+        for ini in range(0, self.datos.size, self.tam):
+            yield self.datos[ini:ini + self.tam]
+
+def test_pruebas_iguales_con_entrada_por_bloques(u):
+    partida = _PorBloques(u, 333)
+    assert prueba_medias(partida)["z"] == pytest.approx(prueba_medias(u)["z"], rel=1e-10)
+    assert prueba_varianza(partida)["x2"] == pytest.approx(prueba_varianza(u)["x2"], rel=1e-10)
+    assert prueba_uniformidad(partida, k=20)["frecuencias"] == prueba_uniformidad(u, k=20)["frecuencias"]
+
+def test_formatos_de_archivo(u, tmp_path):
+    np.save(tmp_path / "u.npy", u)
+    u.tofile(tmp_path / "u.f64")
+    np.savetxt(tmp_path / "u.csv", np.column_stack([np.arange(u.size), u]), delimiter=",",
+               header="i,u_i", comments="", fmt=["%d", "%.17g"])
+    for nombre in ("u.npy", "u.f64", "u.csv"):
+        sec = abrir_secuencia(str(tmp_path / nombre))
+        assert len(sec) == u.size
+        assert np.array_equal(np.concatenate(list(bloques(sec, 1000))), u)
+        assert prueba_medias(sec)["z"] == pytest.approx(prueba_medias(u)["z"], rel=1e-10)
+
+def test_enteros_sin_signo_se_escalan(tmp_path):
+    x = np.array([0, 2**31, 2**32 - 1], dtype=np.uint32)
+    x.tofile(tmp_path / "x.u32")
+    sec = abrir_secuencia(str(tmp_path / "x.u32"))
+    assert np.allclose(np.concatenate(list(bloques(sec))), x / 2.0**32)
+
+def test_muy_pocos_valores():
+    with pytest.raises(ValueError):
+        prueba_medias([0.5])
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from simulacion.reduccion_varianza import MODOS, muestrear_con_reduccion, nota_tamano
+
+@pytest.mark.parametrize("modo", MODOS)
+def test_estimacion_insesgada(modo):
+    x, informe = muestrear_con_reduccion("Exponencial", {"p1": 2}, 20_000, modo, semilla=1)
+    assert informe["modo"] == modo and x.size == informe["n"]
+    assert informe["estimacion"] == pytest.approx(2.0, abs=5 * informe["error_estandar"])
+
+@pytest.mark.parametrize("modo", ["Antitética", "Estratificada", "Hipercubo latino", "Variable de control"])
+def test_reduce_la_varianza_con_funcion_monotona(modo):
+    _, informe = muestrear_con_reduccion("Uniforme", {"p1": 0, "p2": 1}, 10_000, modo, semilla=2)
+    assert informe["reduccion"] > 1.5
+
+def test_estratificada_cubre_cada_estrato():
+    x, _ = muestrear_con_reduccion("Uniforme", {"p1": 0, "p2": 1}, 1000, "Estratificada", semilla=3)
+    assert np.array_equal(np.floor(x * 100).reshape(100, 10), np.repeat(np.arange(100), 10).reshape(100, 10))
+
+def test_hipercubo_un_valor_por_estrato_en_cada_replica():
+    x, _ = muestrear_con_reduccion("Uniforme", {"p1": 0, "p2": 1}, 500, "Hipercubo latino", semilla=4)
+    for replica in x.reshape(10, 50):
+        assert np.array_equal(np.sort(np.floor(replica * 50)), np.arange(50))
+
+def test_discreta_y_funcion():
+    x, informe = muestrear_con_reduccion("Poisson", {"lam": 3.0}, 4000, "Antitética", semilla=5,
+                                          discreta=True, funcion=lambda v: v ** 2)
+    assert x.dtype.kind == "i"
+    assert informe["estimacion"] == pytest.approx(12.0, abs=5 * informe["error_estandar"])
+
+def test_cantidad_insuficiente():
+    with pytest.raises(ValueError):
+        muestrear_con_reduccion("Normal", {"p1": 0, "p2": 1}, 3, "Antitética")
+
+@pytest.mark.parametrize("modo, usados", [
+    ("Simple", 1003), ("Variable de control", 1003), ("Antitética", 1004),
+    ("Estratificada", 1010), ("Hipercubo latino", 1010),
+])
+def test_nunca_menos_valores_que_los_pedidos(modo, usados):
+    x, informe = muestrear_con_reduccion("Normal", {"p1": 0, "p2": 1}, 1003, modo, semilla=6)
+    assert x.size == informe["n"] == usados and informe["n_pedido"] == 1003
+    assert (nota_tamano(informe) == "") == (usados == 1003)
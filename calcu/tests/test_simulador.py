@@ -0,0 +1,74 @@
+import time
+
+import numpy as np
+
+from vida.historia import Historia
+from vida.motor_numpy import MotorNumpy
+from vida.simulador import Simulador
+from vida_referencia import aleatorio, avanzar
+
+def _esperar(condicion, limite=10.0):
+    fin = time.perf_counter() + limite
+    while not condicion() and time.perf_counter() < fin:
+        time.sleep(0.005)
+    return condicion()
+
+def test_corre_en_su_hilo_y_se_detiene():
+    inicial = aleatorio(20, 20, semilla=1)
+    sim = Simulador(MotorNumpy(inicial))
+    sim.retardo = 0
+    sim.iniciar()
+    assert sim.corriendo
+    assert _esperar(lambda: sim.generacion >= 10)
+    sim.detener()
+    assert not sim.corriendo
+    assert np.array_equal(sim.motor.tablero, avanzar(inicial, sim.generacion))
+
+def test_turbo_avanza_por_lotes_y_publica():
+    sim = Simulador(MotorNumpy(aleatorio(32, 32, semilla=2)))
+    sim.turbo = True
+    sim.iniciar()
+    # la instantánea se renueva cada `intervalo` aunque el hilo no se detenga
+    assert _esperar(lambda: sim.instantanea[1] > 0)
+    sim.detener()
+    _, generacion, poblacion = sim.instantanea
+    assert 0 < generacion <= sim.generacion
+    assert poblacion >= 0
+
+def test_pausa_deja_el_motor_quieto_y_reanuda():
+    sim = Simulador(MotorNumpy(aleatorio(16, 16, semilla=3)))
+    sim.turbo = True
+    sim.iniciar()
+    with sim.pausa() as motor:
+        g = sim.generacion
+        motor.alternar(0, 0)
+        time.sleep(0.02)
+        assert sim.generacion == g and not sim.corriendo
+    assert sim.corriendo
+    sim.detener()
+
+def test_parar_si_detiene_el_hilo():
+    sim = Simulador(MotorNumpy(aleatorio(16, 16, semilla=4)), parar_si=lambda m: True)
+    sim.retardo = 0
+    sim.iniciar()
+    assert _esperar(lambda: not sim.corriendo)
+    assert sim.detenido_por_condicion and sim.generacion == 1
+
+def test_error_del_motor_queda_en_error():
+    class MotorRoto(MotorNumpy):
+        def paso(self, n=1):
+            raise RuntimeError("falla")
+    sim = Simulador(MotorRoto(np.zeros((4, 4), dtype=np.uint8)))
+    sim.iniciar()
+    assert _esperar(lambda: not sim.corriendo)
+    assert isinstance(sim.error, RuntimeError)
+
+def test_saltar_registra_solo_el_final():
+    inicial = aleatorio(20, 20, semilla=5)
+    sim = Simulador(MotorNumpy(inicial))
+    sim.historia = h = Historia()
+    h.reiniciar(inicial, 0)
+    sim.saltar(50)
+    assert _esperar(lambda: not sim.corriendo)
+    assert sim.generacion == 50 and len(h) == 2
+    assert np.array_equal(h.actual()[0], avanzar(inicial, 50))
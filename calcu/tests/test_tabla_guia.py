@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from simulacion.tabla_guia import TablaGuia, guia_binomial, guia_poisson
+
+def _chi2(x, pmf, valores):
+    """p-valor chi-cuadrado agrupando celdas con esperado < 5."""
+    observados = np.array([(x == v).sum() for v in valores], dtype=float)
+    esperados = pmf * x.size
+    ok = esperados >= 5
+    obs = np.append(observados[ok], x.size - observados[ok].sum())
+    esp = np.append(esperados[ok], x.size - esperados[ok].sum())
+    return stats.chisquare(obs, esp).pvalue
+
+@pytest.mark.parametrize("guia, dist", [
+    (guia_binomial(20, 0.3), stats.binom(20, 0.3)),
+    (guia_poisson(6.0), stats.poisson(6.0)),
+    (guia_poisson(250.0), stats.poisson(250.0)),
+])
+def test_frecuencias_chi_cuadrado(guia, dist):
+    u = np.random.default_rng(11).random(200_000)
+    x = guia.muestrear(u)
+    assert _chi2(x, dist.pmf(guia.valores), guia.valores) > 1e-3
+
+def test_igual_a_busqueda_binaria():
+    guia = guia_binomial(50, 0.7)
+    u = np.random.default_rng(2).random(10_000)
+    assert np.array_equal(guia.muestrear(u), np.searchsorted(guia.cdf, u, side="right"))
+
+def test_tabla_cacheada():
+    assert guia_poisson(4.0) is guia_poisson(4.0)
+
+def test_inicio_desplaza_valores():
+    t = TablaGuia([0.5, 1.0], inicio=10, m=4)
+    assert t.muestrear([0.1, 0.6]).tolist() == [10, 11]
+
+def test_cdf_vacia():
+    with pytest.raises(ValueError):
+        TablaGuia([])
+
+def test_u_igual_a_uno_da_el_ultimo_valor():
+    t = TablaGuia([0.2, 0.7, 1.0], inicio=1, m=4)
+    assert t.muestrear([0.0, 1.0, 0.99999999]).tolist() == [1, 3, 3]
+    guia = guia_poisson(3.0)
+    assert guia.muestrear([1.0]).tolist() == [guia.valores[-1]]
@@ -0,0 +1,37 @@
+import numpy as np
+
+import interfaz.tabla_virtual as tv
+from interfaz.tabla_virtual import TablaVirtual
+
+def _tabla(*columnas):
+    # sin ventana: buscar() solo usa los datos
+    tabla = TablaVirtual.__new__(TablaVirtual)
+    tabla.datos = list(columnas)
+    tabla.n = min(len(c) for c in columnas)
+    return tabla
+
+def test_buscar_con_el_redondeo_del_texto():
+    tabla = _tabla(np.array([0.1234, 0.5, 0.12, 0.1249]))
+    assert tabla.buscar("0.12", 0) == 0
+    assert tabla.buscar("0.12", 0, desde=1) == 2
+    assert tabla.buscar("0.125", 0) == 3
+    assert tabla.buscar("0.7", 0) is None
+
+def test_buscar_en_notacion_cientifica():
+    tabla = _tabla(np.array([0.0016, 0.00104, 0.000258, 0.00025]))
+    assert tabla.buscar("1e-3", 0) == 1
+    assert tabla.buscar("2.5e-4", 0) == 3
+    assert tabla.buscar("2.58E-4", 0) == 2
+
+def test_buscar_por_bloques_en_memmap(tmp_path, monkeypatch):
+    monkeypatch.setattr(tv, "BLOQUE_BUSQUEDA", 10)
+    x = np.arange(100, dtype=float)
+    x.tofile(tmp_path / "x.f64")
+    tabla = _tabla(np.memmap(tmp_path / "x.f64", dtype=float, mode="r"))
+    assert tabla.buscar("57", 0) == 57
+    assert tabla.buscar("57", 0, desde=58) is None
+
+def test_buscar_columna_vacia():
+    tabla = _tabla(np.arange(3.0))
+    tabla.datos.append(None)
+    assert tabla.buscar("1", 1) is None
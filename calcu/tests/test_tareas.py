@@ -0,0 +1,94 @@
+import threading
+import time
+
+import pytest
+
+from interfaz.tareas import Cancelado, EjecutorTareas
+
+class WidgetFalso:
+    """Sustituye a Tk: guarda los `after` pendientes y los corre a pedido."""
+    def __init__(self):
+        self.pendientes = []
+
+    def after(self, ms, funcion):
+        self.pendientes.append(funcion)
+
+    def correr(self, maximo=1000):
+        for _ in range(maximo):
+            if not self.pendientes:
+                return
+            time.sleep(0.005)
+            self.pendientes.pop(0)()
+        raise AssertionError("el sondeo no terminó")
+
+@pytest.fixture
+def ejecutor():
+    widget = WidgetFalso()
+    ej = EjecutorTareas(widget, intervalo_ms=1)
+    yield ej
+    ej.cerrar()
+
+def test_resultado_y_error_se_entregan(ejecutor):
+    recibidos = []
+    ejecutor.ejecutar(lambda tarea, x: x * 2, 21, al_terminar=recibidos.append)
+    ejecutor.ejecutar(lambda tarea: 1 / 0, al_error=lambda e: recibidos.append(type(e)))
+    ejecutor.widget.correr()
+    assert sorted(map(str, recibidos)) == sorted(["42", str(ZeroDivisionError)])
+    assert not ejecutor.ocupado() and not ejecutor._sondeando
+
+def test_callback_que_lanza_no_corta_el_sondeo(ejecutor, capsys):
+    recibidos = []
+    def falla(_):
+        raise RuntimeError("callback roto")
+    ejecutor.ejecutar(lambda tarea: 1, al_terminar=falla)
+    ejecutor.ejecutar(lambda tarea: 2, al_terminar=recibidos.append)
+    ejecutor.widget.correr()
+    assert recibidos == [2]
+    assert "callback roto" in capsys.readouterr().err
+    assert not ejecutor._sondeando
+    # el ejecutor sigue usable después del error
+    ejecutor.ejecutar(lambda tarea: 3, al_terminar=recibidos.append)
+    ejecutor.widget.correr()
+    assert recibidos == [2, 3]
+
+def test_parcial_que_lanza_sigue_sondeando(ejecutor):
+    listo = threading.Event()
+    recibidos = []
+    def trabajo(tarea):
+        tarea.publicar("parcial")
+        listo.wait(5)
+        return "fin"
+    def al_parcial(dato):
+        listo.set()
+        raise ValueError(dato)
+    ejecutor.ejecutar(trabajo, al_parcial=al_parcial, al_terminar=recibidos.append)
+    ejecutor.widget.correr()
+    assert recibidos == ["fin"]
+
+def test_cancelar_descarta_el_resultado(ejecutor):
+    empezo = threading.Event()
+    recibidos = []
+    def trabajo(tarea):
+        empezo.set()
+        while True:
+            tarea.reportar(0.5)
+            time.sleep(0.001)
+    tarea = ejecutor.ejecutar(trabajo, al_terminar=recibidos.append, al_error=recibidos.append)
+    empezo.wait(5)
+    tarea.cancelar()
+    ejecutor.widget.correr()
+    assert recibidos == [] and tarea.cancelada
+
+def test_reportar_lanza_si_se_cancelo(ejecutor):
+    tarea = ejecutor.ejecutar(lambda t: None)
+    tarea.cancelar()
+    with pytest.raises(Cancelado):
+        tarea.reportar(1, 2)
+    ejecutor.widget.correr()
+
+def test_oyentes_ven_las_activas(ejecutor):
+    vistas = []
+    ejecutor.suscribir(lambda activas: vistas.append(len(activas)))
+    ejecutor.ejecutar(lambda tarea: None)
+    ejecutor.widget.correr()
+    assert vistas[0] == 1 and vistas[-1] == 0
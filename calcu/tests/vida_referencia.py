@@ -0,0 +1,23 @@
+"""Referencia directa del Juego de la Vida para comparar los motores (np.pad + suma de vistas)."""
+import numpy as np
+
+from vida.reglas import como_regla
+
+# modo de np.pad para cada borde
+_RELLENO = {"muerto": "constant", "toroidal": "wrap", "reflejado": "edge"}
+
+def siguiente(tablero: np.ndarray, regla=None, borde: str="muerto") -> np.ndarray:
+    regla = como_regla(regla)
+    t = (np.asarray(tablero) != 0).astype(np.int64)
+    p = np.pad(t, 1, mode=_RELLENO[borde])
+    f, c = t.shape
+    vecinos = sum(p[1+di:1+di+f, 1+dj:1+dj+c] for di in (-1, 0, 1) for dj in (-1, 0, 1) if (di, dj) != (0, 0))
+    return np.array(regla.tabla)[9 * t + vecinos].astype(np.uint8)
+
+def avanzar(tablero: np.ndarray, n: int, regla=None, borde: str="muerto") -> np.ndarray:
+    for _ in range(n):
+        tablero = siguiente(tablero, regla, borde)
+    return tablero
+
+def aleatorio(filas: int, cols: int, prob: float=0.35, semilla: int=0) -> np.ndarray:
+    return (np.random.default_rng(semilla).random((filas, cols)) < prob).astype(np.uint8)
@@ -0,0 +1,94 @@
+"""
+Comparación de generaciones por segundo entre motores del Juego de la Vida
+Uso: python -m vida.benchmark [--tam 100 500 2000] [--segundos 2]
+`paso_listas` reproduce el motor original de listas anidadas (GameOfLifeUI
+antes del motor NumPy) como referencia; también se verifica que todos los
+motores den el mismo tablero.
+"""
+from typing import Callable, List
+import argparse
+import time
+import numpy as np
+
+from vida.motor_numpy import MotorNumpy
+from vida.motores import MOTORES
+
+def paso_listas(grid: List[List[int]]) -> List[List[int]]:
+    """Una generación con el algoritmo original (celda por celda, borde muerto)."""
+    rows, cols = len(grid), len(grid[0])
+    new_grid = [[0 for _ in range(cols)] for _ in range(rows)]
+    for i in range(rows):
+        for j in range(cols):
+            count = 0
+            for di in (-1, 0, 1):
+                for dj in (-1, 0, 1):
+                    if di == 0 and dj == 0:
+                        continue
+                    ni, nj = i + di, j + dj
+                    if 0 <= ni < rows and 0 <= nj < cols:
+                        count += grid[ni][nj]
+            if grid[i][j] == 1:
+                new_grid[i][j] = 1 if count in (2, 3) else 0
+            else:
+                new_grid[i][j] = 1 if count == 3 else 0
+    return new_grid
+
+def tablero_aleatorio(filas: int, cols: int, prob: float=0.2, semilla=None) -> np.ndarray:
+    return (np.random.default_rng(semilla).random((filas, cols)) < prob).astype(np.uint8)
+
+def medir(paso: Callable[[], None], segundos: float=2.0) -> float:
+    """Generaciones por segundo llamando `paso()` durante ~`segundos`."""
+    paso()  # calentamiento
+    n = 0
+    inicio = time.perf_counter()
+    fin = inicio + segundos
+    ahora = inicio
+    while ahora < fin:
+        paso()
+        n += 1
+        ahora = time.perf_counter()
+    return n / (ahora - inicio)
+
+def comparar(tam: int, segundos: float=2.0, prob: float=0.2, semilla=0, con_listas: bool=True) -> dict:
+    tablero = tablero_aleatorio(tam, tam, prob, semilla)
+    resultado = {"tam": tam}
+    # verificación: 5 generaciones de ambos motores deben coincidir
+    motor = MotorNumpy(tablero)
+    if con_listas:
+        grid = tablero.tolist()
+        for _ in range(5):
+            grid = paso_listas(grid)
+        motor.paso(5)
+        if not np.array_equal(np.array(grid, dtype=np.uint8), motor.tablero):
+            raise AssertionError("El motor NumPy no coincide con el motor de listas.")
+        estado = {"grid": tablero.tolist()}
+        def paso():
+            estado["grid"] = paso_listas(estado["grid"])
+        resultado["listas"] = medir(paso, segundos)
+    referencia = MotorNumpy(tablero)
+    referencia.paso(5)
+    for nombre, clase in MOTORES.items():
+        motor = clase(tablero)
+        motor.paso(5)
+        if not getattr(clase, "plano_infinito", False) and not np.array_equal(motor.tablero, referencia.tablero):
+            raise AssertionError(f"El motor {nombre} no coincide con el motor NumPy.")
+        resultado[nombre] = medir(clase(tablero).paso, segundos)
+    return resultado
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generaciones/s de los motores del Juego de la Vida")
+    parser.add_argument("--tam", type=int, nargs="+", default=[20, 100, 500, 2000])
+    parser.add_argument("--segundos", type=float, default=2.0)
+    parser.add_argument("--prob", type=float, default=0.2)
+    parser.add_argument("--max-listas", type=int, default=500,
+                        help="lado máximo para medir el motor de listas (es muy lento)")
+    args = parser.parse_args(argv)
+    for tam in args.tam:
+        r = comparar(tam, args.segundos, args.prob, con_listas=tam <= args.max_listas)
+        partes = [f"{nombre} {r[nombre]:,.1f}" for nombre in MOTORES]
+        if "listas" in r:
+            partes.append(f"listas {r['listas']:,.2f}")
+        print(f"{tam}x{tam} (gen/s): " + "    ".join(partes))
+
+if __name__ == "__main__":
+    main()
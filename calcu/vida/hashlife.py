@@ -0,0 +1,289 @@
+"""
+Hashlife: Juego de la Vida en un plano infinito con saltos de 2^k generaciones
+El universo es un árbol cuaternario. Los nodos se construyen una sola vez por
+contenido (hash-consing: mismos cuatro hijos -> mismo objeto), así patrones
+repetidos en el espacio o en el tiempo se comparten. El resultado de avanzar un
+nodo de nivel k (su centro, 2^(k-2) generaciones después) se memoriza en una
+caché LRU acotada; cuando la tabla de nodos crece demasiado se recolectan los
+que ya no son alcanzables desde la raíz ni desde la caché.
+Acepta reglas B/S sin B0 (con B0 el vacío infinito no es estable).
+"""
+from collections import OrderedDict
+import numpy as np
+
+from vida.reglas import Regla, como_regla
+
+# nodos en la tabla antes de recolectar y resultados memorizados como máximo
+MAX_NODOS = 1_000_000
+MAX_MEMO = 500_000
+# nivel hasta el que se guarda la matriz de celdas del nodo (para dibujar rápido)
+NIVEL_MATRIZ = 4
+
+class Nodo:
+    """Cuadrado de 2^nivel x 2^nivel celdas. Hoja (nivel 0): viva o muerta."""
+    __slots__ = ("nw", "ne", "sw", "se", "nivel", "poblacion", "matriz")
+
+    def __init__(self, nw, ne, sw, se, nivel: int, poblacion: int):
+        self.nw, self.ne, self.sw, self.se = nw, ne, sw, se
+        self.nivel = nivel
+        self.poblacion = poblacion
+        self.matriz = None
+
+MUERTA = Nodo(None, None, None, None, 0, 0)
+VIVA = Nodo(None, None, None, None, 0, 1)
+
+class UniversoHashlife:
+    """Plano infinito; la raíz cubre [fila0, fila0 + 2^nivel) x [col0, col0 + 2^nivel)."""
+    def __init__(self, regla: Regla=None, max_nodos: int=MAX_NODOS, max_memo: int=MAX_MEMO):
+        self.regla = como_regla(regla)
+        if self.regla.b0:
+            raise ValueError(f"Hashlife no admite reglas con B0 ({self.regla.texto}).")
+        self.max_nodos = max_nodos
+        self.max_memo = max_memo
+        self._nodos = {}
+        self._memo = OrderedDict()
+        self._vacios = [MUERTA]
+        self.raiz = self._vacio(3)
+        self.fila0 = self.col0 = -4
+        self.generacion = 0
+
+    # ---------- construcción de nodos ----------
+    def _unir(self, nw, ne, sw, se) -> Nodo:
+        clave = (nw, ne, sw, se)
+        nodo = self._nodos.get(clave)
+        if nodo is None:
+            nodo = Nodo(nw, ne, sw, se, nw.nivel + 1, nw.poblacion + ne.poblacion + sw.poblacion + se.poblacion)
+            self._nodos[clave] = nodo
+        return nodo
+
+    def _vacio(self, nivel: int) -> Nodo:
+        while len(self._vacios) <= nivel:
+            v = self._vacios[-1]
+            self._vacios.append(self._unir(v, v, v, v))
+        return self._vacios[nivel]
+
+    def _centro(self, n: Nodo) -> Nodo:
+        return self._unir(n.nw.se, n.ne.sw, n.sw.ne, n.se.nw)
+
+    def _expandir(self):
+        """Duplica el lado de la raíz dejándola en el centro."""
+        r = self.raiz
+        e = self._vacio(r.nivel - 1)
+        self.raiz = self._unir(self._unir(e, e, e, r.nw), self._unir(e, e, r.ne, e),
+                               self._unir(e, r.sw, e, e), self._unir(r.se, e, e, e))
+        mitad = 1 << (r.nivel - 1)
+        self.fila0 -= mitad
+        self.col0 -= mitad
+
+    def _centrada(self) -> bool:
+        """True si toda la población cabe en el cuarto central de la raíz."""
+        r = self.raiz
+        return (r.nw.poblacion == r.nw.se.se.poblacion and r.ne.poblacion == r.ne.sw.sw.poblacion
+                and r.sw.poblacion == r.sw.ne.ne.poblacion and r.se.poblacion == r.se.nw.nw.poblacion)
+
+    # ---------- evolución ----------
+    def _base(self, m: Nodo) -> Nodo:
+        """Nivel 2 (4x4): centro 2x2 una generación después, por fuerza bruta."""
+        c = [[m.nw.nw, m.nw.ne, m.ne.nw, m.ne.ne],
+             [m.nw.sw, m.nw.se, m.ne.sw, m.ne.se],
+             [m.sw.nw, m.sw.ne, m.se.nw, m.se.ne],
+             [m.sw.sw, m.sw.se, m.se.sw, m.se.se]]
+        v = [[x.poblacion for x in fila] for fila in c]
+        tabla = self.regla.tabla
+        nuevas = []
+        for i in (1, 2):
+            for j in (1, 2):
+                vecinos = sum(v[i+di][j+dj] for di in (-1, 0, 1) for dj in (-1, 0, 1)) - v[i][j]
+                nuevas.append(VIVA if tabla[9 * v[i][j] + vecinos] else MUERTA)
+        return self._unir(*nuevas)
+
+    def _avanzar(self, m: Nodo, j: int) -> Nodo:
+        """Centro (nivel k-1) de m (nivel k) tras 2^j generaciones, j <= k-2."""
+        k = m.nivel
+        if m.poblacion == 0:
+            return self._vacio(k - 1)
+        clave = (m, j)
+        r = self._memo.get(clave)
+        if r is not None:
+            self._memo.move_to_end(clave)
+            return r
+        if k == 2:
+            r = self._base(m)
+        else:
+            u = self._unir
+            # nueve subcuadrados de nivel k-1 que se solapan
+            n00, n02, n20, n22 = m.nw, m.ne, m.sw, m.se
+            n01 = u(m.nw.ne, m.ne.nw, m.nw.se, m.ne.sw)
+            n10 = u(m.nw.sw, m.nw.se, m.sw.nw, m.sw.ne)
+            n11 = u(m.nw.se, m.ne.sw, m.sw.ne, m.se.nw)
+            n12 = u(m.ne.sw, m.ne.se, m.se.nw, m.se.ne)
+            n21 = u(m.sw.ne, m.se.nw, m.sw.se, m.se.sw)
+            nueve = (n00, n01, n02, n10, n11, n12, n20, n21, n22)
+            if j == k - 2:
+                # dos mitades de 2^(k-3) generaciones cada una
+                s = [self._avanzar(n, k - 3) for n in nueve]
+                jj = k - 3
+            else:
+                # sin avanzar la primera mitad: solo recortar los centros
+                s = [self._centro(n) for n in nueve]
+                jj = j
+            r = u(self._avanzar(u(s[0], s[1], s[3], s[4]), jj), self._avanzar(u(s[1], s[2], s[4], s[5]), jj),
+                  self._avanzar(u(s[3], s[4], s[6], s[7]), jj), self._avanzar(u(s[4], s[5], s[7], s[8]), jj))
+        self._memo[clave] = r
+        if len(self._memo) > self.max_memo:
+            self._memo.popitem(last=False)
+        return r
+
+    def avanzar(self, n: int):
+        """Avanza exactamente n generaciones (por potencias de dos)."""
+        if n < 0:
+            raise ValueError("n debe ser >= 0")
+        j = 0
+        while n:
+            if n & 1:
+                self._avanzar_potencia(j)
+            n >>= 1
+            j += 1
+
+    def _avanzar_potencia(self, j: int):
+        if len(self._nodos) > self.max_nodos:
+            self.recolectar()
+        # la raíz debe tener nivel >= j+2 y margen vacío para que nada salga del centro
+        while self.raiz.nivel < j + 2 or not self._centrada():
+            self._expandir()
+        self._expandir()
+        k = self.raiz.nivel
+        self.raiz = self._avanzar(self.raiz, j)
+        desplazamiento = 1 << (k - 2)
+        self.fila0 += desplazamiento
+        self.col0 += desplazamiento
+        self.generacion += 1 << j
+
+    def recolectar(self):
+        """Reconstruye la tabla con los nodos alcanzables desde la raíz y la caché."""
+        vivos = {}
+        pila = [self.raiz] + [n for clave, r in self._memo.items() for n in (clave[0], r)] + self._vacios
+        while pila:
+            n = pila.pop()
+            if n.nivel == 0 or id(n) in vivos:
+                continue
+            vivos[id(n)] = n
+            pila.extend((n.nw, n.ne, n.sw, n.se))
+        self._nodos = {(n.nw, n.ne, n.sw, n.se): n for n in vivos.values()}
+        if len(self._nodos) > self.max_nodos // 2 and self._memo:
+            # la caché retiene demasiado: se vacía para no recolectar en cada paso
+            self._memo.clear()
+            self.recolectar()
+
+    # ---------- celdas ----------
+    @property
+    def poblacion(self) -> int:
+        return self.raiz.poblacion
+
+    def cargar(self, tablero: np.ndarray, fila0: int=0, col0: int=0):
+        """Reemplaza el universo por `tablero` con su esquina en (fila0, col0)."""
+        tablero = np.asarray(tablero) != 0
+        lado = max(tablero.shape + (8,))
+        nivel = max(3, (lado - 1).bit_length())
+        cuadro = np.zeros((1 << nivel, 1 << nivel), dtype=bool)
+        cuadro[:tablero.shape[0], :tablero.shape[1]] = tablero
+        self.raiz = self._construir(cuadro, nivel)
+        self.fila0, self.col0 = fila0, col0
+        self.generacion = 0
+
+    def _construir(self, cuadro: np.ndarray, nivel: int) -> Nodo:
+        if not cuadro.any():
+            return self._vacio(nivel)
+        if nivel == 0:
+            return VIVA
+        m = 1 << (nivel - 1)
+        return self._unir(self._construir(cuadro[:m, :m], nivel - 1), self._construir(cuadro[:m, m:], nivel - 1),
+                          self._construir(cuadro[m:, :m], nivel - 1), self._construir(cuadro[m:, m:], nivel - 1))
+
+    def _matriz(self, n: Nodo) -> np.ndarray:
+        """Celdas de un nodo pequeño (nivel <= NIVEL_MATRIZ), memorizadas en el nodo."""
+        if n.matriz is None:
+            if n.nivel == 0:
+                n.matriz = np.array([[n.poblacion]], dtype=np.uint8)
+            else:
+                m = 1 << (n.nivel - 1)
+                a = np.empty((2 * m, 2 * m), dtype=np.uint8)
+                a[:m, :m], a[:m, m:] = self._matriz(n.nw), self._matriz(n.ne)
+                a[m:, :m], a[m:, m:] = self._matriz(n.sw), self._matriz(n.se)
+                n.matriz = a
+        return n.matriz
+
+    def region(self, fila0: int, col0: int, filas: int, cols: int) -> np.ndarray:
+        """Ventana (filas, cols) uint8 del plano con esquina en (fila0, col0)."""
+        salida = np.zeros((filas, cols), dtype=np.uint8)
+        self._pintar(self.raiz, self.fila0, self.col0, salida, fila0, col0)
+        return salida
+
+    def _pintar(self, n: Nodo, f: int, c: int, salida, fila0: int, col0: int):
+        lado = 1 << n.nivel
+        filas, cols = salida.shape
+        # intersección del nodo con la ventana
+        i0, j0 = max(f, fila0), max(c, col0)
+        i1, j1 = min(f + lado, fila0 + filas), min(c + lado, col0 + cols)
+        if n.poblacion == 0 or i0 >= i1 or j0 >= j1:
+            return
+        if n.nivel <= NIVEL_MATRIZ:
+            salida[i0-fila0:i1-fila0, j0-col0:j1-col0] = self._matriz(n)[i0-f:i1-f, j0-c:j1-c]
+            return
+        m = lado >> 1
+        self._pintar(n.nw, f, c, salida, fila0, col0)
+        self._pintar(n.ne, f, c + m, salida, fila0, col0)
+        self._pintar(n.sw, f + m, c, salida, fila0, col0)
+        self._pintar(n.se, f + m, c + m, salida, fila0, col0)
+
+    def poner(self, fila: int, col: int, viva: bool):
+        """Fija una celda (copiando solo el camino desde la raíz)."""
+        while not (self.fila0 <= fila < self.fila0 + (1 << self.raiz.nivel)
+                   and self.col0 <= col < self.col0 + (1 << self.raiz.nivel)):
+            self._expandir()
+        self.raiz = self._poner(self.raiz, fila - self.fila0, col - self.col0, viva)
+
+    def _poner(self, n: Nodo, i: int, j: int, viva: bool) -> Nodo:
+        if n.nivel == 0:
+            return VIVA if viva else MUERTA
+        m = 1 << (n.nivel - 1)
+        hijos = [n.nw, n.ne, n.sw, n.se]
+        q = (2 if i >= m else 0) + (1 if j >= m else 0)
+        hijos[q] = self._poner(hijos[q], i % m, j % m, viva)
+        return self._unir(*hijos)
+
+class MotorHashlife:
+    """Adaptador a la interfaz de motores: el tablero es una ventana fija del plano infinito."""
+    nombre = "Hashlife (plano infinito)"
+    # sin bordes: no coincide con los motores de borde muerto si algo toca el borde
+    plano_infinito = True
+
+    def __init__(self, tablero: np.ndarray, regla: Regla=None, borde: str="muerto"):
+        tablero = np.asarray(tablero)
+        if tablero.ndim != 2:
+            raise ValueError("El tablero debe ser bidimensional.")
+        if borde != "muerto":
+            raise ValueError("Hashlife trabaja en el plano infinito: no admite bordes toroidales ni reflejados.")
+        self.filas, self.cols = tablero.shape
+        self.universo = UniversoHashlife(como_regla(regla))
+        self.regla, self.borde = self.universo.regla, borde
+        self.universo.cargar(tablero)
+
+    @property
+    def tablero(self) -> np.ndarray:
+        """Copia de la ventana (filas, cols) con esquina en (0, 0); fuera de ella el patrón sigue."""
+        return self.universo.region(0, 0, self.filas, self.cols)
+
+    def alternar(self, i: int, j: int):
+        self.universo.poner(i, j, not self.celda(i, j))
+
+    def celda(self, i: int, j: int) -> int:
+        """Estado de una célula sin armar la ventana completa."""
+        return int(self.universo.region(i, j, 1, 1)[0, 0])
+
+    def poblacion(self) -> int:
+        """Población de todo el plano (puede incluir células fuera de la ventana)."""
+        return self.universo.poblacion
+
+    def paso(self, n: int=1):
+        self.universo.avanzar(n)
@@ -0,0 +1,135 @@
+"""
+Historial del Juego de la Vida como deltas XOR entre estados empaquetados
+Se guarda un solo estado completo (empaquetado en bits); cada estado nuevo se
+registra como su XOR con el anterior. Entre generaciones cambia poco, así el
+delta casi siempre es disperso y se guarda como (posiciones, bytes): una
+fracción de lo que ocuparían las instantáneas completas. Retroceder o volver a
+avanzar es aplicar el XOR otra vez. Es un anillo acotado por bytes: al
+llenarse se descartan los deltas más antiguos.
+Guarda los estados que se le registran, no cada generación: el simulador
+registra uno por cuadro en modo turbo (vida/simulador.py), así retroceder
+salta de a lotes. Se escribe desde el hilo de simulación y se lee desde la
+interfaz: todos los métodos toman el mismo candado.
+"""
+from collections import deque
+from typing import Optional, Tuple
+import threading
+import numpy as np
+
+MAX_BYTES = 64 * 1024 * 1024
+# bytes por cambio en un delta disperso (posición uint32 + byte)
+_BYTES_DISPERSO = 5
+
+def _empaquetar(tablero: np.ndarray) -> np.ndarray:
+    return np.packbits(np.asarray(tablero).ravel() != 0)
+
+def _aplicar(estado: np.ndarray, delta):
+    posiciones, valores = delta
+    if posiciones is None:
+        estado ^= valores
+    else:
+        estado[posiciones] ^= valores
+
+def _tam(delta) -> int:
+    posiciones, valores = delta
+    return valores.nbytes + (0 if posiciones is None else posiciones.nbytes)
+
+class Historia:
+    """Estados registrados 0..m; `posicion` es el que se muestra (m: el más reciente)."""
+    def __init__(self, max_bytes: int=MAX_BYTES):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes debe ser > 0")
+        self.max_bytes = max_bytes
+        self.forma: Optional[Tuple[int, int]] = None
+        self._estado: Optional[np.ndarray] = None
+        # _deltas[i] lleva del estado i al i+1; _generaciones[i] es la generación del estado i
+        self._deltas = deque()
+        self._generaciones = deque()
+        self.posicion = 0
+        self.bytes_deltas = 0
+        # reentrante: atras / adelante terminan en actual()
+        self._candado = threading.RLock()
+
+    def __len__(self) -> int:
+        """Estados a los que se puede ir (incluido el actual)."""
+        return len(self._generaciones)
+
+    @property
+    def bytes_usados(self) -> int:
+        return self.bytes_deltas + (0 if self._estado is None else self._estado.nbytes)
+
+    def resumen(self) -> Tuple[int, int, int]:
+        """(posición, estados, bytes usados) leídos juntos, para mostrar desde otro hilo."""
+        with self._candado:
+            return self.posicion, len(self), self.bytes_usados
+
+    def reiniciar(self, tablero: np.ndarray, generacion: int=0):
+        """Descarta todo y toma `tablero` como único estado."""
+        with self._candado:
+            self._reiniciar(tablero, generacion)
+
+    def _reiniciar(self, tablero: np.ndarray, generacion: int):
+        self.forma = tuple(np.shape(tablero))
+        self._estado = _empaquetar(tablero)
+        self._deltas.clear()
+        self._generaciones.clear()
+        self._generaciones.append(generacion)
+        self.posicion = 0
+        self.bytes_deltas = 0
+
+    def registrar(self, tablero: np.ndarray, generacion: int):
+        """Agrega un estado después del actual (si se había retrocedido, se pierde lo posterior)."""
+        # empaquetar fuera del candado: es lo costoso y no toca el historial
+        nuevo = _empaquetar(tablero)
+        with self._candado:
+            if self._estado is None or tuple(np.shape(tablero)) != self.forma:
+                self._reiniciar(tablero, generacion)
+                return
+            self._agregar(nuevo, generacion)
+
+    def _agregar(self, nuevo: np.ndarray, generacion: int):
+        while len(self._deltas) > self.posicion:
+            self.bytes_deltas -= _tam(self._deltas.pop())
+            self._generaciones.pop()
+        xor = np.bitwise_xor(nuevo, self._estado)
+        cambios = np.flatnonzero(xor)
+        if cambios.size * _BYTES_DISPERSO < xor.size:
+            delta = (cambios.astype(np.uint32), xor[cambios])
+        else:
+            delta = (None, xor)
+        self._deltas.append(delta)
+        self._generaciones.append(generacion)
+        self.bytes_deltas += _tam(delta)
+        self._estado = nuevo
+        self.posicion += 1
+        # anillo: descartar lo más antiguo hasta entrar en el presupuesto
+        while self.bytes_usados > self.max_bytes and self._deltas:
+            self.bytes_deltas -= _tam(self._deltas.popleft())
+            self._generaciones.popleft()
+            self.posicion -= 1
+
+    def atras(self, n: int=1) -> Optional[Tuple[np.ndarray, int]]:
+        """Retrocede hasta n estados; (tablero, generación) o None si no hay más atrás."""
+        with self._candado:
+            if self.posicion == 0 or self._estado is None:
+                return None
+            for _ in range(min(n, self.posicion)):
+                self.posicion -= 1
+                _aplicar(self._estado, self._deltas[self.posicion])
+            return self.actual()
+
+    def adelante(self, n: int=1) -> Optional[Tuple[np.ndarray, int]]:
+        """Vuelve a avanzar por los estados registrados (sin simular)."""
+        with self._candado:
+            if self.posicion >= len(self._deltas) or self._estado is None:
+                return None
+            for _ in range(min(n, len(self._deltas) - self.posicion)):
+                _aplicar(self._estado, self._deltas[self.posicion])
+                self.posicion += 1
+            return self.actual()
+
+    def actual(self) -> Tuple[np.ndarray, int]:
+        with self._candado:
+            filas, cols = self.forma
+            tablero = np.unpackbits(self._estado, count=filas * cols).reshape(filas, cols)
+            return tablero, self._generaciones[self.posicion]
@@ -0,0 +1,180 @@
+"""
+Simulación por lotes del Juego de la Vida, sin interfaz
+simular() avanza un tablero N generaciones y guarda la serie de población.
+Cada estado se empaqueta en bits y se resume con un hash (blake2b de 128 bits)
+que se guarda en una tabla de las últimas `historia` generaciones; si un estado
+se repite, el tablero quedó en un ciclo (período 1: vida estática o extinción)
+y se corta la simulación. barrer() corre miles de tableros aleatorios (por
+probabilidad inicial) en un pool de procesos, con subflujos SeedSequence: el
+resultado no depende del número de procesos.
+Uso: python -m vida.lote --prob 0.1 0.2 0.3 --repeticiones 200 --generaciones 5000
+     python -m vida.lote --patron tablero.rle --generaciones 10000 --final fin.vida
+"""
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+import argparse
+import csv
+import hashlib
+import os
+import numpy as np
+
+from vida.motor_numpy import MotorNumpy
+from vida.motores import MOTORES, crear_motor
+from vida.reglas import REGLAS, BORDES, como_regla, validar_borde
+from vida.patrones import cargar_patron, guardar_patron
+
+# estados recordados para detectar ciclos (períodos mayores no se detectan)
+HISTORIA = 1024
+
+def huella(tablero: np.ndarray) -> bytes:
+    """Hash de 128 bits del tablero empaquetado en bits."""
+    return hashlib.blake2b(np.packbits(np.asarray(tablero) != 0).tobytes(), digest_size=16).digest()
+
+def _clasificar(periodo: Optional[int], poblacion: int) -> str:
+    if periodo is None:
+        return "sin ciclo"
+    if poblacion == 0:
+        return "extinta"
+    return "estable" if periodo == 1 else "oscilador"
+
+def simular(tablero: np.ndarray, generaciones: int, motor: str=MotorNumpy.nombre,
+            historia: int=HISTORIA, detener_en_ciclo: bool=True, regla=None,
+            borde: str="muerto") -> Dict[str, Any]:
+    """Avanza `tablero` hasta `generaciones` (o hasta detectar un ciclo) con la regla y el borde dados.
+    Devuelve poblacion (serie desde la generación 0), generaciones, estado
+    ("extinta", "estable", "oscilador", "sin ciclo"), periodo, inicio_ciclo y tablero final."""
+    if generaciones < 0:
+        raise ValueError("Las generaciones deben ser >= 0.")
+    if historia < 1:
+        raise ValueError("La historia debe ser >= 1.")
+    if getattr(MOTORES.get(motor), "plano_infinito", False):
+        raise ValueError("El motor del plano infinito no tiene un estado finito para detectar ciclos.")
+    m = crear_motor(motor, tablero, regla, borde)
+    try:
+        poblacion = np.empty(generaciones + 1, dtype=np.int64)
+        poblacion[0] = m.poblacion()
+        h = huella(m.tablero)
+        vistos = {h: 0}
+        orden = deque([h])
+        periodo = inicio = None
+        g = 0
+        while g < generaciones:
+            m.paso()
+            g += 1
+            poblacion[g] = m.poblacion()
+            h = huella(m.tablero)
+            previa = vistos.get(h)
+            if previa is not None:
+                periodo, inicio = g - previa, previa
+                if detener_en_ciclo:
+                    break
+                # seguir: el ciclo ya está determinado, no hace falta hashear más
+                m.paso(generaciones - g)
+                for k in range(g + 1, generaciones + 1):
+                    poblacion[k] = poblacion[k - periodo]
+                g = generaciones
+                break
+            vistos[h] = g
+            orden.append(h)
+            if len(orden) > historia:
+                del vistos[orden.popleft()]
+        return {
+            "poblacion": poblacion[:g + 1],
+            "generaciones": g,
+            "estado": _clasificar(periodo, int(poblacion[g])),
+            "periodo": periodo,
+            "inicio_ciclo": inicio,
+            "tablero": np.array(m.tablero, dtype=np.uint8),
+        }
+    finally:
+        if hasattr(m, "cerrar"):
+            m.cerrar()
+
+def _simular_aleatorio(filas: int, cols: int, prob: float, generaciones: int, motor: str, historia: int,
+                       regla, borde: str, semilla: np.random.SeedSequence) -> Dict[str, Any]:
+    tablero = (np.random.default_rng(semilla).random((filas, cols)) < prob).astype(np.uint8)
+    r = simular(tablero, generaciones, motor, historia, regla=regla, borde=borde)
+    del r["tablero"]
+    return r
+
+def barrer(filas: int, cols: int, probs: Sequence[float], repeticiones: int, generaciones: int,
+           motor: str=MotorNumpy.nombre, historia: int=HISTORIA, semilla=None,
+           trabajadores: Optional[int]=None, regla=None, borde: str="muerto") -> List[Dict[str, Any]]:
+    """simular() sobre `repeticiones` tableros aleatorios por cada probabilidad inicial.
+    Cada resultado lleva además prob y repeticion (sin el tablero final)."""
+    if repeticiones <= 0:
+        raise ValueError("Las repeticiones deben ser > 0.")
+    if any(not 0.0 <= p <= 1.0 for p in probs):
+        raise ValueError("Las probabilidades deben estar en [0, 1].")
+    regla = como_regla(regla)
+    validar_borde(borde)
+    if trabajadores is None:
+        trabajadores = os.cpu_count() or 1
+    casos = [(p, r) for p in probs for r in range(repeticiones)]
+    hijos = np.random.SeedSequence(semilla).spawn(len(casos))
+    args = [(filas, cols, p, generaciones, motor, historia, regla, borde, hijo) for (p, _), hijo in zip(casos, hijos)]
+    if trabajadores <= 1 or len(casos) == 1:
+        resultados = [_simular_aleatorio(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=min(trabajadores, len(casos))) as pool:
+            resultados = list(pool.map(_simular_aleatorio, *zip(*args),
+                                       chunksize=max(1, len(casos) // (8 * trabajadores))))
+    for (p, r), res in zip(casos, resultados):
+        res["prob"], res["repeticion"] = p, r
+    return resultados
+
+def guardar_resumen(ruta: str, resultados: Sequence[Dict[str, Any]]):
+    """CSV con una fila por tablero (sin la serie de población)."""
+    with open(ruta, "w", newline="", encoding="utf-8") as fh:
+        w = csv.writer(fh)
+        w.writerow(["prob", "repeticion", "estado", "periodo", "inicio_ciclo", "generaciones",
+                    "poblacion_inicial", "poblacion_final", "poblacion_max"])
+        for r in resultados:
+            pob = r["poblacion"]
+            ciclo = ["", ""] if r["periodo"] is None else [r["periodo"], r["inicio_ciclo"]]
+            w.writerow([r["prob"], r["repeticion"], r["estado"], *ciclo, r["generaciones"],
+                        int(pob[0]), int(pob[-1]), int(pob.max())])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Barrido de tableros aleatorios del Juego de la Vida sin interfaz")
+    parser.add_argument("--filas", type=int, default=100)
+    parser.add_argument("--cols", type=int, default=100)
+    parser.add_argument("--prob", type=float, nargs="+", default=[0.1, 0.2, 0.3, 0.4, 0.5])
+    parser.add_argument("--repeticiones", type=int, default=100)
+    parser.add_argument("--generaciones", type=int, default=5000)
+    parser.add_argument("--motor", choices=[n for n, c in MOTORES.items() if not getattr(c, "plano_infinito", False)],
+                        default=MotorNumpy.nombre)
+    parser.add_argument("--regla", default=None,
+                        help=f"B/S o nombre: {', '.join(REGLAS)} (por defecto la del patrón o Conway)")
+    parser.add_argument("--borde", choices=BORDES, default="muerto")
+    parser.add_argument("--historia", type=int, default=HISTORIA)
+    parser.add_argument("--semilla", type=int, default=None)
+    parser.add_argument("--trabajadores", type=int, default=None)
+    parser.add_argument("--salida", help="CSV con una fila por tablero")
+    parser.add_argument("--patron", help="simular este patrón (.rle / .vida) en lugar del barrido")
+    parser.add_argument("--final", help="con --patron: guardar el tablero final (.rle / .vida)")
+    args = parser.parse_args(argv)
+    if args.patron:
+        tablero, regla = cargar_patron(args.patron)
+        regla = args.regla or regla
+        r = simular(tablero, args.generaciones, args.motor, args.historia, regla=regla, borde=args.borde)
+        if args.final:
+            guardar_patron(args.final, r["tablero"], como_regla(regla).texto)
+        ciclo = "" if r["periodo"] is None else f" (período {r['periodo']} desde la generación {r['inicio_ciclo']})"
+        print(f"{r['estado']}{ciclo}: {r['generaciones']} generaciones, población {int(r['poblacion'][-1])}")
+        return
+    resultados = barrer(args.filas, args.cols, args.prob, args.repeticiones, args.generaciones, args.motor,
+                        args.historia, args.semilla, args.trabajadores, args.regla, args.borde)
+    if args.salida:
+        guardar_resumen(args.salida, resultados)
+    estados = ("extinta", "estable", "oscilador", "sin ciclo")
+    print(f"{'prob':>6} " + " ".join(f"{e:>10}" for e in estados) + f" {'gen. media':>11}")
+    for p in args.prob:
+        grupo = [r for r in resultados if r["prob"] == p]
+        conteo = [sum(r["estado"] == e for r in grupo) for e in estados]
+        media = np.mean([r["generaciones"] for r in grupo])
+        print(f"{p:>6.3f} " + " ".join(f"{c:>10}" for c in conteo) + f" {media:>11.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Motor del Juego de la Vida que solo evalúa las regiones activas
+El tablero se divide en teselas de TESELA x TESELA celdas. Una tesela se
+reevalúa solo si ella o alguna vecina cambió en la generación anterior; el
+resto no puede cambiar. Las teselas candidatas se apilan (con su marco de una
+celda) y se avanzan juntas con NumPy, así el costo por generación crece con
+la actividad y no con el tamaño del tablero. La población se lleva de forma
+incremental (nacimientos - muertes), sin recorrer el tablero. Si casi todo
+está activo (sopa aleatoria inicial) conviene el paso completo vectorizado.
+Acepta cualquier regla B/S (la tesela depende solo de su vecindad para toda
+regla); el borde es siempre muerto.
+"""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from vida.motor_numpy import DESPLAZAMIENTOS
+from vida.reglas import Regla, como_regla, validar_borde
+
+TESELA = 32
+# con más de esta fracción de teselas candidatas se avanza el tablero completo
+UMBRAL_DENSO = 0.25
+
+class MotorActivo:
+    """Regla B/S con bordes muertos, evaluando solo teselas activas."""
+    nombre = "Activo (teselas)"
+
+    def __init__(self, tablero: np.ndarray, regla: Regla=None, borde: str="muerto", tesela: int=TESELA):
+        tablero = np.asarray(tablero)
+        if tablero.ndim != 2:
+            raise ValueError("El tablero debe ser bidimensional.")
+        if validar_borde(borde) != "muerto":
+            raise ValueError("El motor de teselas activas solo admite borde muerto.")
+        self.regla = como_regla(regla)
+        self.borde = borde
+        self.filas, self.cols = tablero.shape
+        self.tesela = t = int(tesela)
+        self.n_ti, self.n_tj = -(-self.filas // t), -(-self.cols // t)
+        alto, ancho = self.n_ti * t, self.n_tj * t
+        # marco de una celda muerta alrededor de un tablero redondeado a teselas completas
+        self._marco = np.zeros((alto + 2, ancho + 2), dtype=np.uint8)
+        self._marco[1:1+self.filas, 1:1+self.cols] = tablero != 0
+        # celdas fuera del tablero real (relleno de la última tesela): siempre muertas
+        valido = np.zeros((alto, ancho), dtype=np.uint8)
+        valido[:self.filas, :self.cols] = 1
+        self._valido = valido.reshape(self.n_ti, t, self.n_tj, t).transpose(0, 2, 1, 3)
+        # ventanas (tesela + marco) sobre el marco, sin copiar: [ti, tj] -> (t+2, t+2)
+        self._ventanas = sliding_window_view(self._marco, (t + 2, t + 2))[::t, ::t]
+        # al inicio todo se considera cambiado
+        self._cambiadas = np.ones((self.n_ti, self.n_tj), dtype=bool)
+        self._poblacion = int(np.count_nonzero(self._marco))
+        self.evaluadas = 0
+
+    @property
+    def tablero(self) -> np.ndarray:
+        """Vista (filas, cols) del estado actual (escribir en ella no actualiza la población)."""
+        return self._marco[1:1+self.filas, 1:1+self.cols]
+
+    @property
+    def teselas_cambiadas(self) -> np.ndarray:
+        """Mapa (teselas_i, teselas_j) de las teselas que cambiaron en el último paso."""
+        return self._cambiadas
+
+    def alternar(self, i: int, j: int):
+        celda = self._marco[1 + i, 1 + j]
+        self._marco[1 + i, 1 + j] = 1 - celda
+        self._poblacion += 1 if celda == 0 else -1
+        self._cambiadas[i // self.tesela, j // self.tesela] = True
+
+    def poblacion(self) -> int:
+        return self._poblacion
+
+    def paso(self, n: int=1):
+        for _ in range(n):
+            self._paso()
+
+    def _candidatas(self) -> np.ndarray:
+        # dilatación 3x3 del mapa de teselas cambiadas
+        c = self._cambiadas
+        d = c.copy()
+        d[1:, :] |= c[:-1, :]
+        d[:-1, :] |= c[1:, :]
+        e = d.copy()
+        e[:, 1:] |= d[:, :-1]
+        e[:, :-1] |= d[:, 1:]
+        return e
+
+    def _paso(self):
+        candidatas = self._candidatas()
+        ti, tj = np.nonzero(candidatas)
+        self.evaluadas = ti.size
+        if ti.size > UMBRAL_DENSO * candidatas.size:
+            self._paso_completo()
+            return
+        self._cambiadas = np.zeros((self.n_ti, self.n_tj), dtype=bool)
+        if ti.size == 0:
+            return
+        t = self.tesela
+        # copia de las teselas candidatas con su marco: (k, t+2, t+2)
+        bloques = self._ventanas[ti, tj]
+        viejo = bloques[:, 1:-1, 1:-1]
+        # índice en la tabla de la regla: 9 * viva + vecinos
+        indice = viejo * np.uint8(9)
+        for di, dj in DESPLAZAMIENTOS:
+            indice += bloques[:, 1+di:1+di+t, 1+dj:1+dj+t]
+        nuevo = self.regla.aplicar(indice, out=indice)
+        nuevo &= self._valido[ti, tj]
+        cambio = (nuevo != viejo).any(axis=(1, 2))
+        self._poblacion += int(nuevo.sum(dtype=np.int64)) - int(viejo.sum(dtype=np.int64))
+        # escribir solo las teselas que cambiaron
+        for k in np.flatnonzero(cambio).tolist():
+            i0, j0 = 1 + ti[k] * t, 1 + tj[k] * t
+            self._marco[i0:i0+t, j0:j0+t] = nuevo[k]
+        self._cambiadas[ti[cambio], tj[cambio]] = True
+
+    def _paso_completo(self):
+        t = self.tesela
+        marco = self._marco
+        alto, ancho = marco.shape[0] - 2, marco.shape[1] - 2
+        viejo = marco[1:-1, 1:-1]
+        indice = viejo * np.uint8(9)
+        for di, dj in DESPLAZAMIENTOS:
+            indice += marco[1+di:1+di+alto, 1+dj:1+dj+ancho]
+        nuevo = self.regla.aplicar(indice, out=indice)
+        nuevo[self.filas:, :] = 0
+        nuevo[:, self.cols:] = 0
+        self._cambiadas = (nuevo != viejo).reshape(self.n_ti, t, self.n_tj, t).any(axis=(1, 3))
+        viejo[...] = nuevo
+        self._poblacion = int(np.count_nonzero(nuevo))
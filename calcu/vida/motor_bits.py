@@ -0,0 +1,195 @@
+"""
+Motor del Juego de la Vida con tablero empaquetado en bits (uint64)
+Cada fila ocupa ceil(cols/64) palabras y el bit j de la palabra w es la
+columna 64*w + j, así un tablero de 10^4 x 10^4 ocupa ~12 MB en lugar de 100 MB.
+La siguiente generación se calcula con lógica de sumadores bit a bit: cada
+operación NumPy avanza 64 celdas por palabra. La tabla de la regla se compila
+una vez en una expresión de bits sobre (viva, s0..s3), los bits del conteo de
+vecinos (expansión de Shannon que aprovecha que el conteo nunca pasa de 8),
+así cualquier regla B/S se evalúa con unas pocas operaciones por palabra.
+Bordes como MotorNumpy: muerto, toroidal o reflejado.
+"""
+from typing import Callable
+import numpy as np
+
+from vida.reglas import Regla, como_regla, validar_borde
+
+BITS = 64
+# filas procesadas por bloque: los temporales caben en caché aun con tableros enormes
+FILAS_BLOQUE = 256
+_UNO = np.uint64(1)
+_63 = np.uint64(63)
+
+def empaquetar(tablero: np.ndarray) -> np.ndarray:
+    """(filas, cols) 0/1 -> (filas, ceil(cols/64)) uint64."""
+    tablero = np.asarray(tablero)
+    filas, cols = tablero.shape
+    palabras = -(-cols // BITS)
+    bytes_ = np.packbits(tablero != 0, axis=1, bitorder="little")
+    relleno = np.zeros((filas, palabras * 8), dtype=np.uint8)
+    relleno[:, :bytes_.shape[1]] = bytes_
+    return relleno.view("<u8").astype(np.uint64)
+
+def desempaquetar(palabras: np.ndarray, cols: int) -> np.ndarray:
+    """Inversa de empaquetar: (filas, cols) uint8."""
+    bytes_ = np.ascontiguousarray(palabras, dtype="<u8").view(np.uint8)
+    return np.unpackbits(bytes_, axis=1, count=cols, bitorder="little")
+
+def contar_bits(palabras: np.ndarray) -> int:
+    if hasattr(np, "bitwise_count"):
+        return int(np.bitwise_count(palabras).sum(dtype=np.int64))
+    return int(np.unpackbits(np.ascontiguousarray(palabras).view(np.uint8)).sum(dtype=np.int64))
+
+# variables de la expresión, de la más a la menos significativa del índice de la tabla de verdad
+_VARIABLES = ("s3", "s2", "s1", "s0", "v")
+
+def _arbol(valores: tuple, variables: tuple):
+    """Árbol de multiplexores para una tabla de verdad con indiferentes (None)."""
+    definidos = {x for x in valores if x is not None}
+    if len(definidos) <= 1:
+        return ("1",) if definidos == {1} else ("0",)
+    mitad = len(valores) // 2
+    bajo, alto = valores[:mitad], valores[mitad:]
+    # si las dos mitades no se contradicen la variable no importa
+    if all(x is None or y is None or x == y for x, y in zip(bajo, alto)):
+        return _arbol(tuple(x if x is not None else y for x, y in zip(bajo, alto)), variables[1:])
+    a, b = _arbol(bajo, variables[1:]), _arbol(alto, variables[1:])
+    return a if a == b else ("mux", variables[0], a, b)
+
+def _evaluar(nodo, e: dict) -> np.ndarray:
+    tipo = nodo[0]
+    if tipo == "0":
+        return np.zeros_like(e["v"])
+    if tipo == "1":
+        return np.full_like(e["v"], np.uint64(2**64 - 1))
+    _, var, bajo, alto = nodo
+    x = e[var]
+    if bajo[0] == "0":
+        return x if alto[0] == "1" else x & _evaluar(alto, e)
+    if bajo[0] == "1":
+        return ~x if alto[0] == "0" else ~x | _evaluar(alto, e)
+    if alto[0] == "0":
+        return ~x & _evaluar(bajo, e)
+    if alto[0] == "1":
+        return x | _evaluar(bajo, e)
+    return (x & _evaluar(alto, e)) | (~x & _evaluar(bajo, e))
+
+def compilar_regla(regla: Regla) -> Callable[[dict], np.ndarray]:
+    """f({"v", "s0".."s3": arreglos uint64}) -> estado siguiente, bit a bit."""
+    valores = []
+    for k in range(32):
+        s3, s2, s1, s0, v = ((k >> b) & 1 for b in (4, 3, 2, 1, 0))
+        vecinos = 8 * s3 + 4 * s2 + 2 * s1 + s0
+        valores.append(None if vecinos > 8 else int(regla.tabla[9 * v + vecinos]))
+    arbol = _arbol(tuple(valores), _VARIABLES)
+    return lambda e: _evaluar(arbol, e)
+
+class MotorBits:
+    """Regla B/S sobre palabras uint64 con una fila de marco arriba y abajo."""
+    nombre = "Bits (uint64)"
+
+    def __init__(self, tablero: np.ndarray, regla: Regla=None, borde: str="muerto"):
+        tablero = np.asarray(tablero)
+        if tablero.ndim != 2:
+            raise ValueError("El tablero debe ser bidimensional.")
+        self._preparar(tablero.shape[0], tablero.shape[1], regla, borde)
+        self._a[1:-1] = empaquetar(tablero)
+
+    @classmethod
+    def desde_palabras(cls, palabras: np.ndarray, cols: int, regla: Regla=None, borde: str="muerto") -> "MotorBits":
+        """Motor a partir de palabras ya empaquetadas (filas, ceil(cols/64)), p. ej. el memmap de
+        un .vida (vida.patrones.abrir_binario), sin pasar por un tablero uint8."""
+        if palabras.ndim != 2 or palabras.shape[1] != -(-cols // BITS):
+            raise ValueError(f"Se esperaban {-(-cols // BITS)} palabras por fila para {cols} columnas.")
+        m = cls.__new__(cls)
+        m._preparar(palabras.shape[0], cols, regla, borde)
+        for ini in range(0, m.filas, FILAS_BLOQUE):
+            fin = min(ini + FILAS_BLOQUE, m.filas)
+            m._a[1+ini:1+fin] = palabras[ini:fin]
+        # las columnas sobrantes de la última palabra deben quedar muertas
+        m._a[1:-1, -1] &= m._mascara
+        return m
+
+    def _preparar(self, filas: int, cols: int, regla: Regla, borde: str):
+        self.filas, self.cols = filas, cols
+        self.regla = como_regla(regla)
+        self.borde = validar_borde(borde)
+        self._siguiente = compilar_regla(self.regla)
+        self.palabras = -(-self.cols // BITS)
+        # dos búferes (actual / siguiente) que se alternan; filas 0 y -1: marco (muerto salvo otro borde)
+        self._a = np.zeros((self.filas + 2, self.palabras), dtype=np.uint64)
+        self._b = np.zeros_like(self._a)
+        # bits válidos de la última palabra (las columnas sobrantes siempre muertas)
+        resto = self.cols % BITS
+        self._mascara = np.uint64((1 << resto) - 1) if resto else np.uint64(2**64 - 1)
+        # bit de la última columna dentro de la última palabra
+        self._ultimo = np.uint64((self.cols - 1) % BITS)
+
+    @property
+    def tablero(self) -> np.ndarray:
+        """Copia (filas, cols) uint8 del estado actual."""
+        return desempaquetar(self._a[1:-1], self.cols)
+
+    def alternar(self, i: int, j: int):
+        self._a[1 + i, j // BITS] ^= _UNO << np.uint64(j % BITS)
+
+    def celda(self, i: int, j: int) -> int:
+        """Estado de una célula sin desempaquetar el tablero."""
+        return int((self._a[1 + i, j // BITS] >> np.uint64(j % BITS)) & _UNO)
+
+    def poblacion(self) -> int:
+        return contar_bits(self._a[1:-1])
+
+    def paso(self, n: int=1):
+        for _ in range(n):
+            self._paso()
+
+    def _paso(self):
+        a = self._a
+        if self.borde == "toroidal":
+            a[0], a[-1] = a[-2], a[1]
+        elif self.borde == "reflejado":
+            a[0], a[-1] = a[1], a[-2]
+        for ini in range(0, self.filas, FILAS_BLOQUE):
+            fin = min(ini + FILAS_BLOQUE, self.filas)
+            # filas ini..fin-1 del tablero usan las filas ini..fin+1 del búfer (con vecinas)
+            self._b[1+ini:1+fin] = self._bloque(self._a[ini:fin+2])
+        self._a, self._b = self._b, self._a
+
+    def _bloque(self, a: np.ndarray) -> np.ndarray:
+        """Siguiente estado de las filas centrales de `a` (todas menos la primera y la última)."""
+        # vecino oeste (columna c-1) y este (c+1), con acarreo entre palabras
+        oeste = a << _UNO
+        oeste[:, 1:] |= a[:, :-1] >> _63
+        este = a >> _UNO
+        este[:, :-1] |= a[:, 1:] << _63
+        # columnas fuera del tablero según el borde (muerto: quedan en 0)
+        if self.borde == "toroidal":
+            oeste[:, 0] |= (a[:, -1] >> self._ultimo) & _UNO
+            este[:, -1] |= (a[:, 0] & _UNO) << self._ultimo
+        elif self.borde == "reflejado":
+            oeste[:, 0] |= a[:, 0] & _UNO
+            este[:, -1] |= a[:, -1] & (_UNO << self._ultimo)
+        # suma horizontal de 3 (oeste + centro + este) en dos bits h0, h1 ...
+        ox = oeste ^ este
+        h0 = ox ^ a
+        h1 = (oeste & este) | (ox & a)
+        # ... y de 2 (sin el centro) para la fila propia: g0 = ox, g1 = oeste & este
+        g1 = oeste & este
+        # vecinos = H(fila de arriba) + G(fila propia) + H(fila de abajo)
+        h0a, h1a, h0b, h1b = h0[:-2], h1[:-2], h0[2:], h1[2:]
+        g0, g1 = ox[1:-1], g1[1:-1]
+        # unidades: sumador completo de h0a, g0, h0b -> s0 y acarreo (peso 2)
+        t = h0a ^ g0
+        s0 = t ^ h0b
+        acarreo = (h0a & g0) | (t & h0b)
+        # peso 2: h1a + g1 + h1b + acarreo -> s1 y dos acarreos de peso 4
+        u = h1a ^ g1
+        x = u ^ h1b
+        c4a = (h1a & g1) | (u & h1b)
+        s1 = x ^ acarreo
+        c4b = x & acarreo
+        # pesos 4 y 8 (el conteo no pasa de 8)
+        nuevo = self._siguiente({"v": a[1:-1], "s0": s0, "s1": s1, "s2": c4a ^ c4b, "s3": c4a & c4b})
+        nuevo[:, -1] &= self._mascara
+        return nuevo
@@ -0,0 +1,115 @@
+"""
+Motor vectorizado del Juego de la Vida sobre un tablero NumPy uint8
+El tablero vive dentro de un marco de una celda (muerto, o rellenado antes de
+cada generación si el borde es toroidal o reflejado). Los vecinos se cuentan
+sumando las ocho vistas desplazadas del marco en búferes preasignados. Si la
+regla es corta (Regla.comparaciones: Conway, HighLife, Seeds...) el estado
+siguiente sale de unas pocas comparaciones sobre el conteo; si no, de la
+tabla de la regla (vida/reglas.py) indexada por 9 * viva + vecinos. Así cada
+generación no crea arreglos nuevos ni recorre celdas en Python, con
+cualquier regla.
+"""
+import numpy as np
+
+from vida.reglas import Regla, como_regla, validar_borde, rellenar_marco
+
+# (di, dj) de los ocho vecinos
+DESPLAZAMIENTOS = [(di, dj) for di in (-1, 0, 1) for dj in (-1, 0, 1) if (di, dj) != (0, 0)]
+
+class MotorNumpy:
+    """Regla B/S (Conway por defecto) con borde a elegir. `tablero` es una vista escribible."""
+    nombre = "NumPy"
+
+    def __init__(self, tablero: np.ndarray, regla: Regla=None, borde: str="muerto"):
+        tablero = np.asarray(tablero)
+        if tablero.ndim != 2:
+            raise ValueError("El tablero debe ser bidimensional.")
+        self.filas, self.cols = tablero.shape
+        self.regla = como_regla(regla)
+        self.borde = validar_borde(borde)
+        # dos marcos (actual / siguiente) que se alternan; con borde muerto el marco queda en 0
+        self._marcos = [np.zeros((self.filas + 2, self.cols + 2), dtype=np.uint8) for _ in range(2)]
+        self._actual = 0
+        self._marcos[0][1:-1, 1:-1] = tablero != 0
+        self._indice = bufer_indice(self.filas, self.cols)
+
+    @property
+    def tablero(self) -> np.ndarray:
+        """Vista (filas, cols) del estado actual; escribir en ella modifica el tablero."""
+        return self._marcos[self._actual][1:-1, 1:-1]
+
+    def alternar(self, i: int, j: int):
+        self.tablero[i, j] ^= 1
+
+    def poblacion(self) -> int:
+        return int(np.count_nonzero(self.tablero))
+
+    def paso(self, n: int=1):
+        for _ in range(n):
+            self._paso()
+
+    def _paso(self):
+        marco = self._marcos[self._actual]
+        rellenar_marco(marco, self.borde)
+        siguiente = self._marcos[1 - self._actual]
+        paso_tabla(marco, siguiente[1:-1, 1:-1], self.regla, self._indice)
+        self._actual = 1 - self._actual
+
+def bufer_indice(filas: int, cols: int) -> np.ndarray:
+    """Búferes uint8 para paso_tabla: [0] índice o vecinos, [1] y [2] auxiliares de las
+    comparaciones; de ancho par (la tabla de pares resuelve dos celdas por vez)."""
+    return np.zeros((3, filas, cols + cols % 2), dtype=np.uint8)
+
+def paso_tabla(marco: np.ndarray, destino: np.ndarray, regla: Regla, indice: np.ndarray,
+               i0: int=1, i1: int=None):
+    """Estado siguiente de las filas i0..i1-1 de `marco` (con marco de una celda) en `destino`.
+    `indice` viene de bufer_indice(i1 - i0, columnas)."""
+    if i1 is None:
+        i1 = marco.shape[0] - 1
+    c = marco.shape[1] - 2
+    viva = marco[i0:i1, 1:-1]
+    vista = indice[0, :, :c]
+    if regla.comparaciones is not None:
+        # solo el conteo de vecinos: las dos primeras vistas se suman sin limpiar el búfer
+        (di0, dj0), (di1, dj1) = DESPLAZAMIENTOS[:2]
+        np.add(marco[i0+di0:i1+di0, 1+dj0:1+dj0+c], marco[i0+di1:i1+di1, 1+dj1:1+dj1+c], out=vista)
+        for di, dj in DESPLAZAMIENTOS[2:]:
+            np.add(vista, marco[i0+di:i1+di, 1+dj:1+dj+c], out=vista)
+        _comparar(regla.comparaciones, vista, viva, destino, indice[1, :, :c].view(bool), indice[2, :, :c])
+        return
+    # índice en la tabla de la regla: 9 * viva + vecinos
+    np.multiply(viva, 9, out=vista)
+    for di, dj in DESPLAZAMIENTOS:
+        np.add(vista, marco[i0+di:i1+di, 1+dj:1+dj+c], out=vista)
+    regla.aplicar(indice[0], out=indice[0])
+    destino[...] = vista
+
+def _comparar(comparaciones, vecinos: np.ndarray, viva: np.ndarray, destino: np.ndarray,
+              termino: np.ndarray, aux: np.ndarray):
+    """destino = "o" de (a <= vecinos <= b y condición) sobre las corridas de la regla."""
+    if not comparaciones:
+        destino[...] = 0
+        return
+    for k, (a, b, condicion) in enumerate(comparaciones):
+        # el primer término va directo a destino; los demás se acumulan con "o"
+        salida = destino if k == 0 and condicion == "siempre" else termino
+        if a == 0 and b == 8:
+            salida[...] = 1
+        elif a == b:
+            np.equal(vecinos, a, out=salida)
+        elif a == 0:
+            np.less_equal(vecinos, b, out=salida)
+        elif b == 8:
+            np.greater_equal(vecinos, a, out=salida)
+        else:
+            # en uint8 los vecinos < a dan la vuelta y quedan > b - a
+            np.subtract(vecinos, a, out=aux)
+            np.less_equal(aux, b - a, out=salida)
+        objetivo = destino if k == 0 else termino
+        if condicion == "viva":
+            np.logical_and(termino, viva, out=objetivo)
+        elif condicion == "muerta":
+            # termino > viva: el término se cumple y la celda está muerta
+            np.greater(termino, viva, out=objetivo)
+        if k > 0:
+            np.logical_or(destino, termino, out=destino)
@@ -0,0 +1,192 @@
+"""
+Motor del Juego de la Vida repartido en franjas horizontales entre procesos
+El tablero (con su marco de una celda muerta) vive en dos cuadros de memoria
+compartida que se alternan: en cada generación cada proceso lee su franja del
+cuadro actual más una fila de halo arriba y abajo (la última fila de la
+franja vecina, leída directamente de la memoria compartida) y escribe su
+franja en el siguiente. Una barrera entre generaciones asegura que ninguna
+franja se lee antes de que su vecina termine de escribirla; como se escribe
+en el otro cuadro basta una barrera por generación. Con borde toroidal o
+reflejado cada proceso escribe además el marco que sale de sus propias filas
+(vida/reglas.py: rellenar_marco) antes de la barrera. Los procesos viven
+mientras viva el motor (llamar a cerrar() o dejar que lo haga el recolector);
+cargar() pone otro tablero de la misma forma (y otra regla o borde) sin
+volver a lanzarlos.
+El proceso principal no participa de las barreras: da la orden a cada
+trabajador con su propio semáforo y espera un semáforo de "hecho" por
+trabajador en intervalos de SONDEO segundos, comprobando que sigan vivos. Si
+uno muere (p. ej. un script sin `if __name__ == "__main__":`, que con spawn
+falla al importarse en el hijo) se rompe la barrera de los demás, se cierra
+el motor y paso() lanza RuntimeError en lugar de quedar esperando.
+"""
+from multiprocessing import shared_memory
+from threading import BrokenBarrierError
+from typing import Optional
+import multiprocessing
+import os
+import weakref
+import numpy as np
+
+from vida.motor_numpy import paso_tabla, bufer_indice
+from vida.reglas import BORDES, Regla, como_regla, validar_borde, rellenar_marco
+
+# franjas más finas no compensan la sincronización
+FILAS_MIN_FRANJA = 64
+# segundos de espera al cerrar antes de terminar los procesos a la fuerza
+ESPERA_CIERRE = 5.0
+# segundos entre comprobaciones de que los trabajadores siguen vivos
+SONDEO = 0.5
+# bytes para el texto de la regla en memoria compartida ("B012345678/S012345678")
+LARGO_REGLA = 24
+
+def _trabajador(nombre_shm: str, forma, i0: int, i1: int, orden, actual, regla_texto, borde_indice,
+                inicio, hecho, generacion):
+    """Avanza las filas i0..i1-1 del marco (índices con borde) leyendo una fila de halo por lado."""
+    shm = shared_memory.SharedMemory(name=nombre_shm)
+    marcos = None
+    try:
+        marcos = np.ndarray((2,) + tuple(forma), dtype=np.uint8, buffer=shm.buf)
+        indice = bufer_indice(i1 - i0, forma[1] - 2)
+        regla = None
+        while True:
+            inicio.acquire()
+            n = orden.value
+            if n < 0:
+                break
+            # cargar() pudo cambiar la regla o el borde entre órdenes
+            texto = regla_texto.value.decode("ascii")
+            if regla is None or regla.texto != texto:
+                regla = Regla(texto)
+            borde = BORDES[borde_indice.value]
+            a = actual.value
+            for k in range(n):
+                paso_tabla(marcos[a], marcos[1 - a][i0:i1, 1:-1], regla, indice, i0, i1)
+                rellenar_marco(marcos[1 - a], borde, i0, i1)
+                a = 1 - a
+                if k < n - 1:
+                    generacion.wait()
+            hecho.release()
+    except BrokenBarrierError:
+        # otro trabajador murió y el principal rompió la barrera: terminar
+        pass
+    finally:
+        marcos = None
+        shm.close()
+
+def _cerrar(procesos, shm, orden, inicios, generacion):
+    orden.value = -1
+    # despierta a los que esperan orden y a los que quedaron en la barrera
+    for s in inicios:
+        s.release()
+    generacion.abort()
+    for p in procesos:
+        p.join(ESPERA_CIERRE)
+        if p.is_alive():
+            p.terminate()
+    try:
+        shm.close()
+    except BufferError:
+        # todavía hay vistas del tablero vivas; el segmento se libera igual con unlink
+        pass
+    shm.unlink()
+
+class MotorParalelo:
+    """Regla B/S con borde a elegir, en franjas horizontales sobre varios procesos."""
+    nombre = "Paralelo (franjas)"
+
+    def __init__(self, tablero: np.ndarray, regla: Regla=None, borde: str="muerto",
+                 trabajadores: Optional[int]=None):
+        tablero = np.asarray(tablero)
+        if tablero.ndim != 2:
+            raise ValueError("El tablero debe ser bidimensional.")
+        self.filas, self.cols = tablero.shape
+        # validar antes de reservar la memoria compartida
+        regla, borde = como_regla(regla), validar_borde(borde)
+        if trabajadores is None:
+            trabajadores = os.cpu_count() or 1
+        self.trabajadores = w = max(1, min(int(trabajadores), self.filas // FILAS_MIN_FRANJA))
+        forma = (self.filas + 2, self.cols + 2)
+        self._shm = shared_memory.SharedMemory(create=True, size=2 * forma[0] * forma[1])
+        self._marcos = np.ndarray((2,) + forma, dtype=np.uint8, buffer=self._shm.buf)
+        # spawn: los procesos no heredan el estado de Tk ni hilos de la ventana
+        ctx = multiprocessing.get_context("spawn")
+        self._orden = ctx.RawValue("q", 0)
+        self._actual_compartido = ctx.RawValue("b", 0)
+        self._regla_texto = ctx.RawArray("c", LARGO_REGLA)
+        self._borde_indice = ctx.RawValue("b", 0)
+        self.cargar(tablero, regla, borde)
+        # un semáforo de orden por trabajador: nadie puede tomar la orden de otro
+        self._inicios = [ctx.Semaphore(0) for _ in range(w)]
+        self._hecho = ctx.Semaphore(0)
+        self._generacion = ctx.Barrier(w)
+        # filas del marco 1..filas repartidas en w franjas contiguas
+        cortes = np.linspace(1, self.filas + 1, w + 1).astype(int).tolist()
+        self.franjas = list(zip(cortes[:-1], cortes[1:]))
+        self._procesos = [ctx.Process(target=_trabajador, daemon=True,
+                                      args=(self._shm.name, forma, i0, i1, self._orden, self._actual_compartido,
+                                            self._regla_texto, self._borde_indice, s, self._hecho, self._generacion))
+                          for (i0, i1), s in zip(self.franjas, self._inicios)]
+        for p in self._procesos:
+            p.start()
+        self._finalizador = weakref.finalize(self, _cerrar, self._procesos, self._shm, self._orden,
+                                             self._inicios, self._generacion)
+
+    @property
+    def tablero(self) -> np.ndarray:
+        """Vista (filas, cols) del estado actual en memoria compartida (escribible)."""
+        return self._marcos[self._actual, 1:-1, 1:-1]
+
+    def cargar(self, tablero: np.ndarray, regla: Regla=None, borde: str="muerto"):
+        """Reemplaza el tablero (misma forma), la regla y el borde sin relanzar los procesos."""
+        if self._marcos is None:
+            raise RuntimeError("El motor paralelo ya fue cerrado.")
+        tablero = np.asarray(tablero)
+        if tablero.shape != (self.filas, self.cols):
+            raise ValueError(f"El tablero debe ser de {self.filas}x{self.cols}.")
+        regla, borde = como_regla(regla), validar_borde(borde)
+        texto = regla.texto.encode("ascii")
+        if len(texto) > LARGO_REGLA:
+            raise ValueError(f"Regla demasiado larga para el motor paralelo: {regla.texto}")
+        self.regla, self.borde = regla, borde
+        self._regla_texto.value = texto
+        self._borde_indice.value = BORDES.index(borde)
+        # `tablero` puede ser una vista de los propios marcos (self.tablero): copiar antes de limpiar
+        vivas = tablero != 0
+        self._marcos[...] = 0
+        self._marcos[0, 1:-1, 1:-1] = vivas
+        self._actual = 0
+
+    def alternar(self, i: int, j: int):
+        self.tablero[i, j] ^= 1
+
+    def poblacion(self) -> int:
+        return int(np.count_nonzero(self.tablero))
+
+    def paso(self, n: int=1):
+        if n <= 0:
+            return
+        if not self._finalizador.alive:
+            raise RuntimeError("El motor paralelo ya fue cerrado.")
+        # el tablero pudo cambiar desde fuera (alternar): el marco inicial se rellena aquí
+        rellenar_marco(self._marcos[self._actual], self.borde)
+        self._orden.value = n
+        self._actual_compartido.value = self._actual
+        for s in self._inicios:
+            s.release()
+        for _ in self._procesos:
+            while not self._hecho.acquire(timeout=SONDEO):
+                if not all(p.is_alive() for p in self._procesos):
+                    self._abortar()
+        self._actual = (self._actual + n) % 2
+
+    def _abortar(self):
+        muertos = [p.exitcode for p in self._procesos if not p.is_alive()]
+        self.cerrar()
+        raise RuntimeError(f"Un proceso del motor paralelo terminó inesperadamente (código {muertos[0]}). "
+                           "Si el motor se usa desde un script, el código principal debe ir dentro de "
+                           "`if __name__ == \"__main__\":`.")
+
+    def cerrar(self):
+        """Detiene los procesos y libera la memoria compartida."""
+        self._marcos = None
+        self._finalizador()
@@ -0,0 +1,33 @@
+"""
+Registro de motores del Juego de la Vida
+Todos comparten la interfaz: Motor(tablero uint8, regla, borde), .tablero, .paso(n),
+.poblacion() y .alternar(i, j); la interfaz elige uno por nombre. Los que
+usan recursos externos (procesos) tienen además .cerrar(), y los que guardan
+el tablero empaquetado (Bits, Hashlife) .celda(i, j) para leer una célula sin
+sacar el tablero entero.
+"""
+import numpy as np
+
+from vida.motor_numpy import MotorNumpy
+from vida.motor_bits import MotorBits
+from vida.motor_activo import MotorActivo
+from vida.hashlife import MotorHashlife
+from vida.motor_paralelo import MotorParalelo
+
+MOTORES = {
+    MotorNumpy.nombre: MotorNumpy,
+    MotorBits.nombre: MotorBits,
+    MotorActivo.nombre: MotorActivo,
+    MotorHashlife.nombre: MotorHashlife,
+    MotorParalelo.nombre: MotorParalelo,
+}
+
+# motores pensados para tableros de ~10^4 x 10^4 (un bit por célula o quadtree)
+MOTORES_GRANDES = (MotorBits.nombre, MotorHashlife.nombre)
+
+def crear_motor(nombre: str, tablero: np.ndarray, regla=None, borde: str="muerto"):
+    """`regla`: Regla, texto B/S o nombre de vida.reglas.REGLAS (None: Conway).
+    Lanza ValueError si el motor no admite la regla o el borde."""
+    if nombre not in MOTORES:
+        raise ValueError(f"Motor no soportado: {nombre}")
+    return MOTORES[nombre](tablero, regla=regla, borde=borde)
@@ -0,0 +1,164 @@
+"""
+Lectura y escritura de patrones del Juego de la Vida
+.rle: formato de texto estándar (x = ..., y = ..., rule = ...; b muerta,
+o viva, $ fin de fila, ! fin) con corridas, p. ej. un planeador "bo$2bo$3o!".
+.vida: binario empaquetado para tableros grandes: encabezado de 64 bytes y
+una fila por bloque de palabras uint64 little-endian (el mismo orden de bits
+que vida.motor_bits), así un tablero de 10^5 x 10^5 ocupa ~1.2 GB. Se lee con
+np.memmap: leer_binario lo desempaqueta por bloques de filas en un tablero
+uint8 (un byte por celda, ocho veces el archivo), y cargar_motor_bits copia
+las palabras directo a un MotorBits sin desempaquetarlas (el motor ocupa dos
+veces el archivo); este es el camino para tableros enormes.
+"""
+from typing import Optional, Tuple
+import os
+import re
+import struct
+import numpy as np
+
+from vida.motor_bits import BITS, FILAS_BLOQUE, MotorBits, empaquetar
+
+MAGIA = b"VIDAbin1"
+TAM_ENCABEZADO = 64
+# magia, filas, columnas, largo de la regla (el texto de la regla va después)
+_ENCABEZADO = struct.Struct("<8sQQH")
+# ancho máximo de las líneas del RLE (convención del formato)
+ANCHO_RLE = 70
+EXTENSIONES = {".rle": "rle", ".vida": "vida"}
+TIPOS_ARCHIVO = [("RLE", "*.rle"), ("Binario empaquetado", "*.vida")]
+
+_CABECERA_RLE = re.compile(r"^\s*x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)(?:\s*,\s*rule\s*=\s*(\S+))?", re.IGNORECASE)
+_TOKEN_RLE = re.compile(r"(\d*)([A-Za-z.$!])")
+
+def formato_patron(ruta: str) -> str:
+    ext = os.path.splitext(ruta)[1].lower()
+    if ext not in EXTENSIONES:
+        raise ValueError(f"Formato de patrón no soportado: {ext or ruta} (use .rle o .vida)")
+    return EXTENSIONES[ext]
+
+# ---------- RLE ----------
+def leer_rle(ruta: str) -> Tuple[np.ndarray, Optional[str]]:
+    """Devuelve (tablero uint8 de y x x, regla del archivo o None)."""
+    with open(ruta, encoding="utf-8") as fh:
+        lineas = [l.strip() for l in fh if l.strip() and not l.lstrip().startswith("#")]
+    if not lineas:
+        raise ValueError("El archivo RLE está vacío.")
+    m = _CABECERA_RLE.match(lineas[0])
+    if not m:
+        raise ValueError("Falta la cabecera RLE (x = ..., y = ...).")
+    cols, filas = int(m.group(1)), int(m.group(2))
+    regla = m.group(3)
+    tablero = np.zeros((filas, cols), dtype=np.uint8)
+    i = j = 0
+    for n, simbolo in _TOKEN_RLE.findall("".join(lineas[1:])):
+        k = int(n) if n else 1
+        if simbolo == "!":
+            break
+        if simbolo == "$":
+            i, j = i + k, 0
+            continue
+        if simbolo not in "b.":
+            # cualquier otra letra es un estado vivo (RLE de varios estados)
+            if i >= filas or j + k > cols:
+                raise ValueError("El patrón RLE se sale de las dimensiones declaradas.")
+            tablero[i, j:j + k] = 1
+        j += k
+    return tablero, regla
+
+def _corrida(k: int, simbolo: str) -> str:
+    return f"{k}{simbolo}" if k > 1 else simbolo
+
+def escribir_rle(ruta: str, tablero: np.ndarray, regla: Optional[str]=None):
+    tablero = np.asarray(tablero)
+    filas, cols = tablero.shape
+    tokens = []
+    pendientes = 0
+    for fila in tablero:
+        # inicios y fines de las corridas de vivas
+        bordes = np.flatnonzero(np.diff(fila != 0, prepend=False, append=False))
+        if bordes.size == 0:
+            pendientes += 1
+            continue
+        if pendientes:
+            tokens.append(_corrida(pendientes, "$"))
+        pos = 0
+        for ini, fin in bordes.reshape(-1, 2).tolist():
+            if ini > pos:
+                tokens.append(_corrida(ini - pos, "b"))
+            tokens.append(_corrida(fin - ini, "o"))
+            pos = fin
+        pendientes = 1
+    tokens.append("!")
+    lineas, actual = [], ""
+    for t in tokens:
+        if len(actual) + len(t) > ANCHO_RLE:
+            lineas.append(actual)
+            actual = ""
+        actual += t
+    lineas.append(actual)
+    cabecera = f"x = {cols}, y = {filas}" + (f", rule = {regla}" if regla else "")
+    with open(ruta, "w", encoding="utf-8") as fh:
+        fh.write(cabecera + "\n" + "\n".join(lineas) + "\n")
+
+# ---------- binario empaquetado ----------
+def escribir_binario(ruta: str, tablero: np.ndarray, regla: Optional[str]=None):
+    """Escribe por bloques de FILAS_BLOQUE filas (memoria acotada aun con tableros enormes)."""
+    tablero = np.asarray(tablero)
+    filas, cols = tablero.shape
+    texto = (regla or "").encode("ascii")
+    if _ENCABEZADO.size + len(texto) > TAM_ENCABEZADO:
+        raise ValueError("Texto de regla demasiado largo para el encabezado.")
+    encabezado = _ENCABEZADO.pack(MAGIA, filas, cols, len(texto)) + texto
+    try:
+        with open(ruta, "wb") as fh:
+            fh.write(encabezado.ljust(TAM_ENCABEZADO, b"\0"))
+            for ini in range(0, filas, FILAS_BLOQUE):
+                fh.write(empaquetar(tablero[ini:ini + FILAS_BLOQUE]).astype("<u8").tobytes())
+    except BaseException:
+        # no dejar un archivo a medio escribir
+        if os.path.exists(ruta):
+            os.remove(ruta)
+        raise
+
+def abrir_binario(ruta: str) -> Tuple[np.memmap, int, Optional[str]]:
+    """(palabras (filas, ceil(cols/64)) '<u8' en memmap de solo lectura, cols, regla)."""
+    with open(ruta, "rb") as fh:
+        encabezado = fh.read(TAM_ENCABEZADO)
+    if len(encabezado) < TAM_ENCABEZADO or encabezado[:len(MAGIA)] != MAGIA:
+        raise ValueError("No es un archivo .vida válido.")
+    _, filas, cols, largo = _ENCABEZADO.unpack_from(encabezado)
+    regla = encabezado[_ENCABEZADO.size:_ENCABEZADO.size + largo].decode("ascii") or None
+    palabras = -(-cols // BITS)
+    if os.path.getsize(ruta) < TAM_ENCABEZADO + filas * palabras * 8:
+        raise ValueError("El archivo .vida está truncado.")
+    datos = np.memmap(ruta, dtype="<u8", mode="r", offset=TAM_ENCABEZADO, shape=(filas, palabras))
+    return datos, cols, regla
+
+def leer_binario(ruta: str) -> Tuple[np.ndarray, Optional[str]]:
+    datos, cols, regla = abrir_binario(ruta)
+    filas = datos.shape[0]
+    tablero = np.empty((filas, cols), dtype=np.uint8)
+    for ini in range(0, filas, FILAS_BLOQUE):
+        bloque = np.ascontiguousarray(datos[ini:ini + FILAS_BLOQUE]).view(np.uint8)
+        tablero[ini:ini + FILAS_BLOQUE] = np.unpackbits(bloque, axis=1, count=cols, bitorder="little")
+    del datos
+    return tablero, regla
+
+def cargar_motor_bits(ruta: str, regla=None, borde: str="muerto") -> MotorBits:
+    """MotorBits con el tablero de un .vida sin pasar por uint8 (sin `regla`: la del archivo)."""
+    datos, cols, regla_archivo = abrir_binario(ruta)
+    try:
+        return MotorBits.desde_palabras(datos, cols, regla or regla_archivo, borde)
+    finally:
+        del datos
+
+# ---------- por extensión ----------
+def cargar_patron(ruta: str) -> Tuple[np.ndarray, Optional[str]]:
+    """(tablero uint8, regla o None) según la extensión (.rle / .vida)."""
+    return leer_rle(ruta) if formato_patron(ruta) == "rle" else leer_binario(ruta)
+
+def guardar_patron(ruta: str, tablero: np.ndarray, regla: Optional[str]=None):
+    if formato_patron(ruta) == "rle":
+        escribir_rle(ruta, tablero, regla)
+    else:
+        escribir_binario(ruta, tablero, regla)
@@ -0,0 +1,155 @@
+"""
+Reglas tipo Vida (notación B/S) y bordes del tablero
+Una regla "B36/S23" dice con cuántos vecinos nace una célula muerta (B) y con
+cuántos sobrevive una viva (S). Se compila en una tabla de 18 entradas indexada
+por 9 * viva + vecinos, así los motores calculan el índice, hacen una sola
+búsqueda por celda y cualquier regla cuesta lo mismo que Conway. Para arreglos
+contiguos de ancho par se usa además una tabla de pares (65536 entradas de dos
+bytes) que resuelve dos celdas por búsqueda. Las reglas cortas (Conway,
+Seeds, HighLife...) se compilan también en `comparaciones`: corridas de
+vecinos [a, b] con su condición (siempre / viva / muerta), p. ej. Conway es
+"vecinos == 3, o vecinos == 2 y viva"; evaluarlas con comparaciones sobre el
+conteo de vecinos cuesta menos que la búsqueda en la tabla.
+Bordes: "muerto" (fuera del tablero todo está muerto), "toroidal" (los lados
+opuestos se tocan) y "reflejado" (el marco repite la fila / columna del borde).
+"""
+from typing import Optional, Union
+import re
+import numpy as np
+
+# nombre -> regla; el combo de la interfaz también acepta cualquier "B.../S..."
+REGLAS = {
+    "Conway": "B3/S23",
+    "HighLife": "B36/S23",
+    "Seeds": "B2/S",
+    "Day & Night": "B3678/S34678",
+    "Life without Death": "B3/S012345678",
+    "Maze": "B3/S12345",
+}
+BORDES = ("muerto", "toroidal", "reflejado")
+
+# operaciones por celda de `comparaciones` a partir de las cuales conviene la tabla
+MAX_OPERACIONES = 8
+
+_PATRON = re.compile(r"^\s*B([0-8]*)\s*/\s*S([0-8]*)\s*$", re.IGNORECASE)
+_PATRON_SB = re.compile(r"^\s*S([0-8]*)\s*/\s*B([0-8]*)\s*$", re.IGNORECASE)
+
+class Regla:
+    """Regla B/S compilada. `tabla[9 * viva + vecinos]` es el estado siguiente (0/1)."""
+    def __init__(self, texto: str="B3/S23"):
+        texto = REGLAS.get(texto, texto)
+        m = _PATRON.match(texto)
+        if m:
+            nacer, sobrevivir = m.group(1), m.group(2)
+        else:
+            m = _PATRON_SB.match(texto)
+            if not m:
+                raise ValueError(f"Regla inválida: {texto!r} (se espera p. ej. B3/S23)")
+            sobrevivir, nacer = m.group(1), m.group(2)
+        self.nacer = frozenset(int(d) for d in nacer)
+        self.sobrevivir = frozenset(int(d) for d in sobrevivir)
+        self.texto = ("B" + "".join(map(str, sorted(self.nacer))) + "/S"
+                      + "".join(map(str, sorted(self.sobrevivir))))
+        tabla = np.zeros(18, dtype=np.uint8)
+        tabla[sorted(self.nacer)] = 1
+        tabla[[9 + k for k in sorted(self.sobrevivir)]] = 1
+        tabla.flags.writeable = False
+        self.tabla = tabla
+        self._tabla_pares = None
+        self.comparaciones = _comparaciones(self.nacer, self.sobrevivir)
+
+    @property
+    def tabla_pares(self) -> np.ndarray:
+        """uint16 -> uint16: dos índices (bytes en el orden de la memoria) -> dos estados."""
+        if self._tabla_pares is None:
+            bytes_ = np.arange(1 << 16, dtype=np.uint16).view(np.uint8).reshape(-1, 2)
+            pares = self.tabla[np.minimum(bytes_, 17)]
+            self._tabla_pares = pares.view(np.uint16).ravel()
+            self._tabla_pares.flags.writeable = False
+        return self._tabla_pares
+
+    def aplicar(self, indice: np.ndarray, out: np.ndarray=None) -> np.ndarray:
+        """tabla[indice] para índices uint8 (< 18); `out` puede ser el mismo `indice`."""
+        if (indice.flags.c_contiguous and indice.shape[-1] % 2 == 0
+                and (out is None or out.flags.c_contiguous)):
+            if out is None:
+                out = np.empty_like(indice)
+            np.take(self.tabla_pares, indice.view(np.uint16), out=out.view(np.uint16), mode="clip")
+            return out
+        # mode="clip" evita el búfer intermedio de np.take (el índice siempre es < 18)
+        return np.take(self.tabla, indice, out=out, mode="clip")
+
+    @property
+    def b0(self) -> bool:
+        """Nace con 0 vecinos: el vacío no es estable (no sirve para el plano infinito)."""
+        return 0 in self.nacer
+
+    def siguiente(self, viva: bool, vecinos: int) -> bool:
+        return bool(self.tabla[9 * bool(viva) + vecinos])
+
+    def __eq__(self, otra):
+        return isinstance(otra, Regla) and self.texto == otra.texto
+
+    def __hash__(self):
+        return hash(self.texto)
+
+    def __repr__(self):
+        return f"Regla({self.texto!r})"
+
+def _corridas(digitos) -> list:
+    """[(a, b)] de dígitos consecutivos, p. ej. {1, 2, 4, 5} -> [(1, 2), (4, 5)]."""
+    corridas = []
+    for d in sorted(digitos):
+        if corridas and corridas[-1][1] == d - 1:
+            corridas[-1][1] = d
+        else:
+            corridas.append([d, d])
+    return [(a, b) for a, b in corridas]
+
+def _comparaciones(nacer: frozenset, sobrevivir: frozenset) -> Optional[list]:
+    """[(a, b, condición)] tal que la celda vive si para alguna corrida a <= vecinos <= b
+    y se cumple la condición; None si cuesta más de MAX_OPERACIONES operaciones por celda."""
+    comparaciones = [(a, b, condicion)
+                     for condicion, digitos in (("siempre", nacer & sobrevivir), ("viva", sobrevivir - nacer),
+                                                ("muerta", nacer - sobrevivir))
+                     for a, b in _corridas(digitos)]
+    # una comparación (dos si la corrida no toca 0 ni 8), la condición y el "o" con lo anterior
+    costo = sum((2 if 0 < a < b < 8 else 1) + (condicion != "siempre") + (k > 0)
+                for k, (a, b, condicion) in enumerate(comparaciones))
+    return comparaciones if costo <= MAX_OPERACIONES else None
+
+CONWAY = Regla("B3/S23")
+
+def como_regla(regla: Union[Regla, str, None]) -> Regla:
+    """Acepta una Regla, un texto B/S, un nombre de REGLAS o None (Conway)."""
+    if regla is None:
+        return CONWAY
+    return regla if isinstance(regla, Regla) else Regla(regla)
+
+def validar_borde(borde: str) -> str:
+    if borde not in BORDES:
+        raise ValueError(f"Borde no soportado: {borde} (opciones: {', '.join(BORDES)})")
+    return borde
+
+def rellenar_marco(marco: np.ndarray, borde: str, i0: int=1, i1: Optional[int]=None):
+    """Escribe el marco (halo de una celda) de `marco` según el borde.
+    Solo se tocan las columnas de halo de las filas i0..i1-1 y las filas de halo
+    cuya fila de origen está en ese rango; así, con franjas en varios procesos,
+    cada uno escribe solo lo que se calcula a partir de sus propias filas."""
+    if borde == "muerto":
+        return
+    f, c = marco.shape[0] - 2, marco.shape[1] - 2
+    if i1 is None:
+        i1 = f + 1
+    if borde == "toroidal":
+        izq, der, arriba, abajo = c, 1, f, 1
+    else:
+        izq, der, arriba, abajo = 1, c, 1, f
+    marco[i0:i1, 0] = marco[i0:i1, izq]
+    marco[i0:i1, c + 1] = marco[i0:i1, der]
+    # filas de halo con sus esquinas, copiadas de celdas interiores de la fila de origen
+    for destino, origen in ((0, arriba), (f + 1, abajo)):
+        if i0 <= origen < i1:
+            marco[destino, 1:c + 1] = marco[origen, 1:c + 1]
+            marco[destino, 0] = marco[origen, izq]
+            marco[destino, c + 1] = marco[origen, der]
@@ -0,0 +1,157 @@
+"""
+Simulación del Juego de la Vida en un hilo propio, separada del dibujo
+El hilo avanza el motor a su ritmo (con una pausa entre generaciones, o sin
+pausa en modo turbo) y cada `intervalo` segundos deja una copia del tablero en
+`instantanea`; la interfaz la dibuja a cuadros por segundo fijos y se salta
+las generaciones intermedias. Mientras corre, el hilo es el único que toca el
+motor: para modificarlo desde fuera se usa `with simulador.pausa(): ...`.
+Si `historia` (vida.historia.Historia) no es None, se registra cada estado
+publicado, con la misma copia: cada generación sin turbo y uno por cuadro
+(1/fps s) en turbo, así el historial crece a ritmo acotado y el tablero no se
+saca del motor dos veces (con Bits o Hashlife es desempaquetarlo entero).
+Retroceder en turbo salta por lo tanto de a varias generaciones.
+saltar(n) avanza n generaciones en el mismo hilo y se detiene solo (el salto
+se puede interrumpir con detener(); pausa() lo retoma donde quedó).
+En modo turbo las generaciones se avanzan por lotes de ~LOTE_SEGUNDOS para
+que el costo de Python por llamada no domine (Hashlife además aprovecha los
+saltos grandes).
+"""
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Optional
+import threading
+import time
+import numpy as np
+
+FPS = 30
+LOTE_SEGUNDOS = 0.01
+# ventana (s) para medir generaciones por segundo
+VENTANA_MEDIDA = 1.0
+
+class Simulador:
+    def __init__(self, motor, parar_si: Optional[Callable]=None, fps: int=FPS):
+        self.motor = motor
+        self.generacion = 0
+        # segundos entre generaciones (se ignora en turbo)
+        self.retardo = 0.2
+        self.turbo = False
+        # parar_si(motor) -> True detiene la simulación (se evalúa tras cada lote)
+        self.parar_si = parar_si
+        self.detenido_por_condicion = False
+        self.error: Optional[BaseException] = None
+        self.intervalo = 1.0 / fps
+        # (tablero uint8, generación, población) más reciente
+        self.instantanea = None
+        self.historia = None
+        # generaciones que faltan del salto en curso (None: corre hasta detener())
+        self.restantes: Optional[int] = None
+        self._detener = threading.Event()
+        self._hilo: Optional[threading.Thread] = None
+        self._medidas = deque()
+
+    @property
+    def corriendo(self) -> bool:
+        return self._hilo is not None and self._hilo.is_alive()
+
+    def iniciar(self):
+        if self.corriendo:
+            return
+        self.restantes = None
+        self._arrancar()
+
+    def saltar(self, n: int):
+        """Avanza n generaciones por lotes (como en turbo) sin evaluar parar_si y se detiene;
+        el estado final queda en `instantanea` y, si hay historia, se registra solo ese."""
+        if n < 0:
+            raise ValueError("N debe ser >= 0.")
+        if self.corriendo:
+            return
+        self.restantes = n
+        self._arrancar()
+
+    def _arrancar(self):
+        self.detenido_por_condicion = False
+        self.error = None
+        self._medidas.clear()
+        self._publicar()
+        self._detener.clear()
+        self._hilo = threading.Thread(target=self._bucle, name="vida-simulador", daemon=True)
+        self._hilo.start()
+
+    def detener(self):
+        """Detiene el hilo y espera a que termine el lote en curso."""
+        self._detener.set()
+        if self._hilo is not None and self._hilo is not threading.current_thread():
+            self._hilo.join()
+        self._hilo = None
+
+    @contextmanager
+    def pausa(self):
+        """Detiene el hilo mientras dura el bloque y lo reanuda si estaba corriendo."""
+        corria = self.corriendo
+        self.detener()
+        try:
+            yield self.motor
+        finally:
+            if corria:
+                self._arrancar()
+
+    def gen_por_segundo(self) -> float:
+        medidas = self._medidas
+        if len(medidas) < 2:
+            return 0.0
+        (t0, g0), (t1, g1) = medidas[0], medidas[-1]
+        return (g1 - g0) / (t1 - t0) if t1 > t0 else 0.0
+
+    def _publicar(self, registrar: bool=False):
+        motor = self.motor
+        tablero = np.array(motor.tablero, dtype=np.uint8)
+        self.instantanea = (tablero, self.generacion, motor.poblacion())
+        if registrar and self.historia is not None:
+            self.historia.registrar(tablero, self.generacion)
+
+    def _medir(self, ahora: float):
+        medidas = self._medidas
+        medidas.append((ahora, self.generacion))
+        while len(medidas) > 2 and ahora - medidas[0][0] > VENTANA_MEDIDA:
+            medidas.popleft()
+
+    def _bucle(self):
+        lote = 1
+        publicado = time.perf_counter()
+        self._medir(publicado)
+        try:
+            while not self._detener.is_set():
+                salto = self.restantes is not None
+                if salto and self.restantes == 0:
+                    self.restantes = None
+                    self._publicar(registrar=True)
+                    break
+                turbo = self.turbo or salto
+                n = min(lote, self.restantes) if salto else lote if turbo else 1
+                inicio = time.perf_counter()
+                self.motor.paso(n)
+                self.generacion += n
+                if salto:
+                    self.restantes -= n
+                ahora = time.perf_counter()
+                self._medir(ahora)
+                if turbo:
+                    # lote adaptativo: ~LOTE_SEGUNDOS por llamada
+                    dt = ahora - inicio
+                    lote = max(1, min(lote * 2, int(lote * LOTE_SEGUNDOS / dt))) if dt > 0 else lote * 2
+                parar = not salto and self.parar_si is not None and self.parar_si(self.motor)
+                if parar or ahora - publicado >= self.intervalo or not turbo:
+                    self._publicar(registrar=not salto)
+                    publicado = ahora
+                if parar:
+                    self.detenido_por_condicion = True
+                    break
+                if not turbo and self.retardo > 0:
+                    self._detener.wait(self.retardo)
+            # detenido desde fuera: publicar (y registrar) el estado en que quedó el motor
+            if self.instantanea[1] != self.generacion:
+                self._publicar(registrar=True)
+        except Exception as e:
+            # la interfaz lo muestra al ver que el hilo terminó
+            self.error = e